@@ -1,13 +1,19 @@
 """Supervisor-backed orchestration entrypoints."""
-from datetime import datetime
 from typing import Any, Dict, List, Optional
 
-from utils import logger
+from utils import logger, utc_timestamp
 
 from orchestrator import HybridSupervisor
+from tools.banking_tools import banking_tools_session
 
 supervisor = HybridSupervisor()
 
+_ERROR_RESPONSES: Dict[str, str] = {
+    "hi-IN": "मुझे खेद है, मुझे आपकी मदद करने में समस्या हो रही है। कृपया पुनः प्रयास करें।",
+    "en-IN": "I'm sorry, I'm having trouble helping you right now. Please try again.",
+}
+_DEFAULT_ERROR_RESPONSE = _ERROR_RESPONSES["en-IN"]
+
 
 async def process_message(
     message: str,
@@ -19,28 +25,25 @@ async def process_message(
     upi_mode: Optional[bool] = None,
 ) -> Dict[str, Any]:
     try:
-        return await supervisor.process(
-            message=message,
-            user_id=user_id,
-            session_id=session_id,
-            language=language,
-            user_context=user_context,
-            message_history=message_history,
-            upi_mode=upi_mode,
-        )
+        async with banking_tools_session():
+            return await supervisor.process(
+                message=message,
+                user_id=user_id,
+                session_id=session_id,
+                language=language,
+                user_context=user_context,
+                message_history=message_history,
+                upi_mode=upi_mode,
+            )
     except Exception as exc:  # pragma: no cover - defensive logging
-        logger.error("message_processing_error", error=str(exc), session_id=session_id)
-        error_response = (
-            "मुझे खेद है, मुझे आपकी मदद करने में समस्या हो रही है। कृपया पुनः प्रयास करें।"
-            if language == "hi-IN"
-            else "I'm sorry, I'm having trouble helping you right now. Please try again."
-        )
+        error = str(exc)
+        logger.error("message_processing_error", error=error, session_id=session_id)
         return {
             "success": False,
-            "response": error_response,
+            "response": _ERROR_RESPONSES.get(language, _DEFAULT_ERROR_RESPONSE),
             "language": language,
-            "error": str(exc),
-            "timestamp": datetime.now().isoformat(),
+            "error": error,
+            "timestamp": utc_timestamp(),
         }
 
 
@@ -5,6 +5,7 @@ Multi-agent orchestration for banking conversations
 from typing import TypedDict, Annotated, Sequence, List, Dict, Any
 from datetime import datetime
 import operator
+import re
 
 from langgraph.graph import StateGraph, END
 from langgraph.prebuilt import ToolNode
@@ -15,6 +16,19 @@ from .intent_classifier import classify_intent
 from .banking_agent import banking_agent
 from .router import route_to_agent
 from utils import logger, AgentExecutionError
+from tools import get_user_accounts, get_transaction_history
+from services import get_ollama_service
+
+
+# Keyword families for the keyword-based tool selection in banking_agent;
+# one alternation per family scans the message once instead of once per word
+_BALANCE_RE = re.compile(r"balance|बैलेंस")
+_SAVINGS_RE = re.compile(r"saving|बचत")
+_CURRENT_RE = re.compile(r"current|चालू|checking")
+_TRANSACTION_RE = re.compile(r"transaction|लेनदेन")
+
+# Rupee amounts with thousands separators, e.g. 12,345.60
+_FMT_INR = "{:,.2f}".format
 
 
 # State definition for conversation
@@ -99,17 +113,18 @@ For transfers, ALWAYS confirm amount and recipient before executing."""
         # In production, you'd use LangChain's AgentExecutor with ReAct
         
         last_user_message = state["messages"][-1].content
+        msg_lower = last_user_message.lower()
         
         # Determine which tool to call based on intent
         response_content = ""
         
         # Simple keyword-based tool selection (in production, use better intent detection)
-        if any(word in last_user_message.lower() for word in ["balance", "बैलेंस"]):
+        if _BALANCE_RE.search(msg_lower):
             # Detect account type from message
             account_type_requested = None
-            if any(word in last_user_message.lower() for word in ["savings", "बचत", "saving"]):
+            if _SAVINGS_RE.search(msg_lower):
                 account_type_requested = "savings"
-            elif any(word in last_user_message.lower() for word in ["current", "चालू", "checking"]):
+            elif _CURRENT_RE.search(msg_lower):
                 account_type_requested = "current"
             
             # Get user's accounts to find the right one
@@ -120,7 +135,6 @@ For transfers, ALWAYS confirm amount and recipient before executing."""
                 state["next_action"] = "end"
                 return state
             
-            from tools import get_user_accounts
             accounts_result = get_user_accounts.invoke({"user_id": user_id})
             
             if accounts_result["success"] and accounts_result["accounts"]:
@@ -135,11 +149,11 @@ For transfers, ALWAYS confirm amount and recipient before executing."""
                     if target_account:
                         # Return balance for specific account type
                         if language == "hi-IN":
-                            account_type_text = target_account["account_type"].replace("AccountType.", "")
-                            response_content = f"आपके {account_type_text} खाते का बैलेंस ₹{target_account['balance']:,.2f} है।"
+                            account_type_text = target_account["accountType"]
+                            response_content = f"आपके {account_type_text} खाते का बैलेंस ₹{_FMT_INR(target_account['balance'])} है।"
                         else:
-                            account_type_text = target_account["account_type"].replace("AccountType.", "")
-                            response_content = f"Your {account_type_text} account balance is ₹{target_account['balance']:,.2f}."
+                            account_type_text = target_account["accountType"]
+                            response_content = f"Your {account_type_text} account balance is ₹{_FMT_INR(target_account['balance'])}."
                     else:
                         # Account type requested but not found
                         if language == "hi-IN":
@@ -148,23 +162,17 @@ For transfers, ALWAYS confirm amount and recipient before executing."""
                             response_content = f"You don't have a {account_type_requested} account."
                 else:
                     # No specific type requested - show all accounts
-                    if language == "hi-IN":
-                        response_content = "आपके खातों का बैलेंस:\n\n"
-                        for acc in accounts_result["accounts"]:
-                            acc_type = acc["account_type"].replace("AccountType.", "")
-                            response_content += f"• {acc_type}: ₹{acc['balance']:,.2f}\n"
-                    else:
-                        response_content = "Your account balances:\n\n"
-                        for acc in accounts_result["accounts"]:
-                            acc_type = acc["account_type"].replace("AccountType.", "")
-                            response_content += f"• {acc_type}: ₹{acc['balance']:,.2f}\n"
+                    parts = ["आपके खातों का बैलेंस:\n\n" if language == "hi-IN" else "Your account balances:\n\n"]
+                    for acc in accounts_result["accounts"]:
+                        acc_type = acc["accountType"]
+                        parts.append(f"• {acc_type}: ₹{_FMT_INR(acc['balance'])}\n")
+                    response_content = "".join(parts)
             else:
                 response_content = "कोई खाता नहीं मिला।" if language == "hi-IN" else "No accounts found."
         
-        elif any(word in last_user_message.lower() for word in ["transaction", "लेनदेन", "transactions"]):
+        elif _TRANSACTION_RE.search(msg_lower):
             # Call transaction history tool
             if user_context.get("account_number"):
-                from tools import get_transaction_history
                 result = get_transaction_history.invoke({
                     "account_number": user_context["account_number"],
                     "days": 30,
@@ -173,12 +181,13 @@ For transfers, ALWAYS confirm amount and recipient before executing."""
                 
                 if result["success"] and result["transactions"]:
                     if language == "hi-IN":
-                        response_content = f"आपके पिछले {len(result['transactions'])} लेनदेन:\n\n"
+                        parts = [f"आपके पिछले {len(result['transactions'])} लेनदेन:\n\n"]
                     else:
-                        response_content = f"Your last {len(result['transactions'])} transactions:\n\n"
+                        parts = [f"Your last {len(result['transactions'])} transactions:\n\n"]
                     
                     for txn in result["transactions"]:
-                        response_content += f"• {txn['date']}: {txn['type']} ₹{txn['amount']:,.2f} - {txn['description']}\n"
+                        parts.append(f"• {txn['date']}: {txn['type']} ₹{_FMT_INR(txn['amount'])} - {txn['description']}\n")
+                    response_content = "".join(parts)
                 else:
                     response_content = "कोई लेनदेन नहीं मिला।" if language == "hi-IN" else "No transactions found."
             else:
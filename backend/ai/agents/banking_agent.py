@@ -2,9 +2,205 @@
 Banking Operations Agent
 Handles account balance, transactions, and transfers
 """
+import heapq
+import re
+from datetime import datetime, timedelta
+
+import orjson
 from langchain_core.messages import AIMessage, HumanMessage
+from services import get_llm_service
+from tools import call_tool, call_tool_many
 from utils import logger
 
+from .upi_agent import upi_agent
+
+# Keyword families for the keyword-based routing in banking_agent (matched as
+# substrings of the lowercased message)
+_REMINDER_KEYWORDS = (
+    "reminder", "reminders", "अनुस्मारक", "set reminder", "create reminder",
+    "view reminder", "show reminder", "remind me",
+)
+_STATEMENT_KEYWORDS = (
+    "statement", "स्टेटमेंट", "bank statement", "account statement",
+    "download", "डाउनलोड", "nikalna", "nikal", "export",
+    "statement download", "download statement", "bank statement nikalna",
+    "account statement download", "statement nikalna", "statement nikalo",
+)
+_BALANCE_KEYWORDS = ("balance", "बैलेंस")
+_TRANSACTION_KEYWORDS = ("transaction", "लेनदेन", "transactions")
+_TRANSFER_KEYWORDS = ("transfer", "send", "pay", "ट्रांसफर", "भेजें", "भुगतान")
+_UPI_KEYWORDS = ("upi", "यूपीआई", "यूपी", "yupi", "you pee", "you p i")
+
+
+def _keyword_re(keywords) -> "re.Pattern[str]":
+    """Compile keywords into one substring alternation (longest first)"""
+    return re.compile("|".join(map(re.escape, sorted(set(keywords), key=len, reverse=True))))
+
+
+# Checked in priority order: reminders > statements > balance > transactions > transfers
+_INTENT_PATTERNS = (
+    ("reminder", _keyword_re(_REMINDER_KEYWORDS)),
+    ("statement", _keyword_re(_STATEMENT_KEYWORDS)),
+    ("balance", _keyword_re(_BALANCE_KEYWORDS)),
+    ("transaction", _keyword_re(_TRANSACTION_KEYWORDS)),
+    ("transfer", _keyword_re(_TRANSFER_KEYWORDS)),
+)
+_UPI_RE = _keyword_re(_UPI_KEYWORDS)
+
+_SAVINGS_RE = _keyword_re(("savings", "बचत"))
+_CURRENT_RE = _keyword_re(("current", "चालू", "business"))
+_BALANCE_SAVINGS_RE = _keyword_re(("saving", "बचत"))
+_BALANCE_CURRENT_RE = _keyword_re(("current", "चालू", "checking"))
+
+# Statement period phrases -> (frontend preset id, days), checked in order
+_STATEMENT_PERIODS = (
+    (_keyword_re((
+        "7 days", "7 din", "पिछले 7 दिन", "last 7 days", "past 7 days",
+        "last 7 din", "la saat din", "la 7 din", "last seven days", "last seven din",
+        "seven days", "seven din", "7 दिन", "सात दिन", "7 day", "seven day",
+    )), "week", 7),
+    (_keyword_re(("30 days", "30 din", "पिछले 30 दिन", "last 30 days", "last month", "past month")), "month", 30),
+    (_keyword_re(("3 months", "3 महीने", "पिछले 3 महीने", "last 3 months", "quarter", "90 days")), "quarter", 90),
+    (_keyword_re(("6 months", "6 महीने", "पिछले 6 महीने", "last 6 months", "half year", "180 days")), "half_year", 180),
+    (_keyword_re(("12 months", "12 महीने", "पिछले 12 महीने", "last 12 months", "year", "साल", "365 days")), "year", 365),
+    (_keyword_re(("week", "सप्ताह")), "week", 7),
+    (_keyword_re(("month", "महीना")), "month", 30),
+)
+
+
+_DIGIT_WORDS = {
+    "zero": "0", "one": "1", "two": "2", "three": "3", "four": "4",
+    "five": "5", "six": "6", "seven": "7", "eight": "8", "nine": "9"
+}
+_DOUBLE_DIGIT_RE = re.compile(
+    rf"double\s+({'|'.join(_DIGIT_WORDS)}|\d)\b", re.IGNORECASE
+)
+
+
+def _double_digit(match: "re.Match[str]") -> str:
+    """Expand one _DOUBLE_DIGIT_RE match, e.g. "double four" becomes 44"""
+    spoken = match.group(1).lower()
+    digit = _DIGIT_WORDS.get(spoken, spoken)
+    return digit + digit
+
+# Account "last digits" phrasings, most specific first; the first pattern with
+# any match wins
+_ACCOUNT_DIGIT_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r"ending\s+with\s+(\d{2,4})",
+    r"last\s+(?:four\s+)?digits?\s+(\d{2,4})",
+    r"last\s+digit\s+(\d{1,4})",  # "last digit 44"
+    r"account\s+(?:ka\s+)?(?:ending\s+with\s+)?last\s+digit\s+(\d{1,4})",  # "account ka last digit 44"
+    r"account\s+(?:ending\s+with\s+)?(\d{2,4})",
+    r"(\d{2,4})\s*(?:digit|digits)",
+    r"jis\s+account\s+ka\s+last\s+digit\s+(\d{1,4})",  # Hindi: "jis account ka last digit 44"
+    r"\b(\d{2,4})\b",  # Any 2-4 digit number (but prefer longer matches)
+))
+_ANY_DIGIT_RE = re.compile(r"\d")
+
+# Phrases that mark an LLM reply as too generic to be useful
+_GENERIC_RESPONSE_RE = re.compile(
+    r"i'?m not sure|i don'?t know|i'?m not certain|i cannot"
+    r"|मुझे नहीं पता|मुझे यकीन नहीं|मैं नहीं जानती|मैं निश्चित नहीं",
+    re.IGNORECASE,
+)
+
+# System prompt for the general (no banking intent) reply, split around the
+# per-user name line so only that part is built per request
+_GENERAL_PROMPT_HI_PREFIX = """तुम Vaani हो, एक मददगार बैंकिंग असिस्टेंट जो Sun National Bank (भारतीय बैंक) के लिए काम करती है।
+
+CRITICAL: उपयोगकर्ता ने हिंदी भाषा चुनी है। तुम्हें केवल हिंदी (देवनागरी लिपि) में जवाब देना चाहिए, भले ही प्रश्न अंग्रेजी में पूछा गया हो। कभी भी अंग्रेजी या किसी अन्य भाषा में जवाब न दें।
+
+महत्वपूर्ण: सभी राशियों को भारतीय रुपये (₹) में दिखाओ।"""
+_GENERAL_PROMPT_HI_SUFFIX = """
+
+SAFETY & SCOPE:
+- तुम एक बैंकिंग असिस्टेंट हो। तुम कोडिंग, गणित, सामान्य ज्ञान, या राजनीति के बारे में प्रश्नों के जवाब नहीं देती हो।
+- यदि ऐसे प्रश्न पूछे जाएं, तो विनम्रता से मना करो और बैंकिंग सेवाओं के बारे में पूछने के लिए कहो।
+- वित्तीय सलाह न दो (जैसे "इस स्टॉक को खरीदो")। केवल बैंक योजनाओं के बारे में तथ्यात्मक जानकारी दो।
+- कभी भी संवेदनशील जानकारी जैसे Aadhaar, PAN, खाता संख्या, PIN, या CVV साझा न करो।
+
+यदि तुम्हें उपयोगकर्ता के प्रश्न को समझने में कठिनाई हो रही है या तुम सामान्य जवाब दे रहे हो, तो विनम्रता से उपयोगकर्ता से पूछो कि क्या वे अपना प्रश्न दोबारा बता सकते हैं या अधिक विशिष्ट बना सकते हैं।"""
+_GENERAL_PROMPT_EN_PREFIX = """You are Vaani, a helpful banking assistant for Sun National Bank (an Indian bank).
+
+CRITICAL: The user has selected English language. You MUST respond ONLY in English. NEVER respond in Hindi, Devanagari script, or any other language. Use only English words and characters.
+
+IMPORTANT: Always use Indian Rupees (₹ or INR) for all amounts. Never use dollars ($)."""
+_GENERAL_PROMPT_EN_SUFFIX = """
+
+SAFETY & SCOPE:
+- You are a Banking Assistant. You DO NOT answer questions about coding, math, general knowledge, or politics. If asked, politely decline and ask them to ask banking-related questions.
+- Do not provide financial advice (e.g., "buy this stock"). Only provide factual information about bank schemes.
+- Never share sensitive information like Aadhaar, PAN, account numbers, PINs, or CVV.
+
+If you are having difficulty understanding the user's question or are generating generic answers, politely ask the user to rephrase their question or be more specific."""
+
+# Greetings, thanks and goodbyes get a canned reply instead of an LLM call
+_SMALL_TALK = {
+    "hi": "greeting", "hello": "greeting", "hey": "greeting",
+    "namaste": "greeting", "नमस्ते": "greeting",
+    "thanks": "thanks", "thank you": "thanks", "धन्यवाद": "thanks",
+    "bye": "bye", "goodbye": "bye", "exit": "bye", "अलविदा": "bye",
+}
+_SMALL_TALK_STRIP = " .,!?।"
+_SMALL_TALK_REPLIES = {
+    "greeting": {
+        "hi-IN": "नमस्ते! मैं आपकी बैंकिंग में कैसे मदद कर सकती हूँ?",
+        "en-IN": "Hello! How can I help you with your banking today?",
+    },
+    "thanks": {
+        "hi-IN": "आपका स्वागत है! क्या मैं और कुछ मदद कर सकती हूँ?",
+        "en-IN": "You're welcome! Is there anything else I can help you with?",
+    },
+    "bye": {
+        "hi-IN": "धन्यवाद! आपका दिन शुभ हो।",
+        "en-IN": "Thank you for banking with us. Have a great day!",
+    },
+}
+
+# Balance replies are rendered locally; only questions asking for an
+# explanation are worth a round-trip to the LLM.
+_BALANCE_TEMPLATES = {
+    "hi-IN": "आपके {type} खाते का बैलेंस ₹{bal:,.2f} है।",
+    "en-IN": "Your {type} account balance is ₹{bal:,.2f}.",
+}
+_BALANCE_EXPLAIN_RE = re.compile(r"why|explain|how come|क्यों|समझा")
+
+# Short, structured outputs (JSON extraction, one-line balance summaries,
+# acknowledgements) go to the fast model; free-form replies keep the main one.
+_FAST_MODEL_TASKS = frozenset({"extract", "balance", "ack"})
+
+
+def _pick_model(task: str) -> bool:
+    """Return the ``use_fast_model`` flag for an LLM call of the given task kind"""
+    return task in _FAST_MODEL_TASKS
+
+
+def _detect_intent(msg_lower: str):
+    """Return the highest-priority banking intent mentioned in the message, or None"""
+    for intent, pattern in _INTENT_PATTERNS:
+        if pattern.search(msg_lower):
+            return intent
+    return None
+
+
+# Outermost {...} in an LLM reply, ignoring markdown fences or chatter around it
+_JSON_BLOCK_RE = re.compile(r"\{.*\}", re.DOTALL)
+
+
+def _parse_llm_json(text: str) -> dict:
+    """Decode the JSON object embedded in an LLM reply ({} if there is none)"""
+    match = _JSON_BLOCK_RE.search(text)
+    return orjson.loads(match.group(0)) if match else {}
+
+
+async def _get_accounts(state, user_id):
+    """get_user_accounts result, fetched at most once per user for this agent state"""
+    cache = state.setdefault("_accounts_cache", {})
+    result = cache.get(user_id)
+    if result is None:
+        result = cache[user_id] = await call_tool("get_user_accounts", user_id=user_id)
+    return result
+
 
 async def banking_agent(state):
     """
@@ -16,10 +212,7 @@ async def banking_agent(state):
     Returns:
         Updated state with AI response
     """
-    from services import get_llm_service
     
-    # Get unified LLM service
-    llm = get_llm_service()
     user_context = state.get("user_context", {})
     language = state.get("language", "en-IN")
     
@@ -38,47 +231,44 @@ async def banking_agent(state):
     # Priority order: reminders > statements > balance > transactions > transfers
     # This ensures statement requests are handled even if balance is also mentioned
     msg_lower = last_user_message.lower()
+    intent = _detect_intent(msg_lower)
+    small_talk = None
+    if intent is None:
+        small_talk = _SMALL_TALK.get(msg_lower.strip(_SMALL_TALK_STRIP))
     
-    reminder_keywords = ["reminder", "reminders", "अनुस्मारक", "set reminder", "create reminder", "view reminder", "show reminder", "remind me"]
-    statement_keywords = [
-        "statement", "स्टेटमेंट", "bank statement", "account statement",
-        "download", "डाउनलोड", "nikalna", "nikal", "export", 
-        "statement download", "download statement", "bank statement nikalna",
-        "account statement download", "statement nikalna", "statement nikalo"
-    ]
-
-    if any(keyword in msg_lower for keyword in reminder_keywords):
-        response_content = await handle_reminder_query(state, user_context, language)
+    if small_talk:
+        replies = _SMALL_TALK_REPLIES[small_talk]
+        response_content = replies.get(language, replies["en-IN"])
+    
+    elif intent == "reminder":
+        response_content = await handle_reminder_query(state, user_context, language, msg_lower)
 
-    elif any(keyword in msg_lower for keyword in statement_keywords):
-        response_content = await handle_statement_request(state, last_user_message, language)
+    elif intent == "statement":
+        response_content = await handle_statement_request(state, last_user_message, language, msg_lower)
     
-    elif any(word in msg_lower for word in ["balance", "बैलेंस"]):
-        response_content = await handle_balance_query(state, last_user_message, language)
+    elif intent == "balance":
+        response_content = await handle_balance_query(state, last_user_message, language, msg_lower)
     
-    elif any(word in msg_lower for word in ["transaction", "लेनदेन", "transactions"]):
+    elif intent == "transaction":
         response_content = await handle_transaction_query(state, user_context, language)
     
-    elif any(word in msg_lower for word in ["transfer", "send", "pay", "ट्रांसफर", "भेजें", "भुगतान"]):
+    elif intent == "transfer":
         # Check for UPI keywords (both English and Hindi)
-        upi_keywords = ["upi", "यूपीआई", "यूपी", "yupi", "you pee", "you p i"]
-        has_upi_keyword = any(keyword in msg_lower for keyword in upi_keywords)
+        has_upi_keyword = _UPI_RE.search(msg_lower) is not None
         
         # If UPI keyword detected, activate UPI mode and route to UPI agent
         if has_upi_keyword:
             state["upi_mode"] = True
-            from .upi_agent import upi_agent
             logger.info("upi_keyword_detected_in_banking_agent", 
                        message=last_user_message,
-                       upi_keywords_found=[kw for kw in upi_keywords if kw in msg_lower])
+                       upi_keywords_found=[kw for kw in _UPI_KEYWORDS if kw in msg_lower])
             return await upi_agent(state)
         
         # Check if UPI mode is active - redirect to UPI agent
         if state.get("upi_mode", False):
             # Route to UPI agent instead of handling as normal transfer
-            from .upi_agent import upi_agent
             return await upi_agent(state)
-        response_content = await handle_transfer_request(state, user_context, language, last_user_message)
+        response_content = await handle_transfer_request(state, user_context, language, last_user_message, msg_lower)
     
     else:
         # General response using LLM with language enforcement
@@ -87,50 +277,25 @@ async def banking_agent(state):
         user_name_context = f"\n\nIMPORTANT: The user's name is '{user_name}'. Always use this name when addressing the user." if user_name else ""
         
         if language == "hi-IN":
-            system_prompt = f"""तुम Vaani हो, एक मददगार बैंकिंग असिस्टेंट जो Sun National Bank (भारतीय बैंक) के लिए काम करती है।
-
-CRITICAL: उपयोगकर्ता ने हिंदी भाषा चुनी है। तुम्हें केवल हिंदी (देवनागरी लिपि) में जवाब देना चाहिए, भले ही प्रश्न अंग्रेजी में पूछा गया हो। कभी भी अंग्रेजी या किसी अन्य भाषा में जवाब न दें।
-
-महत्वपूर्ण: सभी राशियों को भारतीय रुपये (₹) में दिखाओ।{user_name_context}
-
-SAFETY & SCOPE:
-- तुम एक बैंकिंग असिस्टेंट हो। तुम कोडिंग, गणित, सामान्य ज्ञान, या राजनीति के बारे में प्रश्नों के जवाब नहीं देती हो।
-- यदि ऐसे प्रश्न पूछे जाएं, तो विनम्रता से मना करो और बैंकिंग सेवाओं के बारे में पूछने के लिए कहो।
-- वित्तीय सलाह न दो (जैसे "इस स्टॉक को खरीदो")। केवल बैंक योजनाओं के बारे में तथ्यात्मक जानकारी दो।
-- कभी भी संवेदनशील जानकारी जैसे Aadhaar, PAN, खाता संख्या, PIN, या CVV साझा न करो।
-
-यदि तुम्हें उपयोगकर्ता के प्रश्न को समझने में कठिनाई हो रही है या तुम सामान्य जवाब दे रहे हो, तो विनम्रता से उपयोगकर्ता से पूछो कि क्या वे अपना प्रश्न दोबारा बता सकते हैं या अधिक विशिष्ट बना सकते हैं।"""
+            system_prompt = _GENERAL_PROMPT_HI_PREFIX + user_name_context + _GENERAL_PROMPT_HI_SUFFIX
         else:
-            system_prompt = f"""You are Vaani, a helpful banking assistant for Sun National Bank (an Indian bank).
-
-CRITICAL: The user has selected English language. You MUST respond ONLY in English. NEVER respond in Hindi, Devanagari script, or any other language. Use only English words and characters.
-
-IMPORTANT: Always use Indian Rupees (₹ or INR) for all amounts. Never use dollars ($).{user_name_context}
-
-SAFETY & SCOPE:
-- You are a Banking Assistant. You DO NOT answer questions about coding, math, general knowledge, or politics. If asked, politely decline and ask them to ask banking-related questions.
-- Do not provide financial advice (e.g., "buy this stock"). Only provide factual information about bank schemes.
-- Never share sensitive information like Aadhaar, PAN, account numbers, PINs, or CVV.
-
-If you are having difficulty understanding the user's question or are generating generic answers, politely ask the user to rephrase their question or be more specific."""
+            system_prompt = _GENERAL_PROMPT_EN_PREFIX + user_name_context + _GENERAL_PROMPT_EN_SUFFIX
         
         # Convert LangChain messages to dict format for LLM service
         messages_dict = [{"role": "system", "content": system_prompt}]
-        for msg in messages:
-            if hasattr(msg, 'content'):
-                role = "user" if isinstance(msg, HumanMessage) else "assistant"
-                messages_dict.append({"role": role, "content": msg.content})
-        response_content = await llm.chat(messages_dict, use_fast_model=False)
+        messages_dict += [
+            {"role": "user" if isinstance(msg, HumanMessage) else "assistant", "content": msg.content}
+            for msg in messages
+            if hasattr(msg, "content")
+        ]
+        llm = get_llm_service()
+        response_content = await llm.chat(messages_dict, use_fast_model=_pick_model("general"))
         
         # Detect generic answers and ask for clarification
-        generic_indicators = [
-            "i'm not sure", "i don't know", "i'm not certain", "i cannot",
-            "मुझे नहीं पता", "मुझे यकीन नहीं", "मैं नहीं जानती", "मैं निश्चित नहीं"
-        ]
-        is_generic = any(indicator in response_content.lower() for indicator in generic_indicators)
+        is_generic = _GENERIC_RESPONSE_RE.search(response_content) is not None
         
         # Check if response is too generic (very short or doesn't contain specific information)
-        if is_generic or (len(response_content) < 50 and "loan" in msg_lower or "investment" in msg_lower):
+        if is_generic or (len(response_content) < 50 and ("loan" in msg_lower or "investment" in msg_lower)):
             if language == "hi-IN":
                 clarification = "\n\nकृपया अपना प्रश्न दोबारा बताएं या अधिक विशिष्ट बनाएं ताकि मैं आपकी बेहतर मदद कर सकूं।"
             else:
@@ -147,13 +312,15 @@ If you are having difficulty understanding the user's question or are generating
     return state
 
 
-async def handle_balance_query(state, last_user_message, language):
-    """Handle balance check queries"""
+async def handle_balance_query(state, last_user_message, language, msg_lower=None):
+    """Handle balance check queries (pass ``msg_lower`` if the message is already lowercased)"""
+    if msg_lower is None:
+        msg_lower = last_user_message.lower()
     # Detect account type from message
     account_type_requested = None
-    if any(word in last_user_message.lower() for word in ["savings", "बचत", "saving"]):
+    if _BALANCE_SAVINGS_RE.search(msg_lower):
         account_type_requested = "savings"
-    elif any(word in last_user_message.lower() for word in ["current", "चालू", "checking"]):
+    elif _BALANCE_CURRENT_RE.search(msg_lower):
         account_type_requested = "current"
     
     # Get user's accounts to find the right one
@@ -161,8 +328,7 @@ async def handle_balance_query(state, last_user_message, language):
     if not user_id:
         return "कृपया लॉगिन करें।" if language == "hi-IN" else "Please login first."
     
-    from tools import get_user_accounts
-    accounts_result = get_user_accounts.invoke({"user_id": user_id})
+    accounts_result = await _get_accounts(state, user_id)
     
     if not accounts_result["success"] or not accounts_result["accounts"]:
         return "कोई खाता नहीं मिला।" if language == "hi-IN" else "No accounts found."
@@ -189,7 +355,7 @@ async def handle_balance_query(state, last_user_message, language):
     # Format account info for LLM
     accounts_info = []
     for acc in account_data:
-        acc_type = acc["account_type"].replace("AccountType.", "")
+        acc_type = acc["accountType"]
         accounts_info.append({
             "type": acc_type,
             "balance": acc["balance"],
@@ -202,10 +368,21 @@ async def handle_balance_query(state, last_user_message, language):
         "accounts": account_data
     }
     
-    # Use LLM to generate natural response
-    from services import get_llm_service
+    if not _BALANCE_EXPLAIN_RE.search(msg_lower):
+        template = _BALANCE_TEMPLATES.get(language, _BALANCE_TEMPLATES["en-IN"])
+        return "\n".join(
+            template.format(type=info["type"], bal=info["balance"])
+            for info in accounts_info
+        )
+    
+    # Use LLM to explain the balance when the user asks for more than the figures
     llm = get_llm_service()
     
+    # Plain-text account summary; a dict repr wastes prompt tokens
+    accounts_text = "; ".join(
+        f"{info['type']}: {info['currency']} {info['balance']:,.2f}" for info in accounts_info
+    )
+    
     # Build prompt for LLM
     if language == "hi-IN":
         system_prompt = """तुम Vaani हो, एक मददगार बैंकिंग असिस्टेंट जो Sun National Bank (भारतीय बैंक) के लिए काम करती है। 
@@ -213,21 +390,21 @@ async def handle_balance_query(state, last_user_message, language):
 नीचे दी गई जानकारी का उपयोग करके एक संक्षिप्त, मैत्रीपूर्ण और स्पष्ट उत्तर दो।
 केवल बैलेंस की जानकारी दो, अनावश्यक विवरण न जोड़ें।
 महत्वपूर्ण: सभी राशियों को भारतीय रुपये (₹) में दिखाओ।"""
-        user_prompt = f"खाता जानकारी: {accounts_info}\n\nउपयोगकर्ता का प्रश्न: {last_user_message}"
+        user_prompt = f"खाता जानकारी: {accounts_text}\n\nउपयोगकर्ता का प्रश्न: {last_user_message}"
     else:
         system_prompt = """You are Vaani, a helpful banking assistant for Sun National Bank (an Indian bank).
 The user asked about their account balance.
 Use the information below to provide a brief, friendly, and clear response.
 Only provide the balance information, don't add unnecessary details.
 IMPORTANT: Always use Indian Rupees (₹ or INR) for all amounts. Never use dollars ($)."""
-        user_prompt = f"Account information: {accounts_info}\n\nUser's question: {last_user_message}"
+        user_prompt = f"Account information: {accounts_text}\n\nUser's question: {last_user_message}"
     
     messages = [
         {"role": "system", "content": system_prompt},
         {"role": "user", "content": user_prompt}
     ]
     
-    response = await llm.chat(messages, use_fast_model=False)
+    response = await llm.chat(messages, use_fast_model=_pick_model("balance"))
     return response
 
 
@@ -237,10 +414,8 @@ async def handle_transaction_query(state, user_context, language):
     if not user_id:
         return "कृपया लॉगिन करें।" if language == "hi-IN" else "Please login first."
     
-    from tools import get_user_accounts, get_transaction_history
-    
     # Get all user accounts
-    accounts_result = get_user_accounts.invoke({"user_id": user_id})
+    accounts_result = await _get_accounts(state, user_id)
     
     if not accounts_result["success"] or not accounts_result["accounts"]:
         return "कोई खाता नहीं मिला।" if language == "hi-IN" else "No accounts found."
@@ -250,14 +425,18 @@ async def handle_transaction_query(state, user_context, language):
     accounts_data = []
     per_account_transactions = {}
     
-    for account in accounts_result["accounts"]:
+    # Accounts are independent, so fetch their histories concurrently
+    accounts = accounts_result["accounts"]
+    results = await call_tool_many(
+        "get_transaction_history",
+        [
+            {"account_number": account["account_number"], "days": 30, "limit": 5}  # Top 5 per account
+            for account in accounts
+        ],
+    )
+    
+    for account, result in zip(accounts, results):
         account_number = account["account_number"]
-        result = get_transaction_history.invoke({
-            "account_number": account_number,
-            "days": 30,
-            "limit": 5  # Top 5 per account
-        })
-        
         transactions = []
         if result["success"] and result["transactions"]:
             transactions = result["transactions"]
@@ -277,11 +456,8 @@ async def handle_transaction_query(state, user_context, language):
     if not all_transactions:
         return "कोई लेनदेन नहीं मिला।" if language == "hi-IN" else "No transactions found."
     
-    # Sort all transactions by date (most recent first)
-    all_transactions.sort(key=lambda x: x.get("date", ""), reverse=True)
-    
-    # Take top 5 across all accounts
-    top_transactions = all_transactions[:5]
+    # Top 5 across all accounts, most recent first
+    top_transactions = heapq.nlargest(5, all_transactions, key=lambda x: x.get("date", ""))
     
     # Store structured data for UI with account information
     state["structured_data"] = {
@@ -292,47 +468,25 @@ async def handle_transaction_query(state, user_context, language):
         "accountTransactions": per_account_transactions
     }
     
-    # Prepare transaction data for LLM
-    transactions_info = []
-    for txn in top_transactions:
-        transactions_info.append({
-            "date": txn["date"],
-            "type": txn["type"],
-            "amount": txn["amount"],
-            "description": txn["description"],
-            "counterparty": txn.get("counterparty", ""),
-            "account": txn.get("account_number", "")
-        })
-    
-    # Since we have structured data, return minimal/empty text
-    # The UI will display the structured table
-    # Only return a very brief acknowledgment if needed
-    if language == "hi-IN":
-        return ""  # Empty - let the table speak for itself
-    else:
-        return ""  # Empty - let the table speak for itself
+    # The UI renders the structured table, so no text reply is needed
+    return ""
 
 
-async def handle_statement_request(state, last_user_message, language):
-    """Handle account statement download requests"""
-    from services import get_llm_service
-    from tools import download_statement, get_user_accounts
-    from datetime import datetime, timedelta
-    import re
-    
-    llm = get_llm_service()
+async def handle_statement_request(state, last_user_message, language, msg_lower=None):
+    """Handle account statement download requests (pass ``msg_lower`` if already lowercased)"""
     user_id = state.get("user_id")
     
     if not user_id:
         return "कृपया लॉगिन करें।" if language == "hi-IN" else "Please login first."
     
     # Get user's accounts
-    accounts_result = get_user_accounts.invoke({"user_id": user_id})
+    accounts_result = await _get_accounts(state, user_id)
     
     if not accounts_result["success"] or not accounts_result["accounts"]:
         return "कोई खाता नहीं मिला।" if language == "hi-IN" else "No accounts found."
     
-    msg_lower = last_user_message.lower()
+    if msg_lower is None:
+        msg_lower = last_user_message.lower()
     
     # Determine account selection
     selected_account = None
@@ -346,39 +500,18 @@ async def handle_statement_request(state, last_user_message, language):
     # - "44" as standalone number
     
     # Convert "double four", "double 4", etc. to "44"
-    digit_word_map = {
-        "zero": "0", "one": "1", "two": "2", "three": "3", "four": "4",
-        "five": "5", "six": "6", "seven": "7", "eight": "8", "nine": "9"
-    }
-    msg_for_digit_extraction = msg_lower
-    for word, digit in digit_word_map.items():
-        # Replace "double four" with "44", "double 4" with "44", etc.
-        msg_for_digit_extraction = re.sub(
-            rf"double\s+{word}\b|double\s+{digit}\b",
-            digit + digit,
-            msg_for_digit_extraction,
-            flags=re.IGNORECASE
-        )
-    
-    account_digit_patterns = [
-        r"ending\s+with\s+(\d{2,4})",
-        r"last\s+(?:four\s+)?digits?\s+(\d{2,4})",
-        r"last\s+digit\s+(\d{1,4})",  # "last digit 44"
-        r"account\s+(?:ka\s+)?(?:ending\s+with\s+)?last\s+digit\s+(\d{1,4})",  # "account ka last digit 44"
-        r"account\s+(?:ending\s+with\s+)?(\d{2,4})",
-        r"(\d{2,4})\s*(?:digit|digits)",
-        r"jis\s+account\s+ka\s+last\s+digit\s+(\d{1,4})",  # Hindi: "jis account ka last digit 44"
-        r"\b(\d{2,4})\b",  # Any 2-4 digit number (but prefer longer matches)
-    ]
+    msg_for_digit_extraction = _DOUBLE_DIGIT_RE.sub(_double_digit, msg_lower)
     
     account_digits = None
-    for pattern in account_digit_patterns:
-        matches = re.findall(pattern, msg_for_digit_extraction, re.IGNORECASE)
-        if matches:
-            # Prefer longer matches (4 digits > 3 > 2)
-            account_digits = max(matches, key=len)
-            logger.info("account_digits_extracted", pattern=pattern, digits=account_digits, original_message=last_user_message)
-            break
+    # Every pattern needs a digit, so messages without one skip the scans
+    if _ANY_DIGIT_RE.search(msg_for_digit_extraction):
+        for pattern in _ACCOUNT_DIGIT_PATTERNS:
+            matches = pattern.findall(msg_for_digit_extraction)
+            if matches:
+                # Prefer longer matches (4 digits > 3 > 2)
+                account_digits = max(matches, key=len)
+                logger.info("account_digits_extracted", pattern=pattern.pattern, digits=account_digits, original_message=last_user_message)
+                break
     
     if account_digits:
         logger.info("account_digits_detected", digits=account_digits)
@@ -407,14 +540,14 @@ async def handle_statement_request(state, last_user_message, language):
     
     # If still not matched, try by account type
     if not account_specified:
-        if any(word in msg_lower for word in ["savings", "बचत"]):
+        if _SAVINGS_RE.search(msg_lower):
             for acc in accounts_result["accounts"]:
                 account_type = acc.get("accountType") or acc.get("account_type") or ""
                 if "savings" in str(account_type).lower():
                     selected_account = acc
                     account_specified = True
                     break
-        elif any(word in msg_lower for word in ["current", "चालू", "business"]):
+        elif _CURRENT_RE.search(msg_lower):
             for acc in accounts_result["accounts"]:
                 account_type = acc.get("accountType") or acc.get("account_type") or ""
                 if "current" in str(account_type).lower():
@@ -434,42 +567,14 @@ async def handle_statement_request(state, last_user_message, language):
     from_date = to_date - timedelta(days=30)  # Default
     period_specified = False
     
-    # Check for "7 days" or "last 7 days" or Hindi equivalents
     # Handle: "last 7 din", "last 7 days", "पिछले 7 दिन", "la saat din" (Hindi transliteration)
-    seven_days_phrases = [
-        "7 days", "7 din", "पिछले 7 दिन", "last 7 days", "past 7 days",
-        "last 7 din", "la saat din", "la 7 din", "last seven days", "last seven din",
-        "seven days", "seven din", "7 दिन", "सात दिन", "7 day", "seven day"
-    ]
-    if any(phrase in msg_lower for phrase in seven_days_phrases):
-        period_type = "week"
-        from_date = to_date - timedelta(days=7)
-        period_specified = True
-        logger.info("period_detected", period="7 days", period_type=period_type)
-    elif any(phrase in msg_lower for phrase in ["30 days", "30 din", "पिछले 30 दिन", "last 30 days", "last month", "past month"]):
-        period_type = "month"
-        from_date = to_date - timedelta(days=30)
-        period_specified = True
-    elif any(phrase in msg_lower for phrase in ["3 months", "3 महीने", "पिछले 3 महीने", "last 3 months", "quarter", "90 days"]):
-        period_type = "quarter"
-        from_date = to_date - timedelta(days=90)
-        period_specified = True
-    elif any(phrase in msg_lower for phrase in ["6 months", "6 महीने", "पिछले 6 महीने", "last 6 months", "half year", "180 days"]):
-        period_type = "half_year"
-        from_date = to_date - timedelta(days=180)
-        period_specified = True
-    elif any(phrase in msg_lower for phrase in ["12 months", "12 महीने", "पिछले 12 महीने", "last 12 months", "year", "साल", "365 days"]):
-        period_type = "year"
-        from_date = to_date - timedelta(days=365)
-        period_specified = True
-    elif any(word in msg_lower for word in ["week", "सप्ताह"]):
-        period_type = "week"
-        from_date = to_date - timedelta(days=7)
-        period_specified = True
-    elif any(word in msg_lower for word in ["month", "महीना"]):
-        period_type = "month"
-        from_date = to_date - timedelta(days=30)
-        period_specified = True
+    for pattern, preset, days in _STATEMENT_PERIODS:
+        if pattern.search(msg_lower):
+            period_type = preset
+            from_date = to_date - timedelta(days=days)
+            period_specified = True
+            logger.info("period_detected", period=f"{days} days", period_type=period_type)
+            break
     
     # Detect explicit YYYY-MM-DD dates
     date_matches = re.findall(r"\d{4}-\d{2}-\d{2}", msg_lower)
@@ -516,22 +621,17 @@ async def handle_statement_request(state, last_user_message, language):
     return "Please let me know which account and time period you need the statement for."
 
 
-async def handle_reminder_query(state, user_context, language):
+async def handle_reminder_query(state, user_context, language, msg_lower=None):
     """Handle reminder queries by surfacing reminder manager UI with extracted details"""
     user_id = state.get("user_id")
     if not user_id:
         return "कृपया लॉगिन करें।" if language == "hi-IN" else "Please login first."
 
-    from tools import get_user_accounts
-    from services import get_llm_service
-    from datetime import datetime, timedelta
-    import re
-
-    accounts_result = get_user_accounts.invoke({"user_id": user_id})
+    accounts_result = await _get_accounts(state, user_id)
     accounts = accounts_result["accounts"] if accounts_result.get("success") else []
 
     last_message = state["messages"][-1].content
-    last_message_lower = last_message.lower()
+    last_message_lower = msg_lower if msg_lower is not None else last_message.lower()
     view_keywords = ["view", "show", "list", "see", "display"]
     create_keywords = ["set", "create", "add", "schedule", "remind"]
 
@@ -566,19 +666,8 @@ Return ONLY valid JSON, no other text. Example:
 """
         
         try:
-            extraction_response = await llm.chat([{"role": "user", "content": extraction_prompt}], use_fast_model=True)
-            # Clean the response - remove markdown code blocks if present
-            extraction_response = extraction_response.strip()
-            if extraction_response.startswith("```json"):
-                extraction_response = extraction_response[7:]
-            if extraction_response.startswith("```"):
-                extraction_response = extraction_response[3:]
-            if extraction_response.endswith("```"):
-                extraction_response = extraction_response[:-3]
-            extraction_response = extraction_response.strip()
-            
-            import json
-            extracted_data = json.loads(extraction_response)
+            extraction_response = await llm.chat([{"role": "user", "content": extraction_prompt}], use_fast_model=_pick_model("extract"))
+            extracted_data = _parse_llm_json(extraction_response)
         except Exception as e:
             logger.warning("reminder_extraction_failed", error=str(e), message=last_message)
             extracted_data = {}
@@ -594,43 +683,16 @@ Return ONLY valid JSON, no other text. Example:
         if extracted_data.get("date_time"):
             try:
                 date_time_str = extracted_data["date_time"].strip()
-                parsed_dt = None
+                if date_time_str.endswith("Z"):
+                    date_time_str = date_time_str[:-1] + "+00:00"
+                # fromisoformat accepts "T" or space separators, optional seconds and offsets
+                parsed_dt = datetime.fromisoformat(date_time_str)
+                if parsed_dt.tzinfo:
+                    # Convert to local naive time
+                    parsed_dt = parsed_dt.astimezone().replace(tzinfo=None)
                 
-                # Handle different ISO formats
-                if "T" in date_time_str:
-                    # ISO format: YYYY-MM-DDTHH:MM or YYYY-MM-DDTHH:MM:SS
-                    if date_time_str.endswith("Z"):
-                        # UTC timezone - convert to local naive datetime
-                        from datetime import timezone
-                        parsed_dt = datetime.fromisoformat(date_time_str.replace("Z", "+00:00"))
-                        # Convert UTC to local time (naive)
-                        parsed_dt = parsed_dt.astimezone().replace(tzinfo=None)
-                    elif "+" in date_time_str or date_time_str.count("-") > 2:
-                        # Has timezone offset
-                        parsed_dt = datetime.fromisoformat(date_time_str)
-                        if parsed_dt.tzinfo:
-                            parsed_dt = parsed_dt.astimezone().replace(tzinfo=None)
-                    else:
-                        # No timezone - assume local time
-                        # Remove seconds/microseconds if present
-                        if "." in date_time_str:
-                            date_time_str = date_time_str.split(".")[0]
-                        if len(date_time_str.split("T")[1].split(":")) > 2:
-                            # Has seconds, remove them
-                            parts = date_time_str.split("T")
-                            time_part = ":".join(parts[1].split(":")[:2])
-                            date_time_str = f"{parts[0]}T{time_part}"
-                        parsed_dt = datetime.fromisoformat(date_time_str)
-                else:
-                    # Try other formats like "YYYY-MM-DD HH:MM"
-                    try:
-                        parsed_dt = datetime.strptime(date_time_str, "%Y-%m-%d %H:%M")
-                    except ValueError:
-                        parsed_dt = datetime.strptime(date_time_str, "%Y-%m-%d %H:%M:%S")
-                
-                if parsed_dt:
-                    # Format for datetime-local input (YYYY-MM-DDTHH:MM)
-                    prefilled_data["remindAt"] = parsed_dt.strftime("%Y-%m-%dT%H:%M")
+                # Format for datetime-local input (YYYY-MM-DDTHH:MM)
+                prefilled_data["remindAt"] = parsed_dt.strftime("%Y-%m-%dT%H:%M")
             except Exception as e:
                 logger.warning("date_parsing_failed", error=str(e), date_time=extracted_data.get("date_time"))
         
@@ -687,18 +749,14 @@ Return ONLY valid JSON, no other text. Example:
             return "Here's the reminder panel to create or review reminders."
 
 
-async def handle_transfer_request(state, user_context, language, last_user_message):
+async def handle_transfer_request(state, user_context, language, last_user_message, msg_lower=None):
     """Handle transfer/payment requests - returns minimal response, UI handles the rest"""
     user_id = state.get("user_id")
     if not user_id:
         return "कृपया लॉगिन करें।" if language == "hi-IN" else "Please login first."
     
-    from tools import get_user_accounts
-    from services import get_llm_service
-    import re
-    
     # Get user's accounts to match source account
-    accounts_result = get_user_accounts.invoke({"user_id": user_id})
+    accounts_result = await _get_accounts(state, user_id)
     accounts = accounts_result["accounts"] if accounts_result.get("success") else []
     
     # Extract transfer details from message using LLM
@@ -724,15 +782,9 @@ Return ONLY valid JSON, nothing else."""
     try:
         extracted_json = await llm.chat(
             [{"role": "user", "content": extraction_prompt}],
-            use_fast_model=True
+            use_fast_model=_pick_model("extract")
         )
-        
-        import json
-        json_match = re.search(r'\{[^{}]*\}', extracted_json, re.DOTALL)
-        if json_match:
-            transfer_details = json.loads(json_match.group())
-        else:
-            transfer_details = {}
+        transfer_details = _parse_llm_json(extracted_json)
     except Exception as e:
         logger.warning("transfer_extraction_failed", error=str(e), message=last_user_message)
         transfer_details = {}
@@ -740,7 +792,8 @@ Return ONLY valid JSON, nothing else."""
     # Match source account by last digits if mentioned
     source_account_id = None
     source_account_number = None
-    msg_lower = last_user_message.lower()
+    if msg_lower is None:
+        msg_lower = last_user_message.lower()
     
     # Handle "double four" -> "44" conversion (similar to statement handler)
     digit_word_map = {
@@ -10,11 +10,22 @@ SIMPLE LOGIC:
   * Balance check → Banking agent (normal balance check)
   * Transfer → Banking agent (normal transfer, unless explicitly mentions UPI)
 """
+from collections import OrderedDict
 from langchain_core.messages import AIMessage
 from utils import logger, log_agent_decision
 import re
 
 
+# LRU of LLM classifications keyed by (language, normalized message). Only the
+# LLM fallback is cached; keyword rules above it depend on UPI mode/pending state.
+_INTENT_CACHE_MAX_SIZE = 4096
+_intent_cache: "OrderedDict[tuple, str]" = OrderedDict()
+
+
+def _normalize_for_cache(message: str) -> str:
+    return " ".join(message.lower().split()).rstrip(" ?!.।")
+
+
 async def classify_intent(state):
     """
     Classify user intent to route to appropriate agent
@@ -295,14 +306,25 @@ User message: "{last_message}"
 
 Reply with ONLY the intent category name, nothing else."""
     
-    # Use fast model for quick classification
-    intent = await llm.chat([{"role": "user", "content": intent_prompt}], use_fast_model=True)
-    intent = intent.strip().lower()
-    
-    # Validate intent
-    valid_intents = ["language_change", "upi_payment", "banking_operation", "general_faq", "greeting", "feedback", "other"]
-    if intent not in valid_intents:
-        intent = "other"
+    cache_key = (language, _normalize_for_cache(last_message))
+    cached_intent = _intent_cache.get(cache_key)
+    if cached_intent is not None:
+        _intent_cache.move_to_end(cache_key)
+        intent = cached_intent
+        logger.info("intent_cache_hit", intent=intent, user_message=last_message[:100])
+    else:
+        # Use fast model for quick classification
+        intent = await llm.chat([{"role": "user", "content": intent_prompt}], use_fast_model=True)
+        intent = intent.strip().lower()
+        
+        # Validate intent
+        valid_intents = ["language_change", "upi_payment", "banking_operation", "general_faq", "greeting", "feedback", "other"]
+        if intent not in valid_intents:
+            intent = "other"
+        
+        _intent_cache[cache_key] = intent
+        if len(_intent_cache) > _INTENT_CACHE_MAX_SIZE:
+            _intent_cache.popitem(last=False)
     
     # Final keyword-based fallback (reminder keywords already checked above)
     statement_keywords = [
@@ -1 +1,32 @@
 """Specialized RAG agents orchestrated by the main rag_agent supervisor."""
+from __future__ import annotations
+
+from typing import Optional
+
+
+def build_user_prompt_suffix(user_name: Optional[str] = None, language: str = "en-IN") -> str:
+    """Per-request user name and response-language instructions for a system prompt."""
+    user_name_context = f"\n\nIMPORTANT: The user's name is '{user_name}'. Always use this name when addressing the user. NEVER use generic terms or regional language terms." if user_name else ""
+    language_instruction = ""
+    if language == "hi-IN":
+        language_instruction = "\n\nCRITICAL: The user has selected Hindi language. You MUST respond ONLY in Hindi (Devanagari script), regardless of the language the question is asked in. Even if the user asks in English, you MUST respond in Hindi. NEVER respond in English or any other language."
+    elif language == "en-IN":
+        language_instruction = "\n\nCRITICAL: The user has selected English language. You MUST respond ONLY in English. NEVER respond in Hindi, Devanagari script, or any other language. Use only English words and characters."
+    return f"{user_name_context}{language_instruction}"
+
+
+def build_rag_context_prompt(
+    prefix: str,
+    topic: str,
+    rag_context: str,
+    user_name: Optional[str] = None,
+    language: str = "en-IN",
+) -> str:
+    """Assemble a RAG system prompt from an agent's static prefix and the retrieved context."""
+    # Static instructions first so the prompt prefix is byte-identical across
+    # requests and Ollama can reuse its KV cache; per-request parts go last
+    return (
+        f"{prefix}\n\nThe user has asked a question about banking products/{topic}. "
+        f"Below is relevant information from our official product documentation:\n\n"
+        f"{rag_context}{build_user_prompt_suffix(user_name, language)}"
+    )
@@ -7,6 +7,8 @@ from typing import Any, Dict, Optional
 from langchain_core.messages import AIMessage
 from utils import logger
 
+from . import build_rag_context_prompt, build_user_prompt_suffix
+
 
 def _clean_english_text(text: str) -> str:
     """Remove Hindi Devanagari characters and convert Hindi numerals/words to English."""
@@ -1495,30 +1497,18 @@ def _build_loan_response_text(loan_info: Dict[str, Any], language: str) -> str:
     return _clean_english_text(response_text)
 
 
-def _build_rag_system_prompt(rag_context: str, user_name: Optional[str] = None, language: str = "en-IN") -> str:
-    if rag_context:
-        user_name_context = f"\n\nIMPORTANT: The user's name is '{user_name}'. Always use this name when addressing the user. NEVER use generic terms or regional language terms." if user_name else ""
-        language_instruction = ""
-        if language == "hi-IN":
-            language_instruction = "\n\nCRITICAL: The user has selected Hindi language. You MUST respond ONLY in Hindi (Devanagari script), regardless of the language the question is asked in. Even if the user asks in English, you MUST respond in Hindi. NEVER respond in English or any other language."
-        elif language == "en-IN":
-            language_instruction = "\n\nCRITICAL: The user has selected English language. You MUST respond ONLY in English. NEVER respond in Hindi, Devanagari script, or any other language. Use only English words and characters."
-        return f"""You are Vaani, a helpful AI assistant for Sun National Bank (an Indian bank).
-
-The user has asked a question about banking products/loans. Below is relevant information from our official product documentation:
-
-{rag_context}{user_name_context}{language_instruction}
+_RAG_SYSTEM_PROMPT_PREFIX = """You are Vaani, a helpful AI assistant for Sun National Bank (an Indian bank).
 
 SAFETY & SCOPE:
 - You are a Banking Assistant. You DO NOT answer questions about coding, math, general knowledge, or politics. If asked, politely decline and ask them to ask banking-related questions.
 - Do not provide financial advice (e.g., "buy this stock"). Only provide factual information about bank schemes.
 - Never share sensitive information like Aadhaar, PAN, account numbers, PINs, or CVV.
 
-Based on the above information, provide a clear, accurate, and helpful answer to the user's question.
+Based on the documentation provided at the end of these instructions, provide a clear, accurate, and helpful answer to the user's question.
 
 IMPORTANT GUIDELINES:
 - Always use Indian Rupees (₹ or INR) for all monetary amounts
-- Base your answer ONLY on the provided documentation above
+- Base your answer ONLY on the provided documentation
 - If the documentation doesn't contain the information, say "I don't have information on that specific product" - DO NOT make up or guess answers
 - Be concise but comprehensive
 - Use bullet points for lists of features, requirements, or steps
@@ -1543,15 +1533,15 @@ HINDI LANGUAGE GUIDELINES (when responding in Hindi):
 
 Keep your response helpful and professional."""
 
-    user_name_context = f"\n\nIMPORTANT: The user's name is '{user_name}'. Always use this name when addressing the user. NEVER use generic terms or regional language terms." if user_name else ""
-    language_instruction = ""
-    if language == "hi-IN":
-        language_instruction = "\n\nCRITICAL: The user has selected Hindi language. You MUST respond ONLY in Hindi (Devanagari script), regardless of the language the question is asked in. Even if the user asks in English, you MUST respond in Hindi. NEVER respond in English or any other language."
-    elif language == "en-IN":
-        language_instruction = "\n\nCRITICAL: The user has selected English language. You MUST respond ONLY in English. NEVER respond in Hindi, Devanagari script, or any other language. Use only English words and characters."
+
+def _build_rag_system_prompt(rag_context: str, user_name: Optional[str] = None, language: str = "en-IN") -> str:
+    if rag_context:
+        return build_rag_context_prompt(_RAG_SYSTEM_PROMPT_PREFIX, "loans", rag_context, user_name, language)
+
+    prompt_suffix = build_user_prompt_suffix(user_name, language)
     return f"""You are Vaani, a friendly and helpful AI assistant for Sun National Bank, an Indian bank.
 
-IMPORTANT: Always use Indian Rupee (₹ or INR) for all monetary amounts. Never use dollars ($) or other currencies.{user_name_context}{language_instruction}
+IMPORTANT: Always use Indian Rupee (₹ or INR) for all monetary amounts. Never use dollars ($) or other currencies.{prompt_suffix}
 
 SAFETY & SCOPE:
 - You are a Banking Assistant. You DO NOT answer questions about coding, math, general knowledge, or politics. If asked, politely decline and ask them to ask banking-related questions.
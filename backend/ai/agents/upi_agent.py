@@ -10,7 +10,135 @@ Handles Hello UPI voice-assisted payment transactions
 """
 from langchain_core.messages import AIMessage, HumanMessage
 from utils import logger
+import json
 import re
+import time
+
+
+# Short follow-up turns that the extraction LLM adds nothing to
+_CONFIRM_RE = re.compile(
+    r"^\s*(?:(?:yes|yeah|ok|okay|sure|confirm|proceed|go ahead|हाँ|हां|ठीक है|ठीक|जी)[\s,.!]*)+$",
+    re.IGNORECASE,
+)
+_AMOUNT_ONLY_RE = re.compile(
+    r"^\s*(?:rs\.?|₹)?\s*(\d{1,7}(?:\.\d+)?)\s*(?:rupees?|रुपये)?\s*$",
+    re.IGNORECASE,
+)
+
+
+# One compiled alternation per keyword family. A leading \b with a \w* tail keeps
+# prefix matching ("paying", "paytm", "upi-id") without hitting "repay" or "book";
+# no trailing \b because Devanagari vowel signs are not \w
+_WAKE_UP_RE = re.compile(r"hello vaani|hello upi|hey vaani|hey upi|हेलो वाणी|हेलो upi|हेलो यूपीआई")
+_PAYMENT_RE = re.compile(r"\b(?:pay|send|transfer|भेजें|भुगतान)\w*")
+_UPI_KEYWORD_RE = re.compile(r"\b(?:upi|यूपीआई|यूपी|yupi)\w*|you pee|you p i")
+_BALANCE_RE = re.compile(
+    r"\bbalance\w*|बैलेंस|kitne paise hain|bakaaya rashi|kitna hai"
+    r"|कितने पैसे हैं|बकाया राशि|शेष राशि|कितना है"
+)
+_ACCOUNT_SELECTION_RE = re.compile(r"\b(?:account|selected|चुना|खाता)\w*")
+_CONFIRMATION_RE = re.compile(r"\b(?:yes|ok|sure|confirm|proceed|go ahead|हाँ|ठीक|जी)\w*")
+_RECIPIENT_RE = re.compile(r"\b(?:to|beneficiary)\b|@")
+_UPI_REFERENCE_RE = re.compile(r"(?:this|the|that) upi|upi id|upi from qr")
+
+
+# "double four" / "double 4" -> "44" in one pass
+_WORD_TO_DIGIT = {
+    "zero": "0", "one": "1", "two": "2", "three": "3", "four": "4",
+    "five": "5", "six": "6", "seven": "7", "eight": "8", "nine": "9",
+    **{str(d): str(d) for d in range(10)},
+}
+_DOUBLE_DIGIT_RE = re.compile(
+    r"double\s+(zero|one|two|three|four|five|six|seven|eight|nine|\d)\b",
+    re.IGNORECASE,
+)
+
+
+def _expand_double_digits(text: str) -> str:
+    """Replace spoken "double X" with the digit written twice"""
+    return _DOUBLE_DIGIT_RE.sub(lambda m: _WORD_TO_DIGIT[m.group(1).lower()] * 2, text)
+
+
+_MAX_ACCOUNT_SUFFIX_LEN = 4
+
+
+def _index_accounts_by_suffix(accounts) -> dict:
+    """Map the last 1-4 digits of each account number to its account (first match wins)"""
+    by_suffix = {}
+    for acc in accounts:
+        account_number = acc.get("accountNumber") or acc.get("account_number") or ""
+        for length in range(1, min(len(account_number), _MAX_ACCOUNT_SUFFIX_LEN) + 1):
+            by_suffix.setdefault(account_number[-length:], acc)
+    return by_suffix
+
+
+_JSON_DECODER = json.JSONDecoder()
+
+
+def _parse_first_json_object(text: str) -> dict:
+    """Decode the first JSON object in an LLM reply in a single pass (handles nested objects)"""
+    start = text.find("{")
+    if start < 0:
+        return {}
+    parsed, _ = _JSON_DECODER.raw_decode(text, start)
+    return parsed if isinstance(parsed, dict) else {}
+
+
+def _prefilter_payment_details(message: str):
+    """
+    Build payment details without the LLM for trivial follow-up messages.
+    
+    Returns:
+        {} for a plain confirmation, {"amount": float} for a bare amount,
+        or None when the message needs full LLM extraction.
+    """
+    if len(message.split()) > 3:
+        return None
+    if _CONFIRM_RE.match(message):
+        return {}
+    amount_match = _AMOUNT_ONLY_RE.match(message)
+    if amount_match:
+        # Keep the paise: "250.50" must not prefill the card as 250
+        return {"amount": float(amount_match.group(1))}
+    return None
+
+
+# Resolved "first"/"last" beneficiary recipients keyed by (user_id, selector)
+_BENEFICIARY_CACHE_TTL_SECONDS = 30
+_BENEFICIARY_CACHE_MAX_SIZE = 1024
+_beneficiary_cache = {}
+
+
+def _resolve_beneficiary_recipient(user_id, selector: str):
+    """
+    Resolve a "first"/"last" beneficiary selector to a UPI ID, phone number or name.
+    
+    Uses a single JOIN ... LIMIT 1 query and caches the result for a short TTL.
+    Returns None when the user has no beneficiaries.
+    """
+    cache_key = (str(user_id), selector)
+    cached = _beneficiary_cache.get(cache_key)
+    if cached and time.monotonic() - cached[1] < _BENEFICIARY_CACHE_TTL_SECONDS:
+        return cached[0]
+    
+    from db.repositories import beneficiaries as beneficiary_repo
+    from utils.db_helper import get_db
+    
+    get_contact = (
+        beneficiary_repo.get_first_beneficiary_contact if selector == "first"
+        else beneficiary_repo.get_last_beneficiary_contact
+    )
+    with get_db() as db:
+        row = get_contact(db, user_id=user_id, include_blocked=False)
+        if row is None:
+            return None
+        beneficiary, upi_id, phone_number = row
+        resolved = upi_id or phone_number or beneficiary.display_name
+    
+    if len(_beneficiary_cache) >= _BENEFICIARY_CACHE_MAX_SIZE:
+        _beneficiary_cache.pop(next(iter(_beneficiary_cache)))
+    _beneficiary_cache[cache_key] = (resolved, time.monotonic())
+    return resolved
 
 
 async def upi_agent(state):
@@ -46,24 +174,18 @@ async def upi_agent(state):
     
     # Check if this is just a wake-up phrase without payment command
     msg_lower = last_user_message.lower()
-    wake_up_phrases = [
-        "hello vaani", "hello upi", "hey vaani", "hey upi",
-        "हेलो वाणी", "हेलो upi", "हेलो यूपीआई"
-    ]
-    is_wake_up_only = any(phrase in msg_lower for phrase in wake_up_phrases) and not any(
-        word in msg_lower for word in ["pay", "send", "transfer", "भेजें", "भुगतान"]
-    )
+    has_payment_word = bool(_PAYMENT_RE.search(msg_lower))
+    is_wake_up_only = bool(_WAKE_UP_RE.search(msg_lower)) and not has_payment_word
     
     # Check if message explicitly mentions UPI (both English and Hindi)
-    upi_keywords = ["upi", "यूपीआई", "यूपी", "yupi", "you pee", "you p i"]
-    has_explicit_upi = any(keyword in msg_lower for keyword in upi_keywords) or is_wake_up_only
+    has_explicit_upi = bool(_UPI_KEYWORD_RE.search(msg_lower)) or is_wake_up_only
     
     # If UPI keyword detected but UPI mode is inactive, activate it
     if has_explicit_upi and not upi_mode_active:
         state["upi_mode"] = True
         logger.info("upi_keyword_detected_activating_mode", 
                    message=last_user_message,
-                   upi_keywords_found=[kw for kw in upi_keywords if kw in msg_lower])
+                   upi_keywords_found=sorted(set(_UPI_KEYWORD_RE.findall(msg_lower))))
     
     # If UPI mode is inactive and message doesn't explicitly mention UPI, redirect to banking agent
     # Exception: If there's a pending UPI operation (account selection), continue with UPI agent
@@ -147,20 +269,11 @@ async def upi_agent(state):
         return state
     
     # Check for balance check intent in UPI mode OR if account selection is pending for balance check
-    balance_check_keywords = [
-        "balance check", "kitne paise hain", "bakaaya rashi", "balance",
-        "बैलेंस", "कितने पैसे हैं", "बकाया राशि", "शेष राशि",
-        "account balance", "mera account balance", "kitna hai", "कितना है",
-        "मेरा अकाउंट बैलेंस", "बैलेंस कितना है", "खाता बैलेंस"
-    ]
-    is_balance_check = any(keyword in msg_lower for keyword in balance_check_keywords)
+    is_balance_check = bool(_BALANCE_RE.search(msg_lower))
     
     # Check if message indicates account selection
     # Messages like "Account 1444 selected" or "खाता 1444 चुना"
-    account_selection_indicators = [
-        "account", "selected", "चुना", "खाता"
-    ]
-    has_account_selection_phrase = any(indicator in msg_lower for indicator in account_selection_indicators)
+    has_account_selection_phrase = bool(_ACCOUNT_SELECTION_RE.search(msg_lower))
     has_account_digits = bool(re.search(r'\d{3,4}', msg_lower))  # Account ending digits
     
     # Route based on pending operation type:
@@ -176,7 +289,7 @@ async def upi_agent(state):
     elif is_balance_check:
         # Explicit balance check request → route to balance check handler
         response_content = await handle_upi_balance_check(state, user_context, language, last_user_message)
-    elif has_account_selection_phrase and has_account_digits and not any(word in msg_lower for word in ["pay", "send", "transfer", "भेजें", "भुगतान"]):
+    elif has_account_selection_phrase and has_account_digits and not has_payment_word:
         # Account selection without payment keywords and no pending operation → check context from previous messages
         # If previous message was about balance check, route to balance check, otherwise payment
         messages = state.get("messages", [])
@@ -262,10 +375,10 @@ def validate_upi_id(upi_id: str):
 
 async def handle_upi_balance_check(state, user_context, language, last_user_message):
     """Handle UPI balance check requests - asks for account selection if multiple accounts, then prompts for PIN"""
-    from tools import get_user_accounts
+    from tools import call_tool
     
     # Get user's accounts
-    accounts_result = get_user_accounts.invoke({"user_id": state.get("user_id")})
+    accounts_result = await call_tool("get_user_accounts", user_id=state.get("user_id"))
     accounts = accounts_result["accounts"] if accounts_result.get("success") else []
     
     if not accounts:
@@ -430,12 +543,12 @@ async def handle_upi_balance_check(state, user_context, language, last_user_mess
 
 async def handle_upi_payment(state, user_context, language, last_user_message):
     """Handle UPI payment requests - extracts details and prepares for PIN entry"""
-    from tools import get_user_accounts, resolve_upi_id, initiate_upi_payment
+    from tools import call_tool, resolve_upi_id, initiate_upi_payment
     from services import get_llm_service
     import re
     
     # Get user's accounts
-    accounts_result = get_user_accounts.invoke({"user_id": state.get("user_id")})
+    accounts_result = await call_tool("get_user_accounts", user_id=state.get("user_id"))
     accounts = accounts_result["accounts"] if accounts_result.get("success") else []
     
     if not accounts:
@@ -526,6 +639,14 @@ async def handle_upi_payment(state, user_context, language, last_user_message):
                 conversation_context += f"IMPORTANT: The MOST RECENT UPI ID is: {most_recent_upi}\n"
                 conversation_context += "If the current message refers to 'this UPI', 'the UPI', 'that UPI ID', 'the UPI from QR', 'yes', or just mentions an amount, use the MOST RECENT UPI ID from above.\n"
     
+    # Confirmations ("yes", "ok") and bare amounts ("500") don't need an LLM pass
+    payment_details = _prefilter_payment_details(last_user_message)
+    if payment_details is not None:
+        logger.info("upi_extraction_skipped", message=last_user_message, payment_details=payment_details)
+        return await _finalize_upi_payment(
+            state, language, last_user_message, accounts, payment_details, upi_ids_in_context
+        )
+    
     # Word number mapping for reference in prompt
     word_number_examples = {
         "hundred": 100, "thousand": 1000, "lakh": 100000,
@@ -588,27 +709,28 @@ Return ONLY valid JSON, nothing else."""
             use_fast_model=True
         )
         
-        import json
-        json_match = re.search(r'\{[^{}]*\}', extracted_json, re.DOTALL)
-        if json_match:
-            payment_details = json.loads(json_match.group())
-        else:
-            payment_details = {}
+        payment_details = _parse_first_json_object(extracted_json)
     except Exception as e:
         logger.warning("upi_extraction_failed", error=str(e), message=last_user_message)
         payment_details = {}
     
+    return await _finalize_upi_payment(
+        state, language, last_user_message, accounts, payment_details, upi_ids_in_context
+    )
+
+
+async def _finalize_upi_payment(state, language, last_user_message, accounts, payment_details, upi_ids_in_context):
+    """Resolve recipient/source account from extracted details and build the UPI payment card"""
     # Fallback: If no recipient_identifier extracted but we have UPI ID in context, use it
     if not payment_details.get("recipient_identifier") and upi_ids_in_context:
         # Check if message refers to "this UPI", "the UPI", etc., or if it's just an amount/confirmation
         msg_lower = last_user_message.lower()
-        upi_references = ["this upi", "the upi", "that upi", "upi id", "the upi id", "this upi id", "that upi id", "upi from qr", "the upi from qr"]
-        confirmation_words = ["yes", "ok", "okay", "sure", "confirm", "proceed", "go ahead", "हाँ", "ठीक", "जी"]
-        has_confirmation = any(word in msg_lower for word in confirmation_words)
-        has_explicit_recipient = any(word in msg_lower for word in ["to", "beneficiary", "@"])
+        has_confirmation = bool(_CONFIRMATION_RE.search(msg_lower))
+        has_explicit_recipient = bool(_RECIPIENT_RE.search(msg_lower))
+        refers_to_upi = bool(_UPI_REFERENCE_RE.search(msg_lower))
         
         # If message has confirmation or just amount without explicit recipient, use UPI from context
-        if any(ref in msg_lower for ref in upi_references) or (has_confirmation or not has_explicit_recipient):
+        if refers_to_upi or (has_confirmation or not has_explicit_recipient):
             # Use the MOST RECENT UPI ID from context (last in list = most recent)
             most_recent_upi = upi_ids_in_context[-1]
             payment_details["recipient_identifier"] = most_recent_upi
@@ -620,18 +742,7 @@ Return ONLY valid JSON, nothing else."""
     msg_lower = last_user_message.lower()
     
     # Handle "double four" -> "44" conversion
-    digit_word_map = {
-        "zero": "0", "one": "1", "two": "2", "three": "3", "four": "4",
-        "five": "5", "six": "6", "seven": "7", "eight": "8", "nine": "9"
-    }
-    msg_for_digit_extraction = msg_lower
-    for word, digit in digit_word_map.items():
-        msg_for_digit_extraction = re.sub(
-            rf"double\s+{word}\b|double\s+{digit}\b",
-            digit + digit,
-            msg_for_digit_extraction,
-            flags=re.IGNORECASE
-        )
+    msg_for_digit_extraction = _expand_double_digits(msg_lower)
     
     source_digits = payment_details.get("source_account_digits")
     if not source_digits:
@@ -650,12 +761,16 @@ Return ONLY valid JSON, nothing else."""
     
     if source_digits:
         source_digits = str(source_digits).strip()
-        for acc in accounts:
-            account_number = acc.get("accountNumber") or acc.get("account_number") or ""
-            if account_number and account_number.endswith(source_digits):
-                source_account_id = acc.get("id") or acc.get("accountId")
-                source_account_number = account_number
-                break
+        acc = _index_accounts_by_suffix(accounts).get(source_digits)
+        if acc is None and len(source_digits) > _MAX_ACCOUNT_SUFFIX_LEN:
+            acc = next(
+                (a for a in accounts
+                 if (a.get("accountNumber") or a.get("account_number") or "").endswith(source_digits)),
+                None,
+            )
+        if acc is not None:
+            source_account_id = acc.get("id") or acc.get("accountId")
+            source_account_number = acc.get("accountNumber") or acc.get("account_number")
     
     # If no source account specified, use first account
     if not source_account_id and accounts:
@@ -691,41 +806,10 @@ Return ONLY valid JSON, nothing else."""
     # Resolve beneficiary if recipient_identifier is "first" or "last"
     if recipient_identifier in ["first", "last"]:
         try:
-            from db.repositories import beneficiaries as beneficiary_repo
-            from utils.db_helper import get_db
-            
-            with get_db() as db:
-                beneficiaries = beneficiary_repo.list_beneficiaries(db, user_id=state.get("user_id"), include_blocked=False)
-                beneficiaries_list = list(beneficiaries)
-                
-                if beneficiaries_list:
-                    if recipient_identifier == "first":
-                        beneficiary = beneficiaries_list[0]
-                    else:  # "last"
-                        beneficiary = beneficiaries_list[-1]
-                    
-                    # Try to resolve beneficiary to UPI ID or phone number
-                    # First try to get user by account number
-                    from db.models import User, Account
-                    from sqlalchemy import select
-                    
-                    stmt = select(Account).where(Account.account_number == beneficiary.account_number)
-                    account = db.execute(stmt).scalars().first()
-                    if account:
-                        stmt = select(User).where(User.id == account.user_id)
-                        user = db.execute(stmt).scalars().first()
-                        if user and user.upi_id:
-                            recipient_identifier = user.upi_id
-                        elif user and user.phone_number:
-                            recipient_identifier = user.phone_number
-                        else:
-                            # Fallback to beneficiary name
-                            recipient_identifier = beneficiary.name
-                    else:
-                        recipient_identifier = beneficiary.name
-                else:
-                    # No beneficiaries found, keep original identifier
-                    pass
+            resolved = _resolve_beneficiary_recipient(state.get("user_id"), recipient_identifier)
+            if resolved:
+                recipient_identifier = resolved
+            # No beneficiaries found, keep original identifier
         except Exception as e:
             logger.warning("beneficiary_resolution_failed", error=str(e))
             # Keep original identifier if resolution fails
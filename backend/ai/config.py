@@ -30,6 +30,15 @@ class Settings(BaseSettings):
     ollama_fast_model: str = "llama3.2:3b"
     ollama_timeout: int = 60
     ollama_num_ctx: int = 4096
+    # How long Ollama keeps models (and their prompt KV cache) resident after a request
+    ollama_keep_alive: str = "30m"
+    
+    # Optional overrides for ollama_fast_model / ollama_model, e.g. quantized tags
+    # (Q4_K_M for the voice-mode fast path, Q8_0 for accurate replies; see .env.example).
+    # Unset by default so OLLAMA_FAST_MODEL / OLLAMA_MODEL stay authoritative.
+    fast_model_name: Optional[str] = None
+    accurate_model_name: Optional[str] = None
+    ollama_preload_models: bool = True
     
     # OpenAI Configuration
     openai_api_key: Optional[str] = None
@@ -52,6 +61,16 @@ class Settings(BaseSettings):
     redis_url: str = "redis://localhost:6379/0"
     redis_enabled: bool = False
     
+    # RAG Embeddings
+    # Use an int8-quantized ONNX export of all-MiniLM-L6-v2 (requires optimum[onnxruntime]);
+    # falls back to the FP32 sentence-transformers model when unavailable.
+    # Off by default: existing ./chroma_db stores hold FP32 vectors, so re-run the
+    # ingest scripts after switching. The ONNX dir is relative to backend/ai.
+    rag_quantized_embeddings: bool = False
+    rag_onnx_model_dir: str = "./onnx_models/all-MiniLM-L6-v2-int8"
+    rag_onnx_threads: int = 0  # ONNX Runtime intra-op threads (0 = all CPU cores)
+    rag_preload_on_startup: bool = True
+    
     # Vector Database (Qdrant)
     qdrant_url: str = "http://localhost:6333"
     qdrant_collection_name: str = "banking_documents"
@@ -113,6 +132,16 @@ class Settings(BaseSettings):
     def is_development(self) -> bool:
         """Check if running in development environment"""
         return self.environment.lower() == "development"
+    
+    @property
+    def resolved_fast_model(self) -> str:
+        """Ollama tag used when use_fast_model=True (voice mode, extraction)"""
+        return self.fast_model_name or self.ollama_fast_model
+    
+    @property
+    def resolved_accurate_model(self) -> str:
+        """Ollama tag used for regular (accurate) responses"""
+        return self.accurate_model_name or self.ollama_model
 
 
 @lru_cache()
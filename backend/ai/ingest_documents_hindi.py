@@ -14,7 +14,7 @@ from pathlib import Path
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from services.rag_service import RAGService
+from services.rag_service import RAGService, _DOCUMENTS_DIR
 from utils import logger
 
 
@@ -25,8 +25,7 @@ def main():
     print("HINDI DOCUMENTS INGESTION")
     print("=" * 60)
     
-    ai_dir = Path(__file__).parent
-    base_docs_dir = ai_dir.parent / "backend" / "documents"
+    base_docs_dir = _DOCUMENTS_DIR
     
     # Process loan products
     print("\n📚 Processing Hindi Loan Products...")
@@ -55,26 +54,20 @@ def main():
         collection_name=loan_collection
     )
     
-    print(f"\n🔄 Loading PDF documents for loans...")
-    loan_documents = loan_rag_service.load_pdf_documents()
-    print(f"✅ Loaded {len(loan_documents)} pages from loan PDFs")
+    print(f"\n🔄 Loading, chunking and embedding PDF documents for loans (pipelined)...")
+    print(f"   Using embedding model: sentence-transformers/all-MiniLM-L6-v2 ({type(loan_rag_service.embeddings).__name__})")
+    print(f"   This may take a few minutes...")
     
-    if loan_documents:
-        print(f"\n🔄 Splitting loan documents into chunks...")
-        loan_chunks = loan_rag_service.chunk_documents(loan_documents)
-        print(f"✅ Created {len(loan_chunks)} chunks")
-        
-        print(f"\n🔄 Creating vector database for loans...")
-        print(f"   Using embedding model: sentence-transformers/all-MiniLM-L6-v2")
-        print(f"   This may take a few minutes...")
-        
-        try:
-            loan_rag_service.vectorstore = loan_rag_service.create_vector_store(loan_chunks)
+    try:
+        loan_page_count, loan_chunk_count = loan_rag_service.ingest_documents()
+        print(f"✅ Loaded {loan_page_count} pages from loan PDFs")
+        print(f"✅ Created {loan_chunk_count} chunks")
+        if loan_chunk_count:
             print(f"✅ Loan vector database created successfully!")
-        except Exception as e:
-            print(f"\n❌ ERROR during loan vector store creation: {e}")
-            logger.error("hindi_loan_ingestion_failed", error=str(e))
-            return 1
+    except Exception as e:
+        print(f"\n❌ ERROR during loan vector store creation: {e}")
+        logger.error("hindi_loan_ingestion_failed", error=str(e))
+        return 1
     
     # Process investment schemes
     print("\n📚 Processing Hindi Investment Schemes...")
@@ -103,26 +96,20 @@ def main():
         collection_name=investment_collection
     )
     
-    print(f"\n🔄 Loading PDF documents for investments...")
-    investment_documents = investment_rag_service.load_pdf_documents()
-    print(f"✅ Loaded {len(investment_documents)} pages from investment PDFs")
+    print(f"\n🔄 Loading, chunking and embedding PDF documents for investments (pipelined)...")
+    print(f"   Using embedding model: sentence-transformers/all-MiniLM-L6-v2 ({type(investment_rag_service.embeddings).__name__})")
+    print(f"   This may take a few minutes...")
     
-    if investment_documents:
-        print(f"\n🔄 Splitting investment documents into chunks...")
-        investment_chunks = investment_rag_service.chunk_documents(investment_documents)
-        print(f"✅ Created {len(investment_chunks)} chunks")
-        
-        print(f"\n🔄 Creating vector database for investments...")
-        print(f"   Using embedding model: sentence-transformers/all-MiniLM-L6-v2")
-        print(f"   This may take a few minutes...")
-        
-        try:
-            investment_rag_service.vectorstore = investment_rag_service.create_vector_store(investment_chunks)
+    try:
+        investment_page_count, investment_chunk_count = investment_rag_service.ingest_documents()
+        print(f"✅ Loaded {investment_page_count} pages from investment PDFs")
+        print(f"✅ Created {investment_chunk_count} chunks")
+        if investment_chunk_count:
             print(f"✅ Investment vector database created successfully!")
-        except Exception as e:
-            print(f"\n❌ ERROR during investment vector store creation: {e}")
-            logger.error("hindi_investment_ingestion_failed", error=str(e))
-            return 1
+    except Exception as e:
+        print(f"\n❌ ERROR during investment vector store creation: {e}")
+        logger.error("hindi_investment_ingestion_failed", error=str(e))
+        return 1
     
     # Comprehensive retrieval tests
     print(f"\n🔄 Running comprehensive retrieval tests...")
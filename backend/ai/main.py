@@ -5,8 +5,9 @@ Handles chat requests and TTS generation
 import sys
 from pathlib import Path
 from typing import Optional, List, Dict, Any
-from datetime import datetime
+import asyncio
 import base64
+import time
 
 # Add backend to path for database access
 backend_path = Path(__file__).parent.parent / "backend"
@@ -14,16 +15,18 @@ sys.path.insert(0, str(backend_path))
 
 from fastapi import FastAPI, HTTPException, Depends, Request, UploadFile, File
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import StreamingResponse, Response
+from fastapi.responses import StreamingResponse
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field, ConfigDict
+import httpx
 import uvicorn
 
 from config import settings
 from services import get_llm_service, get_azure_tts_service, get_guardrail_service, GuardrailViolationType
 from agents.agent_graph import process_message
-from utils import logger
+from tools.banking_tools import shutdown_executor as shutdown_banking_tools
+from utils import logger, utc_timestamp
 from utils.demo_logging import demo_logger
 
 
@@ -103,6 +106,7 @@ app = FastAPI(
     title=settings.app_name,
     version=settings.app_version,
     description="AI-powered banking assistant backend",
+    default_response_class=ORJSONResponse,
 )
 
 # Add CORS middleware
@@ -128,19 +132,22 @@ app.add_middleware(
 async def validation_exception_handler(request: Request, exc: RequestValidationError):
     """Log validation errors for debugging"""
     logger.error("validation_error", errors=exc.errors(), body=exc.body)
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=422,
         content={"detail": exc.errors(), "body": exc.body},
     )
 
 
 # Middleware for logging
+_log_request = logger.info
+
+
 @app.middleware("http")
 async def log_requests(request: Request, call_next):
     """Log all requests"""
-    start_time = datetime.now()
+    start_ns = time.perf_counter_ns()
     
-    logger.info(
+    _log_request(
         "request_received",
         method=request.method,
         path=request.url.path,
@@ -149,8 +156,8 @@ async def log_requests(request: Request, call_next):
     
     response = await call_next(request)
     
-    duration = (datetime.now() - start_time).total_seconds()
-    logger.info(
+    duration = (time.perf_counter_ns() - start_ns) / 1e9
+    _log_request(
         "request_completed",
         method=request.method,
         path=request.url.path,
@@ -161,6 +168,29 @@ async def log_requests(request: Request, call_next):
     return response
 
 
+@app.on_event("startup")
+async def startup_event():
+    """Create shared HTTP client, start the RAG preload and load the fast/accurate models so voice mode starts warm"""
+    app.state.http = httpx.AsyncClient(
+        base_url=settings.ollama_base_url,
+        timeout=10,
+        limits=httpx.Limits(max_keepalive_connections=32),
+    )
+    if settings.rag_preload_on_startup:
+        # Load embeddings/vector stores in a worker thread while the LLM models load
+        from services.rag_service import preload_rag_services
+        app.state.rag_preload = asyncio.create_task(asyncio.to_thread(preload_rag_services))
+    if settings.ollama_preload_models:
+        await get_llm_service().preload_models()
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Close shared HTTP client and DB tool workers"""
+    await app.state.http.aclose()
+    shutdown_banking_tools()
+
+
 # Endpoints
 @app.get("/health", response_model=HealthResponse)
 async def health_check():
@@ -178,6 +208,18 @@ async def health_check():
     )
 
 
+@app.get("/api/models")
+async def list_models():
+    """List models available on the Ollama server"""
+    try:
+        response = await app.state.http.get("/api/tags")
+        response.raise_for_status()
+        return response.json()
+    except httpx.HTTPError as e:
+        logger.warning("list_models_failed", error=str(e))
+        raise HTTPException(status_code=503, detail="Ollama server not reachable")
+
+
 @app.post("/api/chat", response_model=ChatResponse)
 async def chat(request: ChatRequest):
     """
@@ -247,7 +289,7 @@ async def chat(request: ChatRequest):
                 success=False,
                 response=error_message,
                 language=request.language,
-                timestamp=datetime.now().isoformat()
+                timestamp=utc_timestamp()
             )
         
         # Convert message history
@@ -541,15 +583,14 @@ async def text_to_speech(request: TTSRequest):
             language=request.language
         )
         
-        # Synthesize speech
-        audio_data = await azure_tts.synthesize_text(
+        # Start synthesis; audio chunks are streamed as Azure produces them
+        audio_stream = await azure_tts.synthesize_text_stream(
             text=request.text,
             language=request.language
         )
         
-        # Return audio as response
-        return Response(
-            content=audio_data,
+        return StreamingResponse(
+            audio_stream,
             media_type="audio/wav",
             headers={
                 "Content-Disposition": "attachment; filename=speech.wav"
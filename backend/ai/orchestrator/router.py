@@ -1,7 +1,8 @@
 """Intent routing helpers for the hybrid supervisor."""
 from __future__ import annotations
 
-from typing import Dict
+from types import MappingProxyType
+from typing import Mapping
 
 from utils import logger
 from agents.intent_classifier import classify_intent
@@ -10,14 +11,19 @@ from .state import ConversationState
 
 
 DEFAULT_ROUTE = "rag_agent"
-INTENT_TO_ROUTE: Dict[str, str] = {
+INTENT_TO_ROUTE: Mapping[str, str] = MappingProxyType({
     "upi_payment": "upi_agent",
     "banking_operation": "banking_agent",
     "general_faq": "rag_agent",
     "greeting": "greeting_agent",
     "feedback": "feedback_agent",
     "other": "rag_agent",
-}
+})
+
+# Frozen dispatch table: intent -> slot in _ROUTES (last slot is the default route)
+_INTENT_IDX = {intent: idx for idx, intent in enumerate(INTENT_TO_ROUTE)}
+_ROUTES = tuple(INTENT_TO_ROUTE.values()) + (DEFAULT_ROUTE,)
+_DEFAULT_IDX = len(_ROUTES) - 1
 
 
 class IntentRouter:
@@ -38,4 +44,4 @@ class IntentRouter:
 
     def resolve_route(self, intent: str) -> str:
         """Map a classified intent to a concrete specialist agent key."""
-        return INTENT_TO_ROUTE.get(intent, DEFAULT_ROUTE)
+        return _ROUTES[_INTENT_IDX.get(intent, _DEFAULT_IDX)]
@@ -1,8 +1,11 @@
 """Hybrid supervisor orchestrator for the banking assistant."""
 from __future__ import annotations
 
-from datetime import datetime
-from typing import Any, Dict, List, Optional
+import asyncio
+import re
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import Any, Dict, List, Optional, Tuple
 
 from langchain_core.messages import AIMessage, BaseMessage, HumanMessage
 
@@ -11,7 +14,7 @@ from agents.feedback_agent import feedback_agent
 from agents.rag_agent import rag_agent
 from agents.greeting_agent import greeting_agent
 from agents.upi_agent import upi_agent
-from utils import logger
+from utils import logger, utc_timestamp
 from utils.demo_logging import demo_logger
 from services import get_guardrail_service
 
@@ -19,14 +22,66 @@ from .router import IntentRouter
 from .state import ConversationState
 
 
-SPECIALIST_MAP = {
+SPECIALIST_MAP = MappingProxyType({
     "banking_agent": banking_agent,
     "upi_agent": upi_agent,
     "rag_agent": rag_agent,
     "greeting_agent": greeting_agent,
     "feedback_agent": feedback_agent,
+})
+
+# Frozen dispatch table: agent key -> slot in _SPECIALISTS (unknown keys fall back to rag_agent)
+_AGENT_IDX = {agent_key: idx for idx, agent_key in enumerate(SPECIALIST_MAP)}
+_SPECIALISTS = tuple(SPECIALIST_MAP.values())
+_FALLBACK_IDX = _AGENT_IDX["rag_agent"]
+
+
+# Messages (including the current turn) each specialist receives; older turns
+# only add prompt tokens. Agents not listed get the full history.
+AGENT_HISTORY_LIMITS: Dict[str, int] = {
+    "greeting_agent": 2,
+    "feedback_agent": 4,
+    "rag_agent": 6,
+    "banking_agent": 12,
+    "upi_agent": 12,
 }
 
+UPI_MODE_PHRASES = (
+    "upi mode",
+    "upi मोड",
+    "upi mode active",
+    "upi mode activated",
+    "i'm in upi mode",
+    "मैं upi मोड में",
+)
+_UPI_PHRASE_RE = re.compile("|".join(map(re.escape, UPI_MODE_PHRASES)), re.IGNORECASE)
+UPI_STRUCTURED_TYPES = frozenset({
+    "upi_mode_activation",
+    "upi_payment",
+    "upi_balance_check",
+})
+
+# Side-effect-free specialist that may run speculatively while the classifier
+# is still deciding, and the intents for which its result can be reused as-is.
+SPECULATIVE_ROUTE = "rag_agent"
+SPECULATIVE_INTENTS = frozenset({"general_faq", "other"})
+
+_QUESTION_RE = re.compile(
+    r"\?\s*$|^\s*(?:what|how|which|why|when|where|who|can|does|do|is|are|tell me|explain|"
+    r"क्या|कैसे|कौन|क्यों|कब|कहाँ|बताइए|बताओ)\b",
+    re.IGNORECASE,
+)
+# Turns the keyword classifier sends elsewhere; never speculate on these
+_NON_FAQ_HINT_RE = re.compile(
+    r"balance|बैलेंस|transfer|send|pay|भेज|भुगतान|ट्रांसफर|statement|स्टेटमेंट|remind|अनुस्मारक|"
+    r"upi|यूपी|language|भाषा|\d",
+    re.IGNORECASE,
+)
+
+
+_MESSAGE_CACHE_MAX_SESSIONS = 1024
+_MESSAGE_CACHE_MAX_PER_SESSION = 64
+
 
 class HybridSupervisor:
     """Coordinates deterministic routing with specialist agents."""
@@ -34,6 +89,10 @@ class HybridSupervisor:
     def __init__(self) -> None:
         self.router = IntentRouter()
         self.guardrail = get_guardrail_service()
+        # session_id -> {(role, content): message} so history entries seen on earlier
+        # turns are reused instead of re-coerced. Keyed by content rather than
+        # position because the frontend sends a sliding window of recent messages.
+        self._msg_cache: "OrderedDict[str, OrderedDict[Tuple[str, str], BaseMessage]]" = OrderedDict()
 
     async def process(
         self,
@@ -80,10 +139,16 @@ class HybridSupervisor:
                 "response": refusal_message,
                 "intent": "blocked",
                 "language": language,
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": utc_timestamp(),
             }
 
-        intent = await self.router.assign_intent(context)
+        speculative_task = self._start_speculative_specialist(context)
+        try:
+            intent = await self.router.assign_intent(context)
+        except BaseException:
+            if speculative_task:
+                speculative_task.cancel()
+            raise
         agent_key = self.router.resolve_route(intent)
         
         # Demo logging: Agent routing decision
@@ -95,10 +160,43 @@ class HybridSupervisor:
             upi_mode=context.upi_mode,
         )
         
-        await self._invoke_specialist(agent_key, context)
+        if speculative_task and agent_key == SPECULATIVE_ROUTE and intent in SPECULATIVE_INTENTS:
+            logger.info("speculative_specialist_hit", agent=agent_key, intent=intent)
+            try:
+                agent_state = await speculative_task
+            except Exception as e:
+                logger.warning("speculative_specialist_failed", agent=agent_key, error=str(e))
+                await self._invoke_specialist(agent_key, context)
+            else:
+                if agent_state.get("current_intent") == "unknown":
+                    agent_state["current_intent"] = intent
+                context.apply_agent_state(agent_state)
+        else:
+            if speculative_task:
+                speculative_task.cancel()
+                logger.info("speculative_specialist_miss", agent=agent_key, intent=intent)
+            await self._invoke_specialist(agent_key, context)
 
         return self._build_response(context)
 
+    def _start_speculative_specialist(self, context: ConversationState) -> Optional[asyncio.Task]:
+        """Run the FAQ specialist alongside classification for turns that look like product questions."""
+        if context.upi_mode or context.structured_data:
+            return None
+        message = context.messages[-1].content if context.messages else ""
+        if not _QUESTION_RE.search(message) or _NON_FAQ_HINT_RE.search(message):
+            return None
+
+        # Private copies so a discarded run cannot touch the real conversation state
+        payload = self._trim_for_agent(context, SPECULATIVE_ROUTE)
+        payload["statement_data"] = dict(context.statement_data)
+        payload["structured_data"] = dict(context.structured_data)
+        logger.info("speculative_specialist_started", agent=SPECULATIVE_ROUTE)
+        task = asyncio.create_task(SPECIALIST_MAP[SPECULATIVE_ROUTE](payload))
+        # Retrieve the outcome of discarded runs so failures aren't reported as unhandled
+        task.add_done_callback(lambda t: t.cancelled() or t.exception())
+        return task
+
     def _build_context(
         self,
         *,
@@ -110,14 +208,7 @@ class HybridSupervisor:
     message_history: List[Dict[str, Any]],
         upi_mode: Optional[bool],
     ) -> ConversationState:
-        messages: List[BaseMessage] = []
-        for entry in message_history:
-            role = entry.get("role")
-            content = entry.get("content", "")
-            if role == "user":
-                messages.append(HumanMessage(content=content))
-            elif role == "assistant":
-                messages.append(AIMessage(content=content))
+        messages = self._coerce_history(session_id, message_history)
         messages.append(HumanMessage(content=message))
 
         inferred_upi_mode = self._infer_upi_mode(upi_mode, message_history)
@@ -138,6 +229,32 @@ class HybridSupervisor:
         )
         return context
 
+    def _coerce_history(self, session_id: str, message_history: List[Dict[str, Any]]) -> List[BaseMessage]:
+        session_cache = self._msg_cache.get(session_id)
+        if session_cache is None:
+            session_cache = self._msg_cache[session_id] = OrderedDict()
+            if len(self._msg_cache) > _MESSAGE_CACHE_MAX_SESSIONS:
+                self._msg_cache.popitem(last=False)
+        else:
+            self._msg_cache.move_to_end(session_id)
+
+        messages: List[BaseMessage] = []
+        for entry in message_history:
+            role = entry.get("role")
+            if role not in ("user", "assistant"):
+                continue
+            key = (role, entry.get("content", ""))
+            cached = session_cache.get(key)
+            if cached is None:
+                cached = HumanMessage(content=key[1]) if role == "user" else AIMessage(content=key[1])
+                session_cache[key] = cached
+                if len(session_cache) > _MESSAGE_CACHE_MAX_PER_SESSION:
+                    session_cache.popitem(last=False)
+            else:
+                session_cache.move_to_end(key)
+            messages.append(cached)
+        return messages
+
     def _infer_upi_mode(
         self,
         upi_flag: Optional[bool],
@@ -148,34 +265,26 @@ class HybridSupervisor:
 
         for entry in reversed(message_history[-10:]):
             if entry.get("role") == "assistant":
-                content = entry.get("content", "").lower()
-                if any(
-                    phrase in content
-                    for phrase in [
-                        "upi mode",
-                        "upi मोड",
-                        "upi mode active",
-                        "upi mode activated",
-                        "i'm in upi mode",
-                        "मैं upi मोड में",
-                    ]
-                ):
+                if _UPI_PHRASE_RE.search(entry.get("content", "")):
                     return True
             structured = entry.get("structured_data")
-            if structured and structured.get("type") in {
-                "upi_mode_activation",
-                "upi_payment",
-                "upi_balance_check",
-            }:
+            if structured and structured.get("type") in UPI_STRUCTURED_TYPES:
                 return True
         return False
 
     async def _invoke_specialist(self, agent_key: str, context: ConversationState) -> None:
-        handler = SPECIALIST_MAP.get(agent_key, rag_agent)
+        handler = _SPECIALISTS[_AGENT_IDX.get(agent_key, _FALLBACK_IDX)]
         logger.info("invoking_specialist", agent=agent_key)
-        agent_state = await handler(context.to_agent_payload())
+        agent_state = await handler(self._trim_for_agent(context, agent_key))
         context.apply_agent_state(agent_state)
 
+    def _trim_for_agent(self, context: ConversationState, agent_key: str) -> Dict[str, Any]:
+        """Agent payload whose message list is a copy limited to the agent's history budget."""
+        payload = context.to_agent_payload()
+        limit = AGENT_HISTORY_LIMITS.get(agent_key)
+        payload["messages"] = list(context.messages[-limit:] if limit else context.messages)
+        return payload
+
     def _build_response(self, context: ConversationState) -> Dict[str, Any]:
         last_message = context.messages[-1] if context.messages else AIMessage(content="")
         response_text = last_message.content if hasattr(last_message, "content") else str(last_message)
@@ -189,7 +298,7 @@ class HybridSupervisor:
             "response": sanitized_response,
             "intent": context.current_intent,
             "language": context.language,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": utc_timestamp(),
         }
         if context.statement_data:
             payload["statement_data"] = context.statement_data
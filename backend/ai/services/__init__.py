@@ -1,9 +1,25 @@
-"""Services package initialization"""
-from .ollama_service import get_ollama_service, OllamaService
-from .openai_service import get_openai_service, OpenAIService
-from .azure_tts_service import get_azure_tts_service, AzureTTSService
-from .llm_service import get_llm_service, LLMService, LLMProvider
-from .guardrail_service import get_guardrail_service, GuardrailService, GuardrailViolationType, GuardrailResult
+"""Services package initialization
+
+Service modules pull in heavy SDKs (httpx clients, OpenAI, Azure Speech), so
+exports are resolved lazily on first attribute access (PEP 562).
+"""
+import importlib
+
+_LAZY = {
+    "get_ollama_service": ".ollama_service",
+    "OllamaService": ".ollama_service",
+    "get_openai_service": ".openai_service",
+    "OpenAIService": ".openai_service",
+    "get_azure_tts_service": ".azure_tts_service",
+    "AzureTTSService": ".azure_tts_service",
+    "get_llm_service": ".llm_service",
+    "LLMService": ".llm_service",
+    "LLMProvider": ".llm_service",
+    "get_guardrail_service": ".guardrail_service",
+    "GuardrailService": ".guardrail_service",
+    "GuardrailViolationType": ".guardrail_service",
+    "GuardrailResult": ".guardrail_service",
+}
 
 __all__ = [
     "get_ollama_service",
@@ -20,3 +36,16 @@ __all__ = [
     "GuardrailViolationType",
     "GuardrailResult",
 ]
+
+
+def __getattr__(name):
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -3,7 +3,7 @@ Azure Text-to-Speech Service
 Provides high-quality TTS for Hindi and English with Indian voices
 """
 import asyncio
-from typing import Optional
+from typing import AsyncIterator, Optional
 import azure.cognitiveservices.speech as speechsdk
 from config import settings
 from utils import logger, AzureTTSError
@@ -117,6 +117,91 @@ class AzureTTSService:
             logger.error("azure_tts_error", error=str(e))
             raise AzureTTSError(f"TTS failed: {e}")
     
+    async def synthesize_text_stream(
+        self,
+        text: str,
+        language: str = "en-IN",
+        chunk_size: int = 16000
+    ) -> AsyncIterator[bytes]:
+        """
+        Start speech synthesis and return an async iterator over audio chunks
+        
+        Waits only until synthesis has started (so failures can still be
+        reported before a response is sent); audio is then read from the
+        SDK's AudioDataStream as it is produced.
+        
+        Args:
+            text: Text to synthesize
+            language: Language code
+            chunk_size: Bytes read from the SDK stream per chunk
+            
+        Returns:
+            Async iterator yielding WAV audio bytes
+            
+        Raises:
+            AzureTTSError: If synthesis cannot be started
+        """
+        if not self.enabled:
+            raise AzureTTSError("Azure TTS is not enabled")
+        
+        try:
+            voice_name = self.get_voice_name(language)
+            self.speech_config.speech_synthesis_voice_name = voice_name
+            
+            # audio_config=None keeps audio in memory for AudioDataStream
+            synthesizer = speechsdk.SpeechSynthesizer(
+                speech_config=self.speech_config,
+                audio_config=None
+            )
+            
+            loop = asyncio.get_event_loop()
+            result = await loop.run_in_executor(
+                None,
+                lambda: synthesizer.start_speaking_text_async(text).get()
+            )
+            
+            if result.reason == speechsdk.ResultReason.Canceled:
+                cancellation = result.cancellation_details
+                logger.error(
+                    "azure_tts_canceled",
+                    reason=cancellation.reason,
+                    error_details=cancellation.error_details
+                )
+                raise AzureTTSError(f"Speech synthesis canceled: {cancellation.error_details}")
+            
+            audio_stream = speechsdk.AudioDataStream(result)
+            
+        except AzureTTSError:
+            raise
+        except Exception as e:
+            logger.error("azure_tts_error", error=str(e))
+            raise AzureTTSError(f"TTS failed: {e}")
+        
+        async def iter_chunks() -> AsyncIterator[bytes]:
+            buffer = bytes(chunk_size)
+            total_bytes = 0
+            # Keep a reference so the synthesizer is not collected mid-stream
+            _ = synthesizer
+            while True:
+                filled = await loop.run_in_executor(None, audio_stream.read_data, buffer)
+                if filled <= 0:
+                    break
+                total_bytes += filled
+                yield buffer[:filled]
+            
+            if audio_stream.status == speechsdk.StreamStatus.Canceled:
+                logger.error("azure_tts_stream_canceled", text_length=len(text), language=language)
+            else:
+                logger.info(
+                    "azure_tts_stream_success",
+                    text_length=len(text),
+                    language=language,
+                    voice=voice_name,
+                    audio_bytes=total_bytes
+                )
+        
+        return iter_chunks()
+    
     async def synthesize_ssml(
         self,
         ssml: str,
@@ -20,7 +20,7 @@ from config import settings
 def _build_model(use_fast_model: bool) -> ChatOllama:
     """Create a ChatOllama instance using settings and fast/slow model flag."""
 
-    model_name = settings.ollama_fast_model if use_fast_model else settings.ollama_model
+    model_name = settings.resolved_fast_model if use_fast_model else settings.resolved_accurate_model
 
     return ChatOllama(
         base_url=settings.ollama_base_url,
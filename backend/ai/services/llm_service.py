@@ -73,7 +73,10 @@ class LLMService:
         
         # Log which provider is being used
         provider_name = "🤖 Ollama (Local)" if self.provider == LLMProvider.OLLAMA else "🌐 OpenAI GPT (Cloud)"
-        model_name = self.service.model if hasattr(self.service, 'model') else "unknown"
+        if use_fast_model and hasattr(self.service, 'fast_model'):
+            model_name = self.service.fast_model
+        else:
+            model_name = self.service.model if hasattr(self.service, 'model') else "unknown"
         
         # Calculate prompt length
         prompt_length = sum(len(msg.get('content', '')) for msg in messages)
@@ -166,6 +169,14 @@ class LLMService:
         """
         return await self.service.generate_embeddings(text)
     
+    async def preload_models(self) -> None:
+        """
+        Warm up provider models so the first request doesn't pay the load cost.
+        Only Ollama needs this; cloud providers are a no-op.
+        """
+        if self.provider == LLMProvider.OLLAMA:
+            await self.service.preload_models()
+    
     async def health_check(self) -> bool:
         """
         Check if LLM service is healthy
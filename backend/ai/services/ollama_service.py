@@ -19,10 +19,15 @@ class OllamaService:
         # Ensure base_url doesn't have trailing slash
         base_url = settings.ollama_base_url.rstrip('/')
         self.base_url = base_url
-        self.model = settings.ollama_model
-        self.fast_model = settings.ollama_fast_model
+        self.model = settings.resolved_accurate_model
+        self.fast_model = settings.resolved_fast_model
         self.timeout = settings.ollama_timeout
-        self.client = httpx.AsyncClient(timeout=self.timeout, follow_redirects=True)
+        # Keep warm connections to Ollama open between chat turns
+        self.client = httpx.AsyncClient(
+            timeout=self.timeout,
+            follow_redirects=True,
+            limits=httpx.Limits(max_keepalive_connections=20, keepalive_expiry=300),
+        )
         
         logger.info(
             "ollama_service_initialized",
@@ -48,7 +53,7 @@ class OllamaService:
         
         Args:
             messages: List of message dicts with 'role' and 'content'
-            use_fast_model: Use fast model (llama3.2:3b) instead of default
+            use_fast_model: Use settings.resolved_fast_model instead of resolved_accurate_model
             temperature: Sampling temperature (0-1)
             max_tokens: Maximum tokens to generate
             
@@ -91,6 +96,7 @@ class OllamaService:
                 "model": model,
                 "messages": messages_dict,
                 "stream": False,
+                "keep_alive": settings.ollama_keep_alive,
                 "options": {
                     "temperature": temperature,
                     "top_p": settings.llm_top_p,
@@ -218,6 +224,7 @@ class OllamaService:
                     "model": model,
                     "messages": messages_dict,
                     "stream": True,
+                    "keep_alive": settings.ollama_keep_alive,
                     "options": {
                         "temperature": temperature,
                         "top_p": settings.llm_top_p,
@@ -278,6 +285,24 @@ class OllamaService:
             )
             raise OllamaServiceError(f"Embeddings error: {e}")
     
+    async def preload_models(self) -> None:
+        """
+        Load the fast and accurate models into Ollama memory.
+        
+        An empty prompt to /api/generate makes Ollama mmap the weights without
+        generating, so the first real request doesn't pay the model load time.
+        """
+        for model in dict.fromkeys([self.fast_model, self.model]):
+            try:
+                response = await self.client.post(
+                    f"{self.base_url}/api/generate",
+                    json={"model": model, "prompt": "", "keep_alive": settings.ollama_keep_alive},
+                )
+                response.raise_for_status()
+                logger.info("ollama_model_preloaded", model=model)
+            except Exception as e:
+                logger.warning("ollama_model_preload_failed", model=model, error=str(e))
+    
     async def health_check(self) -> bool:
         """
         Check if Ollama service is healthy
@@ -2,44 +2,316 @@
 RAG (Retrieval-Augmented Generation) Service
 Handles document ingestion, vector storage, and retrieval for Q&A
 """
+import hashlib
 import json
+import multiprocessing
 import os
+import pickle
+import threading
 import time
-from collections import OrderedDict
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
+import numpy as np
 from langchain_chroma import Chroma
 from langchain_community.document_loaders import PyPDFLoader
 from langchain_core.documents import Document
 from langchain_core.embeddings import Embeddings
 from langchain_text_splitters import RecursiveCharacterTextSplitter
 
+from config import settings
 from utils import logger
 from utils.demo_logging import demo_logger
 from services.semantic_chunker import SemanticChunker
 
 
+EMBEDDING_MODEL_NAME = "sentence-transformers/all-MiniLM-L6-v2"
+
+# Install locations are fixed, so resolve them once at import (independent of the cwd)
+_AI_DIR = Path(__file__).resolve().parent.parent
+_DOCUMENTS_DIR = _AI_DIR.parent / "documents"
+
+
 class OllamaEmbeddings(Embeddings):
     """Custom Ollama embeddings wrapper"""
     
+    BATCH_SIZE = 64
+    MAX_WORKERS = 8
+    
     def __init__(self, model: str = "nomic-embed-text"):
         import ollama
         self.model = model
-        self.client = ollama
+        # One client so every request reuses the same keep-alive connection pool
+        self.client = ollama.Client()
+    
+    def _embed_batch(self, texts: List[str]) -> List[List[float]]:
+        response = self.client.embed(model=self.model, input=texts)
+        return list(response['embeddings'])
         
     def embed_documents(self, texts: List[str]) -> List[List[float]]:
-        """Embed a list of documents"""
-        embeddings = []
-        for text in texts:
-            response = self.client.embed(model=self.model, input=text)
-            embeddings.append(response['embedding'])
+        """Embed a list of documents in one batched request"""
+        if not texts:
+            return []
+        try:
+            return self._embed_batch(texts)
+        except Exception as e:
+            # Fall back to concurrent smaller batches if the server rejects one large request
+            logger.warning("ollama_batch_embed_failed", count=len(texts), error=str(e))
+            from concurrent.futures import ThreadPoolExecutor
+            
+            batches = [texts[i:i + self.BATCH_SIZE] for i in range(0, len(texts), self.BATCH_SIZE)]
+            with ThreadPoolExecutor(max_workers=min(self.MAX_WORKERS, len(batches))) as executor:
+                results = executor.map(self._embed_batch, batches)
+            return [embedding for batch in results for embedding in batch]
+    
+    def embed_query(self, text: str) -> List[float]:
+        """Embed a single query"""
+        return self._embed_batch([text])[0]
+
+
+class QuantizedMiniLMEmbeddings(Embeddings):
+    """
+    all-MiniLM-L6-v2 exported to ONNX and dynamically quantized to int8 (AVX-512 VNNI)
+    
+    The export + quantization runs once and is cached in model_dir (relative
+    paths are resolved against backend/ai); later runs load the quantized
+    graph directly. Pooling/normalization match the
+    sentence-transformers pipeline so vectors stay comparable.
+    """
+    
+    QUANTIZED_FILE = "model_quantized.onnx"
+    
+    def __init__(
+        self,
+        model_name: str = EMBEDDING_MODEL_NAME,
+        model_dir: str = "./onnx_models/all-MiniLM-L6-v2-int8",
+        batch_size: int = 128,
+        max_length: int = 256,
+        num_threads: int = 0,
+    ):
+        import onnxruntime as ort
+        from optimum.onnxruntime import ORTModelForFeatureExtraction, ORTQuantizer
+        from optimum.onnxruntime.configuration import AutoQuantizationConfig
+        from transformers import AutoTokenizer
+        
+        self.model_dir = _AI_DIR / model_dir
+        self.batch_size = batch_size
+        self.max_length = max_length
+        
+        if not (self.model_dir / self.QUANTIZED_FILE).exists():
+            logger.info("onnx_embeddings_quantizing", model=model_name, model_dir=str(self.model_dir))
+            fp32_model = ORTModelForFeatureExtraction.from_pretrained(
+                model_name, export=True, provider="CPUExecutionProvider"
+            )
+            quantizer = ORTQuantizer.from_pretrained(fp32_model)
+            quantizer.quantize(
+                save_dir=self.model_dir,
+                quantization_config=AutoQuantizationConfig.avx512_vnni(is_static=False, per_channel=False),
+            )
+            AutoTokenizer.from_pretrained(model_name).save_pretrained(self.model_dir)
+        
+        # Use every core for the int8 matmuls of a single query
+        session_options = ort.SessionOptions()
+        session_options.intra_op_num_threads = num_threads or os.cpu_count() or 1
+        session_options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        
+        self.model = ORTModelForFeatureExtraction.from_pretrained(
+            self.model_dir,
+            file_name=self.QUANTIZED_FILE,
+            provider="CPUExecutionProvider",
+            session_options=session_options,
+        )
+        self.tokenizer = AutoTokenizer.from_pretrained(self.model_dir)
+    
+    def _encode(self, texts: List[str]) -> List[List[float]]:
+        embeddings: List[List[float]] = []
+        for start in range(0, len(texts), self.batch_size):
+            batch = texts[start:start + self.batch_size]
+            inputs = self.tokenizer(
+                batch, padding=True, truncation=True, max_length=self.max_length, return_tensors="np"
+            )
+            token_embeddings = np.asarray(self.model(**inputs).last_hidden_state)
+            # Mean pooling over non-padding tokens, then L2 normalize
+            mask = inputs["attention_mask"][..., None].astype(token_embeddings.dtype)
+            pooled = (token_embeddings * mask).sum(axis=1) / np.clip(mask.sum(axis=1), 1e-9, None)
+            pooled /= np.clip(np.linalg.norm(pooled, axis=1, keepdims=True), 1e-12, None)
+            embeddings.extend(pooled.tolist())
         return embeddings
     
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        """Embed a list of documents"""
+        return self._encode(texts)
+    
     def embed_query(self, text: str) -> List[float]:
         """Embed a single query"""
-        response = self.client.embed(model=self.model, input=text)
-        return response['embedding']
+        return self._encode([text])[0]
+
+
+def build_embeddings() -> Embeddings:
+    """
+    Create the embedding model used for both ingestion and retrieval
+    
+    Prefers the int8 ONNX MiniLM when enabled; otherwise (or if optimum is
+    not installed) uses the FP32 sentence-transformers model.
+    """
+    if settings.rag_quantized_embeddings:
+        try:
+            embeddings = QuantizedMiniLMEmbeddings(
+                model_dir=settings.rag_onnx_model_dir,
+                num_threads=settings.rag_onnx_threads,
+            )
+            logger.info("rag_service_init", embedding_model="all-MiniLM-L6-v2 (onnx int8)")
+            return embeddings
+        except ImportError as e:
+            logger.warning("onnx_embeddings_unavailable", error=str(e), fallback="huggingface")
+        except Exception as e:
+            logger.warning("onnx_embeddings_init_failed", error=str(e), fallback="huggingface")
+    
+    from langchain_community.embeddings import HuggingFaceEmbeddings
+    embeddings = HuggingFaceEmbeddings(
+        model_name=EMBEDDING_MODEL_NAME,
+        model_kwargs={'device': 'cpu'},
+        encode_kwargs={'normalize_embeddings': True, 'batch_size': 128}
+    )
+    logger.info("rag_service_init", embedding_model="all-MiniLM-L6-v2")
+    return embeddings
+
+
+def load_pdf_file(pdf_path: Path, is_investment_dir: bool = False) -> List[Document]:
+    """
+    Load a single PDF and tag its pages with loan/investment metadata
+    
+    Kept at module level so it can be shipped to worker processes.
+    
+    Args:
+        pdf_path: Path to the PDF file
+        is_investment_dir: True if the PDF lives in an investment documents folder
+        
+    Returns:
+        List of page Documents
+    """
+    return tag_pdf_pages(pdf_path, PyPDFLoader(str(pdf_path)).load(), is_investment_dir)
+
+
+def _load_pdf_pages(pdf_path: Path) -> Tuple[Path, Optional[List[Document]], Optional[str]]:
+    """Worker: parse one PDF; returns (path, pages, error) so failures stay per-file"""
+    try:
+        return pdf_path, PyPDFLoader(str(pdf_path)).load(), None
+    except Exception as e:
+        return pdf_path, None, str(e)
+
+
+def _map_pdf_pages(pdf_files: List[Path], max_workers: int) -> List[Tuple[Path, Optional[List[Document]], Optional[str]]]:
+    """
+    Parse PDFs in spawned worker processes, or serially when that isn't safe
+    
+    initialize() can run on a server worker thread (RAG preload at startup);
+    forking a multi-threaded server from there can deadlock, so the pool is
+    only used from the main thread, and any pool failure falls back to serial.
+    """
+    if max_workers > 1 and threading.current_thread() is threading.main_thread():
+        try:
+            with ProcessPoolExecutor(
+                max_workers=max_workers, mp_context=multiprocessing.get_context("spawn")
+            ) as executor:
+                return list(executor.map(_load_pdf_pages, pdf_files))
+        except Exception as e:
+            logger.warning("pdf_pool_failed", error=str(e), fallback="serial")
+    return [_load_pdf_pages(pdf_path) for pdf_path in pdf_files]
+
+
+def tag_pdf_pages(pdf_path: Path, docs: List[Document], is_investment_dir: bool = False) -> List[Document]:
+    """Add source and loan/investment metadata to the pages of one PDF"""
+    # Add metadata - detect if it's loan or investment based on path/filename
+    is_investment = is_investment_dir or "_scheme_guide" in pdf_path.stem
+    
+    for doc in docs:
+        doc.metadata["source"] = pdf_path.name
+        if is_investment:
+            doc.metadata["scheme_type"] = pdf_path.stem.replace("_scheme_guide", "")
+            doc.metadata["document_type"] = "investment"
+        else:
+            doc.metadata["loan_type"] = pdf_path.stem.replace("_product_guide", "")
+            doc.metadata["document_type"] = "loan"
+    
+    return docs
+
+
+def chunk_with_cache(
+    documents: List[Document],
+    split: Callable[[List[Document]], List[Document]],
+    cache_dir: Optional[Path],
+    cache_tag: str,
+) -> Tuple[List[Document], int]:
+    """
+    Chunk documents one page at a time, reusing chunks persisted for identical pages
+    
+    Pages are keyed by a BLAKE2b hash of the chunker settings (cache_tag),
+    page metadata and page content, so only new or changed pages are split.
+    
+    Args:
+        documents: Pages to chunk
+        split: Chunking function applied to a single-page list on cache misses
+        cache_dir: Directory holding pickled chunk lists (None disables caching)
+        cache_tag: Identifies the chunker and its settings
+        
+    Returns:
+        Tuple of (chunks in page order, number of cache hits)
+    """
+    if cache_dir is None:
+        return split(documents), 0
+    
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    chunks: List[Document] = []
+    hits = 0
+    for doc in documents:
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(cache_tag.encode())
+        digest.update(json.dumps(doc.metadata, sort_keys=True, default=str).encode())
+        digest.update(doc.page_content.encode())
+        cache_path = cache_dir / f"{digest.hexdigest()}.pkl"
+        
+        if cache_path.exists():
+            try:
+                with cache_path.open("rb") as f:
+                    chunks.extend(pickle.load(f))
+                hits += 1
+                continue
+            except Exception as e:
+                logger.warning("chunk_cache_read_failed", path=str(cache_path), error=str(e))
+        
+        doc_chunks = split([doc])
+        chunks.extend(doc_chunks)
+        try:
+            with cache_path.open("wb") as f:
+                pickle.dump(doc_chunks, f, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            logger.warning("chunk_cache_write_failed", path=str(cache_path), error=str(e))
+    
+    return chunks, hits
+
+
+def _semantic_cache_tag(chunker: SemanticChunker) -> str:
+    """chunk_with_cache tag for a semantic chunker, so changed settings miss the cache"""
+    return f"semantic|{chunker.min_chunk_size}|{chunker.max_chunk_size}"
+
+
+def _load_and_chunk_pdf(
+    pdf_path: Path,
+    is_investment_dir: bool,
+    chunker: SemanticChunker,
+    chunk_cache_dir: Optional[Path] = None,
+) -> Tuple[str, int, List[Document]]:
+    """Worker: load one PDF and semantically chunk its pages with the service's chunker"""
+    try:
+        pages = load_pdf_file(pdf_path, is_investment_dir)
+    except Exception as e:
+        logger.error("pdf_load_error", file=pdf_path.name, error=str(e))
+        return pdf_path.name, 0, []
+    chunks, _ = chunk_with_cache(pages, chunker.chunk_documents, chunk_cache_dir, _semantic_cache_tag(chunker))
+    return pdf_path.name, len(pages), chunks
 
 
 class RAGService:
@@ -51,38 +323,35 @@ class RAGService:
         persist_directory: str = "./chroma_db",
         collection_name: str = "loan_products",
         chunk_size: int = 1000,
-        chunk_overlap: int = 200
+        chunk_overlap: int = 200,
+        chunk_cache_dir: Optional[str] = None
     ):
         """
         Initialize RAG service
         
         Args:
-            documents_path: Path to documents folder (default: ../backend/documents/loan_products/)
+            documents_path: Path to documents folder (default: backend/documents/loan_products/)
             persist_directory: Path to store vector database
             collection_name: Name of the Chroma collection
             chunk_size: Size of text chunks for splitting
             chunk_overlap: Overlap between chunks
+            chunk_cache_dir: Where per-page chunk results are cached, relative to backend/ai
+                (default: chunk_cache/<collection_name>)
         """
         # Set default documents path to backend/documents/loan_products
         if documents_path is None:
-            ai_dir = Path(__file__).parent.parent
-            documents_path = ai_dir.parent / "backend" / "documents" / "loan_products"
+            documents_path = _DOCUMENTS_DIR / "loan_products"
         
         self.documents_path = Path(documents_path)
         self.persist_directory = persist_directory
         self.collection_name = collection_name
         self.chunk_size = chunk_size
         self.chunk_overlap = chunk_overlap
+        self.chunk_cache_dir = _AI_DIR / (chunk_cache_dir or Path("chunk_cache") / collection_name)
         
-        # Initialize embeddings - use sentence-transformers (reliable, no external dependencies)
+        # Initialize embeddings - int8 ONNX MiniLM, falling back to sentence-transformers
         try:
-            from langchain_community.embeddings import HuggingFaceEmbeddings
-            self.embeddings = HuggingFaceEmbeddings(
-                model_name="sentence-transformers/all-MiniLM-L6-v2",
-                model_kwargs={'device': 'cpu'},
-                encode_kwargs={'normalize_embeddings': True}
-            )
-            logger.info("rag_service_init", embedding_model="all-MiniLM-L6-v2")
+            self.embeddings = build_embeddings()
         except Exception as e:
             logger.error("embeddings_init_failed", error=str(e))
             raise
@@ -106,11 +375,27 @@ class RAGService:
         self._context_cache: OrderedDict[str, Tuple[str, float]] = OrderedDict()
         self._cache_max_size = 128
         self._cache_ttl_seconds = 120
+        # Retrieved documents per (query, k, filter); valid until the vector store changes
+        self._retrieval_cache: OrderedDict[str, List[Any]] = OrderedDict()
+        self._retrieval_cache_max_size = 2048
+        # Query embeddings per normalized query; independent of the vector store contents
+        self._embedding_cache: OrderedDict[str, List[float]] = OrderedDict()
+        self._embedding_cache_max_size = 2048
+        # Paraphrase tier behind _context_cache: (unit query vector, scope, context cache key)
+        self._semantic_cache: deque = deque(maxlen=self._cache_max_size)
+        self._semantic_cache_threshold = 0.92
         
-    def load_pdf_documents(self) -> List[Document]:
+    def load_pdf_documents(self, max_workers: Optional[int] = None) -> List[Document]:
         """
         Load all PDF documents from the documents folder
         
+        Files are parsed in spawned worker processes when called from the main
+        thread (pypdf is GIL-bound), serially otherwise; metadata is applied
+        here after collection.
+        
+        Args:
+            max_workers: Number of worker processes (default: os.cpu_count())
+        
         Returns:
             List of Document objects
         """
@@ -118,32 +403,100 @@ class RAGService:
         pdf_files = list(self.documents_path.glob("*.pdf"))
         
         logger.info("loading_pdfs", count=len(pdf_files), path=str(self.documents_path))
+        if not pdf_files:
+            return documents
         
-        for pdf_path in pdf_files:
-            try:
-                loader = PyPDFLoader(str(pdf_path))
-                docs = loader.load()
-                
-                # Add metadata - detect if it's loan or investment based on path/filename
-                is_investment = "investment" in str(self.documents_path).lower() or "_scheme_guide" in pdf_path.stem
-                
-                for doc in docs:
-                    doc.metadata["source"] = pdf_path.name
-                    if is_investment:
-                        doc.metadata["scheme_type"] = pdf_path.stem.replace("_scheme_guide", "")
-                        doc.metadata["document_type"] = "investment"
-                    else:
-                        doc.metadata["loan_type"] = pdf_path.stem.replace("_product_guide", "")
-                        doc.metadata["document_type"] = "loan"
-                
-                documents.extend(docs)
-                logger.info("pdf_loaded", file=pdf_path.name, pages=len(docs), type="investment" if is_investment else "loan")
-                
-            except Exception as e:
-                logger.error("pdf_load_error", file=pdf_path.name, error=str(e))
+        is_investment_dir = self._is_investment_dir()
+        max_workers = min(max_workers or os.cpu_count() or 1, len(pdf_files))
+        
+        for pdf_path, docs, error in _map_pdf_pages(pdf_files, max_workers):
+            if error is not None:
+                logger.error("pdf_load_error", file=pdf_path.name, error=error)
+                continue
+            documents.extend(tag_pdf_pages(pdf_path, docs, is_investment_dir))
+            is_investment = is_investment_dir or "_scheme_guide" in pdf_path.stem
+            logger.info("pdf_loaded", file=pdf_path.name, pages=len(docs), type="investment" if is_investment else "loan")
         
         return documents
     
+    def ingest_documents(self, batch_size: int = 128, max_workers: Optional[int] = None) -> Tuple[int, int]:
+        """
+        Load, chunk and embed every PDF as a pipeline
+        
+        Worker processes keep parsing/chunking the remaining PDFs while this
+        process embeds and persists finished chunks in batches, so wall time is
+        roughly the slower stage instead of the sum of both.
+        
+        Args:
+            batch_size: Chunks embedded per add_documents call
+            max_workers: Number of worker processes (default: os.cpu_count())
+            
+        Returns:
+            Tuple of (total pages loaded, total chunks stored)
+        """
+        from langchain_community.vectorstores.utils import filter_complex_metadata
+        
+        vectorstore = Chroma(
+            collection_name=self.collection_name,
+            embedding_function=self.embeddings,
+            persist_directory=self.persist_directory
+        )
+        
+        total_pages = 0
+        total_chunks = 0
+        pending: List[Document] = []
+        
+        def flush(batch: List[Document]) -> None:
+            nonlocal total_chunks
+            vectorstore.add_documents(filter_complex_metadata(batch))
+            total_chunks += len(batch)
+        
+        try:
+            for page_count, file_chunks in self._iter_chunked_pdfs(max_workers):
+                total_pages += page_count
+                pending.extend(file_chunks)
+                while len(pending) >= batch_size:
+                    flush(pending[:batch_size])
+                    del pending[:batch_size]
+            if pending:
+                flush(pending)
+        except Exception as e:
+            logger.error("vectorstore_creation_error", error=str(e))
+            raise
+        
+        self.vectorstore = vectorstore if total_chunks else None
+        self.clear_caches()
+        logger.info("vectorstore_created",
+                   document_count=total_chunks,
+                   collection=self.collection_name)
+        return total_pages, total_chunks
+    
+    def _iter_chunked_pdfs(self, max_workers: Optional[int] = None):
+        """Yield (page_count, chunks) per PDF in file order while workers process the rest"""
+        pdf_files = sorted(self.documents_path.glob("*.pdf"))
+        if not pdf_files:
+            return
+        
+        is_investment_dir = self._is_investment_dir()
+        max_workers = min(max_workers or os.cpu_count() or 1, len(pdf_files))
+        
+        logger.info("loading_pdfs_parallel", count=len(pdf_files), workers=max_workers, path=str(self.documents_path))
+        
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results = executor.map(
+                _load_and_chunk_pdf,
+                pdf_files,
+                [is_investment_dir] * len(pdf_files),
+                [self.semantic_chunker] * len(pdf_files),
+                [self.chunk_cache_dir] * len(pdf_files),
+            )
+            for file_name, page_count, file_chunks in results:
+                logger.info("pdf_loaded", file=file_name, pages=page_count, chunks=len(file_chunks))
+                yield page_count, file_chunks
+    
+    def _is_investment_dir(self) -> bool:
+        return "investment" in str(self.documents_path).lower()
+    
     def chunk_documents(self, documents: List[Document], use_semantic: bool = True) -> List[Document]:
         """
         Split documents into chunks using semantic chunking
@@ -157,16 +510,28 @@ class RAGService:
         """
         if use_semantic:
             # Use semantic chunker for intelligent, section-based chunking
-            chunks = self.semantic_chunker.chunk_documents(documents)
+            chunks, cache_hits = chunk_with_cache(
+                documents,
+                self.semantic_chunker.chunk_documents,
+                self.chunk_cache_dir,
+                _semantic_cache_tag(self.semantic_chunker),
+            )
             logger.info("documents_chunked_semantic", 
                        original_count=len(documents),
-                       chunk_count=len(chunks))
+                       chunk_count=len(chunks),
+                       cache_hits=cache_hits)
         else:
             # Fallback to character-based splitting
-            chunks = self.text_splitter.split_documents(documents)
+            chunks, cache_hits = chunk_with_cache(
+                documents,
+                self.text_splitter.split_documents,
+                self.chunk_cache_dir,
+                f"character|{self.chunk_size}|{self.chunk_overlap}",
+            )
             logger.info("documents_chunked_character", 
                        original_count=len(documents),
-                       chunk_count=len(chunks))
+                       chunk_count=len(chunks),
+                       cache_hits=cache_hits)
         return chunks
     
     def create_vector_store(self, documents: List[Document]) -> Chroma:
@@ -234,11 +599,14 @@ class RAGService:
         Args:
             force_rebuild: If True, rebuild vector store even if exists
         """
+        self.clear_caches()
+        
         # Try to load existing vector store
         if not force_rebuild:
             self.vectorstore = self.load_vector_store()
             if self.vectorstore:
                 logger.info("rag_initialized", mode="loaded_existing")
+                self.warm_up()
                 return
         
         # Load and process documents
@@ -255,6 +623,24 @@ class RAGService:
         # Create vector store
         self.vectorstore = self.create_vector_store(chunks)
         logger.info("rag_initialized", mode="created_new", chunks=len(chunks))
+        self.warm_up()
+    
+    def warm_up(self) -> None:
+        """
+        Run one embedding and one search so model weights and the Chroma index
+        are loaded before the first user query (bypasses the retrieval cache)
+        """
+        if not self.vectorstore:
+            return
+        start_time = time.time()
+        try:
+            self.embeddings.embed_query("warmup")
+            self.vectorstore.similarity_search("warmup", k=1)
+            logger.info("rag_warmup_complete",
+                       collection=self.collection_name,
+                       duration_seconds=round(time.time() - start_time, 2))
+        except Exception as e:
+            logger.warning("rag_warmup_failed", collection=self.collection_name, error=str(e))
     
     def retrieve(
         self,
@@ -277,6 +663,11 @@ class RAGService:
             logger.error("vectorstore_not_initialized")
             return []
         
+        cache_key = self._make_cache_key(query, k, filter)
+        cached_results = self._get_cached_retrieval(cache_key)
+        if cached_results is not None:
+            return cached_results
+        
         try:
             # Demo logging: RAG retrieval start
             demo_logger.rag_retrieval(
@@ -295,9 +686,7 @@ class RAGService:
                     filter=filter,
                     k=k
                 )
-                results = self.vectorstore.similarity_search(
-                    query, k=k, filter=filter
-                )
+                results = self._search(query, k, filter=filter)
                 
                 # Log retrieved document metadata for verification
                 if results:
@@ -328,12 +717,13 @@ class RAGService:
                             query=query[:100]
                         )
             else:
-                results = self.vectorstore.similarity_search(query, k=k)
+                results = self._search(query, k)
             
             # Demo logging: RAG results
             demo_logger.rag_results(results)
             
             logger.info("retrieval_completed", query_length=len(query), results=len(results))
+            self._store_cached_retrieval(cache_key, results)
             return results
             
         except Exception as e:
@@ -360,6 +750,11 @@ class RAGService:
             logger.error("vectorstore_not_initialized")
             return []
         
+        cache_key = self._make_cache_key(query, k, None) + "|scores"
+        cached_results = self._get_cached_retrieval(cache_key)
+        if cached_results is not None:
+            return cached_results
+        
         try:
             # Demo logging: RAG retrieval with scores
             demo_logger.rag_retrieval(
@@ -369,7 +764,7 @@ class RAGService:
                 with_scores=True,
             )
             
-            results = self.vectorstore.similarity_search_with_score(query, k=k)
+            results = self._search(query, k, with_scores=True)
             
             # Extract documents and scores for demo logging
             documents = [doc for doc, score in results]
@@ -379,23 +774,56 @@ class RAGService:
             logger.info("retrieval_with_scores_completed", 
                        query_length=len(query),
                        results=len(results))
+            self._store_cached_retrieval(cache_key, results)
             return results
         except Exception as e:
             logger.error("retrieval_error", error=str(e))
             demo_logger.error("RAG retrieval with scores failed", error=str(e))
             return []
     
+    def _embed_query(self, query: str) -> List[float]:
+        """Embed a query once per normalized text, reusing cached vectors"""
+        cache_key = self._normalize_query(query)
+        embedding = self._embedding_cache.get(cache_key)
+        if embedding is not None:
+            self._embedding_cache.move_to_end(cache_key)
+            return embedding
+        
+        embedding = self.embeddings.embed_query(query)
+        self._embedding_cache[cache_key] = embedding
+        if len(self._embedding_cache) > self._embedding_cache_max_size:
+            self._embedding_cache.popitem(last=False)
+        return embedding
+    
+    def _search(
+        self,
+        query: str,
+        k: int,
+        with_scores: bool = False,
+        filter: Optional[Dict[str, Any]] = None
+    ) -> List[Any]:
+        """Search the vector store with a pre-computed query embedding"""
+        embedding = self._embed_query(query)
+        if with_scores:
+            return self.vectorstore.similarity_search_by_vector_with_relevance_scores(
+                embedding, k=k, filter=filter
+            )
+        return self.vectorstore.similarity_search_by_vector(embedding, k=k, filter=filter)
+    
     def _normalize_query(self, query: str) -> str:
         return " ".join(query.split()).lower()
 
-    def _make_cache_key(self, query: str, k: int, metadata_filter: Optional[Dict[str, Any]]) -> str:
+    def _make_cache_scope(self, k: int, metadata_filter: Optional[Dict[str, Any]]) -> str:
         filter_part = ""
         if metadata_filter:
             try:
                 filter_part = json.dumps(metadata_filter, sort_keys=True)
             except TypeError:
                 filter_part = str(sorted(metadata_filter.items()))
-        return f"{self._normalize_query(query)}|k={k}|f={filter_part}"
+        return f"k={k}|f={filter_part}"
+
+    def _make_cache_key(self, query: str, k: int, metadata_filter: Optional[Dict[str, Any]]) -> str:
+        return f"{self._normalize_query(query)}|{self._make_cache_scope(k, metadata_filter)}"
 
     def _get_cached_context(self, cache_key: str) -> Optional[str]:
         cached = self._context_cache.get(cache_key)
@@ -416,6 +844,70 @@ class RAGService:
             evicted_key, _ = self._context_cache.popitem(last=False)
             logger.debug("rag_context_cache_evict", cache_key=evicted_key)
 
+    def _unit_query_vector(self, query: str) -> np.ndarray:
+        vector = np.asarray(self._embed_query(query), dtype=np.float32)
+        return vector / max(float(np.linalg.norm(vector)), 1e-12)
+
+    def _get_semantic_context(self, query: str, scope: str) -> Optional[str]:
+        """Serve a cached context for a paraphrase of an earlier query with the same k/filter"""
+        entries = [entry for entry in self._semantic_cache if entry[1] == scope]
+        if not entries:
+            return None
+        try:
+            similarities = np.stack([entry[0] for entry in entries]) @ self._unit_query_vector(query)
+        except Exception as e:
+            logger.warning("rag_semantic_cache_lookup_failed", error=str(e))
+            return None
+        best = int(np.argmax(similarities))
+        if similarities[best] < self._semantic_cache_threshold:
+            return None
+        context = self._get_cached_context(entries[best][2])
+        if context is None:
+            # Exact-match entry expired; its paraphrase entry is stale too
+            stale = entries[best]
+            self._semantic_cache = deque(
+                (entry for entry in self._semantic_cache if entry is not stale),
+                maxlen=self._semantic_cache.maxlen,
+            )
+            return None
+        logger.info("rag_context_semantic_cache_hit", similarity=round(float(similarities[best]), 3))
+        return context
+
+    def _store_semantic_entry(self, query: str, scope: str, cache_key: str) -> None:
+        try:
+            self._semantic_cache.append((self._unit_query_vector(query), scope, cache_key))
+        except Exception as e:
+            logger.warning("rag_semantic_cache_store_failed", error=str(e))
+
+    def _get_cached_retrieval(self, cache_key: str) -> Optional[List[Any]]:
+        cached = self._retrieval_cache.get(cache_key)
+        if cached is None:
+            return None
+        self._retrieval_cache.move_to_end(cache_key)
+        logger.info("rag_retrieval_cache_hit", cache_key=cache_key)
+        return list(cached)
+
+    def _store_cached_retrieval(self, cache_key: str, results: List[Any]) -> None:
+        self._retrieval_cache[cache_key] = list(results)
+        self._retrieval_cache.move_to_end(cache_key)
+        if len(self._retrieval_cache) > self._retrieval_cache_max_size:
+            self._retrieval_cache.popitem(last=False)
+
+    def clear_caches(self) -> None:
+        """Drop cached retrievals and contexts (call whenever the vector store changes)"""
+        self._retrieval_cache.clear()
+        self._context_cache.clear()
+        self._semantic_cache.clear()
+
+    @staticmethod
+    def _type_label(metadata: Dict[str, Any]) -> str:
+        """Human-readable loan/scheme label for a chunk's source header"""
+        if metadata.get("document_type", "") == "investment":
+            scheme_type = metadata.get("scheme_type", "")
+            return scheme_type.replace("_", " ").title() if scheme_type else "Investment"
+        loan_type = metadata.get("loan_type", "")
+        return loan_type.replace("_", " ").title() if loan_type else "Loan"
+
     def get_context_for_query(self, query: str, k: int = 4, filter: Optional[Dict[str, Any]] = None) -> str:
         """
         Get formatted context string for a query
@@ -428,8 +920,11 @@ class RAGService:
         Returns:
             Formatted context string
         """
-        cache_key = self._make_cache_key(query, k, filter)
+        scope = self._make_cache_scope(k, filter)
+        cache_key = f"{self._normalize_query(query)}|{scope}"
         cached_context = self._get_cached_context(cache_key)
+        if cached_context is None:
+            cached_context = self._get_semantic_context(query, scope)
         if cached_context is not None:
             return cached_context
 
@@ -438,24 +933,16 @@ class RAGService:
         if not documents:
             return ""
         
-        context_parts = []
-        for i, doc in enumerate(documents, 1):
-            source = doc.metadata.get("source", "Unknown")
-            loan_type = doc.metadata.get("loan_type", "")
-            scheme_type = doc.metadata.get("scheme_type", "")
-            doc_type = doc.metadata.get("document_type", "")
-            
-            # Format the type label
-            if doc_type == "investment":
-                type_label = scheme_type.replace("_", " ").title() if scheme_type else "Investment"
-            else:
-                type_label = loan_type.replace("_", " ").title() if loan_type else "Loan"
-            
-            context_parts.append(
-                f"[Source {i}: {type_label} - {source}]\n{doc.page_content}\n"
-            )
+        # Single pass over metadata into parallel columns, then one join
+        metadatas = [doc.metadata for doc in documents]
+        sources = [m.get("source", "Unknown") for m in metadatas]
+        type_labels = [self._type_label(m) for m in metadatas]
+        contents = [doc.page_content for doc in documents]
         
-        context = "\n".join(context_parts)
+        context = "\n".join(
+            f"[Source {i}: {type_label} - {source}]\n{content}\n"
+            for i, (source, type_label, content) in enumerate(zip(sources, type_labels, contents), 1)
+        )
         logger.info(
             "context_generated",
             query_length=len(query),
@@ -465,12 +952,20 @@ class RAGService:
             metadata_filtered=bool(filter),
         )
         self._store_cached_context(cache_key, context)
+        self._store_semantic_entry(query, scope, cache_key)
         
         return context
 
 
+_COLLECTIONS = {"loan": "loan_products", "investment": "investment_schemes"}
+_LANGUAGE_SUFFIXES = {"en-IN": "", "hi-IN": "_hindi"}
+
 # Global RAG service instances cache: (documents_type, language) -> RAGService
 _rag_service_cache: Dict[Tuple[str, str], RAGService] = {}
+# One lock per key so concurrent first requests build each service once,
+# without a slow initialize() for one collection blocking the others
+_rag_service_locks: Dict[Tuple[str, str], threading.Lock] = {}
+_rag_service_locks_guard = threading.Lock()
 
 
 def get_rag_service(documents_type: str = None, language: str = "en-IN") -> RAGService:
@@ -483,46 +978,33 @@ def get_rag_service(documents_type: str = None, language: str = "en-IN") -> RAGS
         language: "en-IN" or "hi-IN" - determines which language vector database to use.
                  Defaults to "en-IN".
     """
-    global _rag_service_cache
-    
-    if documents_type is None:
+    if documents_type not in _COLLECTIONS:
         documents_type = "loan"
-    
-    # Normalize language code
-    if language not in ["en-IN", "hi-IN"]:
+    if language not in _LANGUAGE_SUFFIXES:
         language = "en-IN"  # Default to English if invalid language
     
-    # Create cache key
     cache_key = (documents_type, language)
+    rag_service = _rag_service_cache.get(cache_key)
+    if rag_service is not None:
+        return rag_service
     
-    # Check if service already exists in cache
-    if cache_key in _rag_service_cache:
-        return _rag_service_cache[cache_key]
+    with _rag_service_locks_guard:
+        key_lock = _rag_service_locks.setdefault(cache_key, threading.Lock())
     
-    # Determine documents path and collection name based on type and language
-    ai_dir = Path(__file__).parent.parent
-    base_docs_dir = ai_dir.parent / "backend" / "documents"
+    with key_lock:
+        rag_service = _rag_service_cache.get(cache_key)
+        if rag_service is None:
+            rag_service = _create_rag_service(documents_type, language)
+            _rag_service_cache[cache_key] = rag_service
     
-    if language == "hi-IN":
-        # Hindi documents
-        if documents_type == "investment":
-            documents_path = base_docs_dir / "investment_schemes_hindi"
-            collection_name = "investment_schemes_hindi"
-            persist_directory = "./chroma_db/investment_schemes_hindi"
-        else:
-            documents_path = base_docs_dir / "loan_products_hindi"
-            collection_name = "loan_products_hindi"
-            persist_directory = "./chroma_db/loan_products_hindi"
-    else:
-        # English documents (default)
-        if documents_type == "investment":
-            documents_path = base_docs_dir / "investment_schemes"
-            collection_name = "investment_schemes"
-            persist_directory = "./chroma_db/investment_schemes"
-        else:
-            documents_path = base_docs_dir / "loan_products"
-            collection_name = "loan_products"
-            persist_directory = "./chroma_db/loan_products"
+    return rag_service
+
+
+def _create_rag_service(documents_type: str, language: str) -> RAGService:
+    """Build and initialize the RAG service for one (documents_type, language) pair"""
+    collection_name = _COLLECTIONS[documents_type] + _LANGUAGE_SUFFIXES[language]
+    documents_path = _DOCUMENTS_DIR / collection_name
+    persist_directory = f"./chroma_db/{collection_name}"
     
     # Create new service
     rag_service = RAGService(
@@ -534,12 +1016,19 @@ def get_rag_service(documents_type: str = None, language: str = "en-IN") -> RAGS
     rag_service._language = language  # Store language for reference
     rag_service.initialize()
     
-    # Cache the service
-    _rag_service_cache[cache_key] = rag_service
-    
     return rag_service
 
 
+def preload_rag_services() -> None:
+    """Create and warm every (documents_type, language) RAG service; blocking, run off the event loop"""
+    for documents_type in ("loan", "investment"):
+        for language in ("en-IN", "hi-IN"):
+            try:
+                get_rag_service(documents_type=documents_type, language=language)
+            except Exception as e:
+                logger.warning("rag_preload_failed", documents_type=documents_type, language=language, error=str(e))
+
+
 def initialize_rag(force_rebuild: bool = False) -> None:
     """Initialize RAG service (to be called on startup)"""
     service = get_rag_service()
@@ -4,6 +4,8 @@ from .banking_tools import (
     get_user_accounts,
     get_transaction_history,
     download_statement,
+    call_tool,
+    call_tool_many,
 )
 from .upi_tools import (
     resolve_upi_id,
@@ -15,6 +17,8 @@ __all__ = [
     "get_user_accounts",
     "get_transaction_history",
     "download_statement",
+    "call_tool",
+    "call_tool_many",
     "resolve_upi_id",
     "initiate_upi_payment",
 ]
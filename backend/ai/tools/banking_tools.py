@@ -2,29 +2,278 @@
 Simple banking tools for AI agent
 Uses existing backend database functions
 """
+import asyncio
+import contextvars
+import copy
+import functools
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager, contextmanager
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from typing import Any, Callable, Dict, List, Optional
 from datetime import datetime, timedelta
+from enum import Enum
+from itertools import chain
+from operator import attrgetter
 
 # Add project root to sys.path so 'db' is importable
 project_root = Path(__file__).resolve().parent.parent.parent.parent
 if str(project_root) not in sys.path:
     sys.path.insert(0, str(project_root))
 
-from langchain.tools import tool
+from langchain_core.tools import StructuredTool
 from pydantic import BaseModel, Field
 
-# Import backend functions
-from db.repositories import accounts as account_repo
-from db.repositories import transactions as transaction_repo
-from utils.db_helper import get_db
-
 # Import demo logging
-sys.path.insert(0, str(Path(__file__).parent.parent))
+ai_root = Path(__file__).resolve().parent.parent
+if str(ai_root) not in sys.path:
+    sys.path.insert(0, str(ai_root))
 from utils.demo_logging import demo_logger
 
+# Repositories and utils.db_helper (which builds the DB engine) are imported
+# inside the tool bodies so importing this module stays cheap at cold start
+
+# Repository calls are blocking SQLAlchemy I/O; async callers run them here
+_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="banking_tools")
+
+
+# Tool name -> plain body, for agents that call tools with already well-typed arguments
+_FAST_TOOLS: Dict[str, Callable[..., Dict[str, Any]]] = {}
+
+# Tool input schemas are static, so their JSON schemas are generated once per tool
+_TOOL_ARGS: Dict[str, Dict[str, Any]] = {}
+
+
+class _CachedSchemaTool(StructuredTool):
+    """StructuredTool that serves its args JSON schema from _TOOL_ARGS"""
+    
+    @property
+    def args(self) -> Dict[str, Any]:
+        return _TOOL_ARGS[self.name]
+
+
+def _executor_tool(name: str, args_schema: type[BaseModel], func) -> StructuredTool:
+    """Wrap a blocking tool body so ainvoke() runs it on _EXECUTOR instead of the event loop"""
+    async def coroutine(**kwargs):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            _EXECUTOR, contextvars.copy_context().run, functools.partial(func, **kwargs)
+        )
+    
+    _FAST_TOOLS[name] = func
+    _TOOL_ARGS[name] = args_schema.model_json_schema()["properties"]
+    return _CachedSchemaTool.from_function(
+        func=func,
+        coroutine=coroutine,
+        name=name,
+        description=func.__doc__,
+        args_schema=args_schema,
+    )
+
+
+# Read-aside cache for account lookups, scoped to one chat turn by
+# banking_tools_session(). Transfers are written by the main API in another
+# process, so nothing survives into the next turn; executor threads reach the
+# turn's dict through the copied context.
+_turn_read_cache: contextvars.ContextVar = contextvars.ContextVar("banking_tools_read_cache", default=None)
+_read_cache_lock = threading.Lock()
+
+
+def _turn_cached(kind: str, param: str):
+    """Cache successful results of a single-argument tool body for the rest of the chat turn"""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            cache = _turn_read_cache.get()
+            if cache is None:
+                return func(*args, **kwargs)
+            
+            cache_key = (kind, args[0] if args else kwargs[param])
+            with _read_cache_lock:
+                cached = cache.get(cache_key)
+            if cached is not None:
+                return copy.deepcopy(cached)
+            
+            result = func(*args, **kwargs)
+            if result.get("success"):
+                with _read_cache_lock:
+                    cache[cache_key] = copy.deepcopy(result)
+            return result
+        return wrapper
+    return decorator
+
+
+def invalidate(account_number: str) -> None:
+    """Drop this turn's cached balance and account listings that include account_number (call after writes)"""
+    cache = _turn_read_cache.get()
+    if cache is None:
+        return
+    with _read_cache_lock:
+        cache.pop(("balance", account_number), None)
+        stale = [
+            key for key, result in cache.items()
+            if key[0] == "accounts"
+            and any(acc.get("account_number") == account_number for acc in result.get("accounts", []))
+        ]
+        for key in stale:
+            del cache[key]
+
+
+async def call_tool(name: str, **kwargs) -> Dict[str, Any]:
+    """Run a banking tool body on _EXECUTOR, skipping StructuredTool validation and callbacks"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _EXECUTOR, contextvars.copy_context().run, functools.partial(_FAST_TOOLS[name], **kwargs)
+    )
+
+
+async def call_tool_many(name: str, calls: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Run several calls of one tool concurrently; results come back in call order.
+    
+    A Session must not be used from two threads at once, so each call opens its
+    own session instead of sharing the turn's one from banking_tools_session().
+    """
+    loop = asyncio.get_running_loop()
+    func = _FAST_TOOLS[name]
+    
+    def run_private(kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        # Runs inside a copied context, so this only hides the shared session here
+        _current_session.set(None)
+        return func(**kwargs)
+    
+    return await asyncio.gather(*(
+        loop.run_in_executor(_EXECUTOR, contextvars.copy_context().run, run_private, kwargs)
+        for kwargs in calls
+    ))
+
+
+# Session shared by every tool call inside banking_tools_session() (one chat turn).
+# Executor dispatch copies the caller's context so worker threads see it.
+_current_session: contextvars.ContextVar = contextvars.ContextVar("banking_tools_session", default=None)
+
+
+@asynccontextmanager
+async def banking_tools_session():
+    """Let all banking tool calls in the enclosed block share one DB session and read cache"""
+    from utils.db_helper import SessionLocal
+    
+    session = SessionLocal()
+    token = _current_session.set(session)
+    cache_token = _turn_read_cache.set({})
+    try:
+        yield session
+    finally:
+        _turn_read_cache.reset(cache_token)
+        _current_session.reset(token)
+        session.close()
+
+
+@contextmanager
+def _tool_session():
+    """Yield the turn's shared session, or a private one outside banking_tools_session()"""
+    session = _current_session.get()
+    if session is None:
+        from utils.db_helper import get_db
+        
+        with get_db() as db:
+            yield db
+        return
+    try:
+        yield session
+    finally:
+        # Tools only read; end the transaction so no lock or connection is held
+        # across LLM calls and the next tool sees fresh rows
+        session.rollback()
+
+
+def shutdown_executor() -> None:
+    """Stop the DB worker threads (call on application shutdown)"""
+    _EXECUTOR.shutdown(wait=False, cancel_futures=True)
+
+
+def _format_txn_date(d: datetime) -> str:
+    """Format as "%Y-%m-%d %H:%M" without going through strftime's locale machinery"""
+    return f"{d.year:04d}-{d.month:02d}-{d.day:02d} {d.hour:02d}:{d.minute:02d}"
+
+# Column value type -> to-string accessor, specialized on first sight of each type
+_TYPE_ACCESSORS: Dict[type, Callable[[Any], str]] = {}
+
+
+def _make_accessor(sample: Any) -> Callable[[Any], str]:
+    """Return attrgetter('value') for enum columns and str otherwise, cached per type"""
+    accessor = _TYPE_ACCESSORS.get(type(sample))
+    if accessor is None:
+        accessor = attrgetter("value") if isinstance(sample, Enum) else str
+        _TYPE_ACCESSORS[type(sample)] = accessor
+    return accessor
+
+
+def _serialize_accounts(accounts) -> List[Dict[str, Any]]:
+    """Convert account rows to tool output dicts"""
+    if not accounts:
+        return []
+    
+    type_to_str = _make_accessor(accounts[0].account_type)
+    status_to_str = _make_accessor(accounts[0].status)
+    return [
+        {
+            "id": str(account.id),  # Include account ID for frontend matching
+            "accountId": str(account.id),  # Also include as accountId for compatibility
+            "account_number": account.account_number,
+            "accountNumber": account.account_number,  # Include camelCase version too
+            "account_type": account.account_type,
+            "accountType": type_to_str(account.account_type),
+            "balance": float(account.balance),
+            "currency": "INR",
+            "status": status_to_str(account.status),
+        }
+        for account in accounts
+    ]
+
+
+def _serialize_txns(transactions, include_ref: bool = False) -> List[Dict[str, Any]]:
+    """
+    Drain transaction rows (a list or a streaming cursor) into tool output dicts in one pass
+    
+    Expects rows from get_transaction_history_projection, whose amount column is already a float.
+    """
+    rows = iter(transactions)
+    first = next(rows, None)
+    if first is None:
+        return []
+    
+    # Column types are uniform across rows, so resolve enum handling once
+    type_to_str = _make_accessor(first.transaction_type)
+    status_to_str = _make_accessor(first.status)
+    if include_ref:
+        return [
+            {
+                "date": _format_txn_date(t.occurred_at),
+                "type": type_to_str(t.transaction_type),
+                "amount": t.amount,
+                "currency": t.currency_code,
+                "description": t.description or "",
+                "status": status_to_str(t.status),
+                "counterparty": t.counterparty_name or "",
+                "reference_id": t.reference_id or "",
+            }
+            for t in chain((first,), rows)
+        ]
+    return [
+        {
+            "date": _format_txn_date(t.occurred_at),
+            "type": type_to_str(t.transaction_type),
+            "amount": t.amount,
+            "currency": t.currency_code,
+            "description": t.description or "",
+            "status": status_to_str(t.status),
+            "counterparty": t.counterparty_name or "",
+        }
+        for t in chain((first,), rows)
+    ]
+
 
 # Tool input schemas
 class GetBalanceInput(BaseModel):
@@ -52,8 +301,8 @@ class DownloadStatementInput(BaseModel):
     period_type: Optional[str] = Field(default="custom", description="Type of period: 'week', 'month', 'year', or 'custom'")
 
 
-@tool("get_user_accounts", args_schema=GetUserAccountsInput)
-def get_user_accounts(user_id: str) -> Dict[str, Any]:
+@_turn_cached("accounts", "user_id")
+def _get_user_accounts_sync(user_id: str) -> Dict[str, Any]:
     """
     Get all accounts for a user.
     Use this when the user asks about their accounts, or to find a specific account type.
@@ -65,7 +314,8 @@ def get_user_accounts(user_id: str) -> Dict[str, Any]:
         Dictionary with list of all user accounts
     """
     try:
-        with get_db() as db:
+        from db.repositories import accounts as account_repo
+        with _tool_session() as db:
             accounts = account_repo.list_accounts_for_user(db, user_id)
             
             if not accounts:
@@ -74,19 +324,7 @@ def get_user_accounts(user_id: str) -> Dict[str, Any]:
                     "error": "No accounts found for user"
                 }
             
-            accounts_list = []
-            for account in accounts:
-                accounts_list.append({
-                    "id": str(account.id),  # Include account ID for frontend matching
-                    "accountId": str(account.id),  # Also include as accountId for compatibility
-                    "account_number": account.account_number,
-                    "accountNumber": account.account_number,  # Include camelCase version too
-                    "account_type": account.account_type,
-                    "accountType": account.account_type.value if hasattr(account.account_type, 'value') else str(account.account_type),
-                    "balance": float(account.balance),
-                    "currency": "INR",
-                    "status": account.status.value if hasattr(account.status, 'value') else str(account.status)
-                })
+            accounts_list = _serialize_accounts(accounts)
             
             return {
                 "success": True,
@@ -100,8 +338,8 @@ def get_user_accounts(user_id: str) -> Dict[str, Any]:
         }
 
 
-@tool("get_account_balance", args_schema=GetBalanceInput)
-def get_account_balance(account_number: str) -> Dict[str, Any]:
+@_turn_cached("balance", "account_number")
+def _get_account_balance_sync(account_number: str) -> Dict[str, Any]:
     """
     Get the current balance for a specific bank account.
     Use this when you have a specific account number.
@@ -114,7 +352,8 @@ def get_account_balance(account_number: str) -> Dict[str, Any]:
     """
     start_time = time.time()
     try:
-        with get_db() as db:
+        from db.repositories import accounts as account_repo
+        with _tool_session() as db:
             account = account_repo.get_account_by_number(db, account_number)
             
             if not account:
@@ -159,8 +398,7 @@ def get_account_balance(account_number: str) -> Dict[str, Any]:
         }
 
 
-@tool("get_transaction_history", args_schema=GetTransactionHistoryInput)
-def get_transaction_history(account_number: str, days: int = 30, limit: int = 10) -> Dict[str, Any]:
+def _get_transaction_history_sync(account_number: str, days: int = 30, limit: int = 10) -> Dict[str, Any]:
     """
     Get recent transaction history for an account.
     Use this when user asks about transactions, transaction history, or recent activity.
@@ -175,7 +413,9 @@ def get_transaction_history(account_number: str, days: int = 30, limit: int = 10
     """
     start_time = time.time()
     try:
-        with get_db() as db:
+        from db.repositories import accounts as account_repo
+        from db.repositories import transactions as transaction_repo
+        with _tool_session() as db:
             # Get account first
             account = account_repo.get_account_by_number(db, account_number)
             
@@ -196,24 +436,14 @@ def get_transaction_history(account_number: str, days: int = 30, limit: int = 10
             start_date = datetime.now() - timedelta(days=days)
             
             # Get transactions
-            transactions = transaction_repo.get_transaction_history(
+            transactions = transaction_repo.get_transaction_history_projection(
                 db,
                 account_id=account.id,
                 start_date=start_date,
                 limit=limit
             )
             
-            transactions_list = []
-            for txn in transactions:
-                transactions_list.append({
-                    "date": txn.occurred_at.strftime("%Y-%m-%d %H:%M"),
-                    "type": txn.transaction_type.value if hasattr(txn.transaction_type, 'value') else str(txn.transaction_type),
-                    "amount": float(txn.amount),
-                    "currency": txn.currency_code,
-                    "description": txn.description or "",
-                    "status": txn.status.value if hasattr(txn.status, 'value') else str(txn.status),
-                    "counterparty": txn.counterparty_name or ""
-                })
+            transactions_list = _serialize_txns(transactions)
             
             result = {
                 "success": True,
@@ -243,8 +473,7 @@ def get_transaction_history(account_number: str, days: int = 30, limit: int = 10
         }
 
 
-@tool("download_statement", args_schema=DownloadStatementInput)
-def download_statement(account_number: str, from_date: str, to_date: str, period_type: str = "custom") -> Dict[str, Any]:
+def _download_statement_sync(account_number: str, from_date: str, to_date: str, period_type: str = "custom") -> Dict[str, Any]:
     """
     Prepare account statement for download.
     Use this when user asks to download statement, get statement, or export transactions.
@@ -290,7 +519,9 @@ def download_statement(account_number: str, from_date: str, to_date: str, period
                 "error": "Statement period cannot exceed 365 days (RBI compliance). Please select a shorter period."
             }
         
-        with get_db() as db:
+        from db.repositories import accounts as account_repo
+        from db.repositories import transactions as transaction_repo
+        with _tool_session() as db:
             # Get account
             account = account_repo.get_account_by_number(db, account_number)
             
@@ -301,7 +532,7 @@ def download_statement(account_number: str, from_date: str, to_date: str, period
                 }
             
             # Get transactions for the period
-            transactions = transaction_repo.get_transaction_history(
+            transactions = transaction_repo.get_transaction_history_projection(
                 db,
                 account_id=account.id,
                 start_date=start_dt,
@@ -309,18 +540,7 @@ def download_statement(account_number: str, from_date: str, to_date: str, period
                 limit=500  # Max statement limit
             )
             
-            transactions_list = []
-            for txn in transactions:
-                transactions_list.append({
-                    "date": txn.occurred_at.strftime("%Y-%m-%d %H:%M"),
-                    "type": txn.transaction_type.value if hasattr(txn.transaction_type, 'value') else str(txn.transaction_type),
-                    "amount": float(txn.amount),
-                    "currency": txn.currency_code,
-                    "description": txn.description or "",
-                    "status": txn.status.value if hasattr(txn.status, 'value') else str(txn.status),
-                    "counterparty": txn.counterparty_name or "",
-                    "reference_id": txn.reference_id or ""
-                })
+            transactions_list = _serialize_txns(transactions, include_ref=True)
             
             return {
                 "success": True,
@@ -343,10 +563,22 @@ def download_statement(account_number: str, from_date: str, to_date: str, period
         }
 
 
+get_user_accounts = _executor_tool("get_user_accounts", GetUserAccountsInput, _get_user_accounts_sync)
+get_account_balance = _executor_tool("get_account_balance", GetBalanceInput, _get_account_balance_sync)
+get_transaction_history = _executor_tool(
+    "get_transaction_history", GetTransactionHistoryInput, _get_transaction_history_sync
+)
+download_statement = _executor_tool("download_statement", DownloadStatementInput, _download_statement_sync)
+
+
 # Export tools
 __all__ = [
     "get_account_balance",
     "get_user_accounts",
     "get_transaction_history",
     "download_statement",
+    "call_tool",
+    "call_tool_many",
+    "banking_tools_session",
+    "invalidate",
 ]
@@ -26,6 +26,8 @@ from utils.db_helper import get_db
 from sqlalchemy import select
 from db.models import User, Account
 
+from .banking_tools import invalidate as invalidate_account_cache
+
 
 # Tool input schemas
 class ResolveUPIIDInput(BaseModel):
@@ -218,6 +220,8 @@ def initiate_upi_payment(
             session_id=session_id,
             reference_id=upi_ref_id
         )
+        invalidate_account_cache(source_account_number)
+        invalidate_account_cache(destination_account_number)
         
         return {
             "success": True,
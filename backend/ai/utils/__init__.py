@@ -1,5 +1,5 @@
 """Utils package initialization"""
-from .logging import logger, log_llm_call, log_tool_execution, log_agent_decision
+from .logging import logger, log_llm_call, log_tool_execution, log_agent_decision, utc_timestamp
 from .exceptions import (
     VaaniAIException,
     OllamaServiceError,
@@ -16,6 +16,7 @@ __all__ = [
     "log_llm_call",
     "log_tool_execution",
     "log_agent_decision",
+    "utc_timestamp",
     "VaaniAIException",
     "OllamaServiceError",
     "OpenAIServiceError",
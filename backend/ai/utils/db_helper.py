@@ -8,24 +8,30 @@ if str(project_root) not in sys.path:
 Database helper for AI backend
 Connects to the existing banking backend database
 """
-import sys
-from pathlib import Path
 from contextlib import contextmanager
+from dataclasses import replace
 from typing import Iterator
 
 from sqlalchemy.orm import Session
 
-# Add backend to path
-backend_path = Path(__file__).parent.parent.parent / "backend"
-sys.path.insert(0, str(backend_path))
-
 from db.config import load_database_config
 from db.engine import create_db_engine, get_session_factory
 
 
+# AI tools make many short reads per chat turn, often concurrently from the
+# tool executor; size the pool for that and drop stale connections after idle
+_AI_POOL_SIZE = 10
+_AI_MAX_OVERFLOW = 20
+_AI_POOL_RECYCLE_SECONDS = 1800
+
 # Create database engine and session factory
 config = load_database_config()
-engine = create_db_engine(config)
+config = replace(
+    config,
+    pool_size=config.pool_size if config.pool_size is not None else _AI_POOL_SIZE,
+    max_overflow=config.max_overflow if config.max_overflow is not None else _AI_MAX_OVERFLOW,
+)
+engine = create_db_engine(config, pool_pre_ping=True, pool_recycle=_AI_POOL_RECYCLE_SECONDS)
 SessionLocal = get_session_factory(engine)
 
 
@@ -2,226 +2,454 @@
 Demo-friendly logging utilities for AI backend
 Designed for clear visibility during video recordings
 """
+import atexit
+import io
 import logging
+import logging.handlers
+import os
+import queue
+import signal
 import sys
-from datetime import datetime
+import threading
+import time
+from itertools import islice
 from typing import Any, Dict, List, Optional
-import json
+
+
+class _JoinedLines:
+    """Log message that joins its lines only when a handler formats the record"""
+    
+    __slots__ = ("lines",)
+    
+    def __init__(self, lines: List[str]):
+        self.lines = lines
+    
+    def __str__(self) -> str:
+        return "\n".join(self.lines)
+
+
+class _BufferedStdoutHandler(logging.Handler):
+    """Handler that batches stdout writes and flushes them on a short timer"""
+    
+    FLUSH_INTERVAL = 0.2
+    
+    def __init__(self, buffer_size: int):
+        super().__init__()
+        self._buffer = io.BufferedWriter(
+            io.FileIO(sys.stdout.fileno(), "w", closefd=False),
+            buffer_size=buffer_size,
+        )
+        self._encoding = getattr(sys.stdout, "encoding", None) or "utf-8"
+        self._stopped = threading.Event()
+        threading.Thread(target=self._flush_periodically, name="demo-log-flush", daemon=True).start()
+        atexit.register(self.flush)
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            message = self.format(record) + "\n"
+            self._buffer.write(message.encode(self._encoding, "replace"))
+        except Exception:
+            self.handleError(record)
+    
+    def flush(self) -> None:
+        self.acquire()
+        try:
+            self._buffer.flush()
+        except (OSError, ValueError):
+            pass
+        finally:
+            self.release()
+    
+    def close(self) -> None:
+        self._stopped.set()
+        self.flush()
+        super().close()
+    
+    def _flush_periodically(self) -> None:
+        while not self._stopped.wait(self.FLUSH_INTERVAL):
+            self.flush()
+
+
+def _make_stdout_handler() -> logging.Handler:
+    """Buffered stdout handler, or a plain StreamHandler when buffering is off"""
+    # DEMO_LOG_BUFFER_BYTES=0 restores per-record writes
+    buffer_size = int(os.getenv("DEMO_LOG_BUFFER_BYTES", "8192"))
+    if buffer_size > 0:
+        try:
+            return _BufferedStdoutHandler(buffer_size)
+        except (AttributeError, OSError, ValueError, io.UnsupportedOperation):
+            # stdout replaced by an object without a real file descriptor
+            pass
+    return logging.StreamHandler(sys.stdout)
+
+
+class _DropOldestQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler that evicts the oldest record instead of blocking when full"""
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Same process, so the record can cross as-is and be formatted by the
+        # listener thread; only tracebacks are rendered eagerly
+        if record.exc_info:
+            return super().prepare(record)
+        return record
+    
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            try:
+                self.queue.get_nowait()
+            except queue.Empty:
+                pass
+            self.queue.put_nowait(record)
+
+
+_QUEUE_MAXSIZE = 10000
+_log_queue: Optional[queue.Queue] = None
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def _queue_handler() -> logging.Handler:
+    """Enqueueing handler backed by a shared listener thread that owns stdout"""
+    global _log_queue, _listener
+    if _listener is None:
+        _log_queue = queue.Queue(maxsize=_QUEUE_MAXSIZE)
+        handler = _make_stdout_handler()
+        handler.setLevel(logging.INFO)
+        handler.setFormatter(logging.Formatter('%(message)s'))
+        _listener = logging.handlers.QueueListener(_log_queue, handler, respect_handler_level=True)
+        _listener.start()
+        atexit.register(_listener.stop)
+        _install_signal_flush(handler)
+    return _DropOldestQueueHandler(_log_queue)
+
+
+def _install_signal_flush(handler: logging.Handler, timeout: float = 0.5) -> None:
+    """Drain queued records and flush before SIGTERM/SIGINT reach the previous handler"""
+    if threading.current_thread() is not threading.main_thread():
+        return
+    
+    def _drain_and_flush() -> None:
+        # Peek at the deque without taking the queue mutex, which the
+        # interrupted frame may be holding
+        deadline = time.monotonic() + timeout
+        while _log_queue.queue and time.monotonic() < deadline:
+            time.sleep(0.01)
+        handler.flush()
+    
+    for signum in (signal.SIGTERM, signal.SIGINT):
+        previous = signal.getsignal(signum)
+        
+        def _flush_then_forward(sig, frame, previous=previous):
+            _drain_and_flush()
+            if callable(previous):
+                previous(sig, frame)
+            elif previous == signal.SIG_DFL:
+                signal.signal(sig, signal.SIG_DFL)
+                os.kill(os.getpid(), sig)
+        
+        signal.signal(signum, _flush_then_forward)
+
+
+class _Colors:
+    """ANSI color codes as slot attributes (``COLORS.BLUE``)"""
+    
+    __slots__ = ("RESET", "BOLD", "DIM", "BLUE", "GREEN", "YELLOW", "RED", "CYAN", "MAGENTA")
+    
+    def __init__(self):
+        self.RESET = '\033[0m'
+        self.BOLD = '\033[1m'
+        self.DIM = '\033[2m'
+        self.BLUE = '\033[94m'
+        self.GREEN = '\033[92m'
+        self.YELLOW = '\033[93m'
+        self.RED = '\033[91m'
+        self.CYAN = '\033[96m'
+        self.MAGENTA = '\033[95m'
+    
+    def __getitem__(self, name: str) -> str:
+        # Keeps COLORS['BLUE'] working for existing callers
+        return getattr(self, name)
 
 
 class DemoLogger:
     """Enhanced logger with clean structured output for demos"""
     
     # ANSI color codes for terminal output
-    COLORS = {
-        'RESET': '\033[0m',
-        'BOLD': '\033[1m',
-        'DIM': '\033[2m',
-        'BLUE': '\033[94m',
-        'GREEN': '\033[92m',
-        'YELLOW': '\033[93m',
-        'RED': '\033[91m',
-        'CYAN': '\033[96m',
-        'MAGENTA': '\033[95m',
-    }
+    COLORS = _Colors()
+    
+    # Pre-joined escape sequences so hot paths skip the attribute chain
+    _RESET = COLORS.RESET
+    _BOLD = COLORS.BOLD
+    _BLUE = COLORS.BLUE
+    _GREEN = COLORS.GREEN
+    _YELLOW = COLORS.YELLOW
+    _RED = COLORS.RED
+    _CYAN = COLORS.CYAN
+    _MAGENTA = COLORS.MAGENTA
+    _BLUE_BOLD = '\033[94;1m'
+    _GREEN_BOLD = '\033[92;1m'
+    _YELLOW_BOLD = '\033[93;1m'
+    _RED_BOLD = '\033[91;1m'
+    _CYAN_BOLD = '\033[96;1m'
+    _MAGENTA_BOLD = '\033[95;1m'
+    _COLOR_ATTRS = (
+        '_RESET', '_BOLD', '_BLUE', '_GREEN', '_YELLOW', '_RED', '_CYAN', '_MAGENTA',
+        '_BLUE_BOLD', '_GREEN_BOLD', '_YELLOW_BOLD', '_RED_BOLD', '_CYAN_BOLD', '_MAGENTA_BOLD',
+    )
     
     def __init__(self, name: str = "demo"):
         self.logger = logging.getLogger(name)
-        self.logger.setLevel(logging.INFO)
+        # DEMO_LOG_LEVEL=WARNING turns demo output off outside recordings
+        self.logger.setLevel(os.getenv("DEMO_LOG_LEVEL", "INFO").upper())
         
         # Remove existing handlers
         self.logger.handlers.clear()
         
-        # Create console handler with custom formatter
-        handler = logging.StreamHandler(sys.stdout)
-        handler.setLevel(logging.INFO)
-        formatter = logging.Formatter('%(message)s')
-        handler.setFormatter(formatter)
-        self.logger.addHandler(handler)
+        # Records are formatted and written to stdout by a background listener
+        self.logger.addHandler(_queue_handler())
+        
+        self._info = self.logger.info
+        
+        # Pipes and log collectors get plain text; NO_COLOR opts out on a terminal too
+        self._use_color = sys.stdout.isatty() and os.environ.get("NO_COLOR") is None
+        if not self._use_color:
+            for attr in self._COLOR_ATTRS:
+                setattr(self, attr, "")
+    
+    def _enabled(self, level: int = logging.INFO) -> bool:
+        """Cheap pre-check so events below the logger's level skip all formatting"""
+        return self.logger.isEnabledFor(level)
     
     def _format_timestamp(self) -> str:
         """Format timestamp for display"""
-        return datetime.now().strftime("%H:%M:%S.%f")[:-3]
+        t = time.time()
+        lt = time.localtime(t)
+        return "%02d:%02d:%02d.%03d" % (lt.tm_hour, lt.tm_min, lt.tm_sec, int(t * 1000) % 1000)
+    
+    def _emit(self, lines: List[str]) -> None:
+        """Write every line of one event with a single handler call"""
+        self._info("%s", _JoinedLines(lines))
+    
+    @staticmethod
+    def _trunc(value: Any, n: int = 60) -> str:
+        """Stringify value and cut it to n characters with a trailing ellipsis"""
+        s = value if isinstance(value, str) else str(value)
+        return s if len(s) <= n else s[:n - 3] + "..."
+    
+    def _wrap(self, color: str, text: str) -> str:
+        """Surround text with a color sequence and the reset code"""
+        return color + text + self._RESET
+    
+    def _kwarg_lines(self, color: str, kwargs: Dict[str, Any]):
+        """Yield the trailing ``key: value`` lines for an event"""
+        trunc = DemoLogger._trunc
+        for key, value in kwargs.items():
+            if value is not None:
+                yield self._wrap(color, f"  {key}: {trunc(value)}")
     
     def chat_request(self, user_id: str, session_id: str, message: str, **kwargs):
         """Log chat request"""
+        if not self._enabled():
+            return
+        blue, reset = self._BLUE, self._RESET
         timestamp = self._format_timestamp()
-        self.logger.info(f"{self.COLORS['BLUE']}{self.COLORS['BOLD']}[CHAT REQUEST] {timestamp}{self.COLORS['RESET']}")
         message_preview = message[:70] + "..." if len(message) > 70 else message
-        self.logger.info(f"{self.COLORS['BLUE']}  User Message: {message_preview}{self.COLORS['RESET']}")
-        self.logger.info(f"{self.COLORS['BLUE']}  User ID: {user_id}{self.COLORS['RESET']}")
-        self.logger.info(f"{self.COLORS['BLUE']}  Session: {session_id[:20]}{self.COLORS['RESET']}")
-        
-        for key, value in kwargs.items():
-            if value is not None:
-                display_value = str(value)
-                if len(display_value) > 60:
-                    display_value = display_value[:57] + "..."
-                self.logger.info(f"{self.COLORS['BLUE']}  {key}: {display_value}{self.COLORS['RESET']}")
+        lines = [
+            f"{self._BLUE_BOLD}[CHAT REQUEST] {timestamp}{reset}",
+            f"{blue}  User Message: {message_preview}{reset}",
+            f"{blue}  User ID: {user_id}{reset}",
+            f"{blue}  Session: {session_id[:20]}{reset}",
+        ]
+        lines.extend(self._kwarg_lines(blue, kwargs))
+        self._emit(lines)
     
     def state_transition(self, from_state: str, to_state: str, reason: Optional[str] = None):
         """Log state transition"""
+        if not self._enabled():
+            return
+        magenta, reset = self._MAGENTA, self._RESET
         timestamp = self._format_timestamp()
-        self.logger.info(f"{self.COLORS['MAGENTA']}{self.COLORS['BOLD']}[STATE TRANSITION] {timestamp}{self.COLORS['RESET']}")
-        self.logger.info(f"{self.COLORS['MAGENTA']}  {from_state} -> {to_state}{self.COLORS['RESET']}")
+        lines = [
+            f"{self._MAGENTA_BOLD}[STATE TRANSITION] {timestamp}{reset}",
+            f"{magenta}  {from_state} -> {to_state}{reset}",
+        ]
         if reason:
-            self.logger.info(f"{self.COLORS['MAGENTA']}  Reason: {reason}{self.COLORS['RESET']}")
+            lines.append(f"{magenta}  Reason: {reason}{reset}")
+        self._emit(lines)
     
     def rag_retrieval(self, query: str, collection: str, k: int, **kwargs):
         """Log RAG retrieval operation"""
+        if not self._enabled():
+            return
+        cyan, reset = self._CYAN, self._RESET
         timestamp = self._format_timestamp()
-        self.logger.info(f"{self.COLORS['CYAN']}{self.COLORS['BOLD']}[RAG RETRIEVAL] {timestamp}{self.COLORS['RESET']}")
-        
         query_preview = query[:70] + "..." if len(query) > 70 else query
-        self.logger.info(f"{self.COLORS['CYAN']}  Query: {query_preview}{self.COLORS['RESET']}")
-        self.logger.info(f"{self.COLORS['CYAN']}  Collection: {collection}{self.COLORS['RESET']}")
-        self.logger.info(f"{self.COLORS['CYAN']}  Top-K: {k}{self.COLORS['RESET']}")
-        
-        for key, value in kwargs.items():
-            if value is not None:
-                display_value = str(value)
-                if len(display_value) > 60:
-                    display_value = display_value[:57] + "..."
-                self.logger.info(f"{self.COLORS['CYAN']}  {key}: {display_value}{self.COLORS['RESET']}")
+        lines = [
+            f"{self._CYAN_BOLD}[RAG RETRIEVAL] {timestamp}{reset}",
+            f"{cyan}  Query: {query_preview}{reset}",
+            f"{cyan}  Collection: {collection}{reset}",
+            f"{cyan}  Top-K: {k}{reset}",
+        ]
+        lines.extend(self._kwarg_lines(cyan, kwargs))
+        self._emit(lines)
     
     def rag_results(self, documents: list, scores: Optional[list] = None):
         """Log RAG retrieval results"""
-        self.logger.info(f"{self.COLORS['CYAN']}{self.COLORS['BOLD']}[RAG RESULTS] Documents Found: {len(documents)}{self.COLORS['RESET']}")
+        if not self._enabled():
+            return
+        cyan, reset = self._CYAN, self._RESET
+        total = len(documents)
+        n_scores = len(scores) if scores else 0
+        lines = [f"{self._CYAN_BOLD}[RAG RESULTS] Documents Found: {total}{reset}"]
+        append = lines.append
         
-        for i, doc in enumerate(documents[:5], 1):  # Show top 5
-            source = doc.metadata.get("source", "Unknown")
-            doc_type = doc.metadata.get("document_type", "unknown")
-            loan_type = doc.metadata.get("loan_type", "")
-            scheme_type = doc.metadata.get("scheme_type", "")
-            
-            type_label = scheme_type or loan_type or doc_type
+        for i, doc in enumerate(islice(documents, 5), 1):  # Show top 5
+            md = doc.metadata.get
+            type_label = md("scheme_type", "") or md("loan_type", "") or md("document_type", "unknown")
             if type_label:
                 type_label = type_label.replace("_", " ").title()
             
-            score_str = f"{scores[i-1]:.3f}" if scores and i <= len(scores) else None
-            
-            self.logger.info(f"{self.COLORS['CYAN']}  [{i}] {type_label}{self.COLORS['RESET']}")
-            self.logger.info(f"{self.COLORS['CYAN']}      Source: {source}{self.COLORS['RESET']}")
-            if score_str:
-                self.logger.info(f"{self.COLORS['CYAN']}      Score: {score_str}{self.COLORS['RESET']}")
+            append(f"{cyan}  [{i}] {type_label}{reset}")
+            append(f"{cyan}      Source: {md('source', 'Unknown')}{reset}")
+            if i <= n_scores:
+                append(f"{cyan}      Score: {scores[i-1]:.3f}{reset}")
             
             # Show content preview
-            content_preview = doc.page_content[:60].replace("\n", " ")
-            if len(doc.page_content) > 60:
+            content = doc.page_content
+            content_preview = content[:60].replace("\n", " ")
+            if len(content) > 60:
                 content_preview += "..."
-            self.logger.info(f"{self.COLORS['CYAN']}      Preview: {content_preview}{self.COLORS['RESET']}")
+            append(f"{cyan}      Preview: {content_preview}{reset}")
         
-        if len(documents) > 5:
-            self.logger.info(f"{self.COLORS['CYAN']}  ... and {len(documents) - 5} more documents{self.COLORS['RESET']}")
+        if total > 5:
+            append(f"{cyan}  ... and {total - 5} more documents{reset}")
+        self._emit(lines)
     
     def agent_decision(self, agent_name: str, intent: str, confidence: Optional[float] = None, **kwargs):
         """Log agent routing decision"""
+        if not self._enabled():
+            return
+        yellow, reset = self._YELLOW, self._RESET
         timestamp = self._format_timestamp()
-        self.logger.info(f"{self.COLORS['YELLOW']}{self.COLORS['BOLD']}[AGENT ROUTING] {timestamp}{self.COLORS['RESET']}")
-        
-        self.logger.info(f"{self.COLORS['YELLOW']}  Selected Agent: {agent_name}{self.COLORS['RESET']}")
-        self.logger.info(f"{self.COLORS['YELLOW']}  Detected Intent: {intent}{self.COLORS['RESET']}")
+        lines = [
+            f"{self._YELLOW_BOLD}[AGENT ROUTING] {timestamp}{reset}",
+            f"{yellow}  Selected Agent: {agent_name}{reset}",
+            f"{yellow}  Detected Intent: {intent}{reset}",
+        ]
         
         if confidence is not None:
-            conf_color = 'GREEN' if confidence > 0.7 else 'YELLOW' if confidence > 0.5 else 'RED'
-            self.logger.info(f"{self.COLORS['YELLOW']}  Confidence: {self.COLORS[conf_color]}{confidence:.2%}{self.COLORS['RESET']}")
+            conf_color = self._GREEN if confidence > 0.7 else yellow if confidence > 0.5 else self._RED
+            lines.append(f"{yellow}  Confidence: {conf_color}{confidence:.2%}{reset}")
         
-        for key, value in kwargs.items():
-            if value is not None:
-                display_value = str(value)
-                if len(display_value) > 60:
-                    display_value = display_value[:57] + "..."
-                self.logger.info(f"{self.COLORS['YELLOW']}  {key}: {display_value}{self.COLORS['RESET']}")
+        lines.extend(self._kwarg_lines(yellow, kwargs))
+        self._emit(lines)
     
     def data_processing(self, operation: str, input_data: Any, output_data: Any = None, **kwargs):
         """Log data processing step"""
+        if not self._enabled():
+            return
+        magenta, reset = self._MAGENTA, self._RESET
+        trunc = DemoLogger._trunc
         timestamp = self._format_timestamp()
-        self.logger.info(f"{self.COLORS['MAGENTA']}{self.COLORS['BOLD']}[DATA PROCESSING] {timestamp}{self.COLORS['RESET']}")
-        self.logger.info(f"{self.COLORS['MAGENTA']}  Operation: {operation}{self.COLORS['RESET']}")
-        
-        input_str = str(input_data)
-        if len(input_str) > 70:
-            input_str = input_str[:67] + "..."
-        self.logger.info(f"{self.COLORS['MAGENTA']}  Input: {input_str}{self.COLORS['RESET']}")
+        input_str = trunc(input_data, 70)
+        lines = [
+            f"{self._MAGENTA_BOLD}[DATA PROCESSING] {timestamp}{reset}",
+            f"{magenta}  Operation: {operation}{reset}",
+            f"{magenta}  Input: {input_str}{reset}",
+        ]
         
         if output_data is not None:
-            output_str = str(output_data)
-            if len(output_str) > 70:
-                output_str = output_str[:67] + "..."
-            self.logger.info(f"{self.COLORS['MAGENTA']}  Output: {output_str}{self.COLORS['RESET']}")
+            output_str = trunc(output_data, 70)
+            lines.append(f"{magenta}  Output: {output_str}{reset}")
         
-        for key, value in kwargs.items():
-            if value is not None:
-                display_value = str(value)
-                if len(display_value) > 60:
-                    display_value = display_value[:57] + "..."
-                self.logger.info(f"{self.COLORS['MAGENTA']}  {key}: {display_value}{self.COLORS['RESET']}")
+        lines.extend(self._kwarg_lines(magenta, kwargs))
+        self._emit(lines)
     
     def llm_call(self, model: str, prompt_length: int, response_length: int, 
                   tokens: int = 0, duration_ms: float = 0):
         """Log LLM API call"""
+        if not self._enabled():
+            return
+        green, reset = self._GREEN, self._RESET
         timestamp = self._format_timestamp()
-        self.logger.info(f"{self.COLORS['GREEN']}{self.COLORS['BOLD']}[LLM CALL] {timestamp}{self.COLORS['RESET']}")
-        
-        self.logger.info(f"{self.COLORS['GREEN']}  Model: {model}{self.COLORS['RESET']}")
-        self.logger.info(f"{self.COLORS['GREEN']}  Prompt Length: {prompt_length} chars{self.COLORS['RESET']}")
-        self.logger.info(f"{self.COLORS['GREEN']}  Response Length: {response_length} chars{self.COLORS['RESET']}")
+        lines = [
+            f"{self._GREEN_BOLD}[LLM CALL] {timestamp}{reset}",
+            f"{green}  Model: {model}{reset}",
+            f"{green}  Prompt Length: {prompt_length} chars{reset}",
+            f"{green}  Response Length: {response_length} chars{reset}",
+        ]
         
         if tokens > 0:
-            self.logger.info(f"{self.COLORS['GREEN']}  Tokens Used: {tokens}{self.COLORS['RESET']}")
+            lines.append(f"{green}  Tokens Used: {tokens}{reset}")
         
         if duration_ms > 0:
-            self.logger.info(f"{self.COLORS['GREEN']}  Duration: {duration_ms:.2f}ms{self.COLORS['RESET']}")
+            lines.append(f"{green}  Duration: {duration_ms:.2f}ms{reset}")
+        self._emit(lines)
     
     def tool_execution(self, tool_name: str, success: bool, duration_ms: float = 0, 
                       result: Any = None, error: Optional[str] = None):
         """Log tool execution"""
+        if not self._enabled():
+            return
+        red, reset = self._RED, self._RESET
+        trunc = DemoLogger._trunc
         timestamp = self._format_timestamp()
-        status_color = 'GREEN' if success else 'RED'
+        status_color = self._GREEN if success else red
+        status_bold = self._GREEN_BOLD if success else self._RED_BOLD
         status_text = "SUCCESS" if success else "FAILED"
         
-        self.logger.info(f"{self.COLORS[status_color]}{self.COLORS['BOLD']}[TOOL EXECUTION] {timestamp}{self.COLORS['RESET']}")
-        self.logger.info(f"{self.COLORS[status_color]}  Tool: {tool_name}{self.COLORS['RESET']}")
-        self.logger.info(f"{self.COLORS[status_color]}  Status: {status_text}{self.COLORS['RESET']}")
+        lines = [
+            f"{status_bold}[TOOL EXECUTION] {timestamp}{reset}",
+            f"{status_color}  Tool: {tool_name}{reset}",
+            f"{status_color}  Status: {status_text}{reset}",
+        ]
         
         if duration_ms > 0:
-            self.logger.info(f"{self.COLORS[status_color]}  Duration: {duration_ms:.2f}ms{self.COLORS['RESET']}")
+            lines.append(f"{status_color}  Duration: {duration_ms:.2f}ms{reset}")
         
         if result is not None:
-            result_str = str(result)
-            if len(result_str) > 70:
-                result_str = result_str[:67] + "..."
-            self.logger.info(f"{self.COLORS[status_color]}  Result: {result_str}{self.COLORS['RESET']}")
+            result_str = trunc(result, 70)
+            lines.append(f"{status_color}  Result: {result_str}{reset}")
         
         if error:
-            error_str = str(error)
-            if len(error_str) > 70:
-                error_str = error_str[:67] + "..."
-            self.logger.info(f"{self.COLORS['RED']}  Error: {error_str}{self.COLORS['RESET']}")
+            error_str = trunc(error, 70)
+            lines.append(f"{red}  Error: {error_str}{reset}")
+        self._emit(lines)
     
     def ai_response(self, response: str, agent: str, language: str):
         """Log AI response"""
+        if not self._enabled():
+            return
+        green, reset = self._GREEN, self._RESET
         timestamp = self._format_timestamp()
-        self.logger.info(f"{self.COLORS['GREEN']}{self.COLORS['BOLD']}[AI RESPONSE] {timestamp}{self.COLORS['RESET']}")
-        
-        self.logger.info(f"{self.COLORS['GREEN']}  Agent: {agent}{self.COLORS['RESET']}")
-        self.logger.info(f"{self.COLORS['GREEN']}  Language: {language}{self.COLORS['RESET']}")
-        
         response_preview = response[:70] + "..." if len(response) > 70 else response
-        self.logger.info(f"{self.COLORS['GREEN']}  Response: {response_preview}{self.COLORS['RESET']}")
+        self._emit([
+            f"{self._GREEN_BOLD}[AI RESPONSE] {timestamp}{reset}",
+            f"{green}  Agent: {agent}{reset}",
+            f"{green}  Language: {language}{reset}",
+            f"{green}  Response: {response_preview}{reset}",
+        ])
     
     def info(self, message: str, **kwargs):
         """Standard info log"""
-        self.logger.info(f"[INFO] {message} {json.dumps(kwargs) if kwargs else ''}")
+        if not self._enabled():
+            return
+        if kwargs:
+            import json
+            self._info("[INFO] %s %s", message, json.dumps(kwargs, separators=(",", ":")))
+        else:
+            self._info("[INFO] %s", message)
     
     def error(self, message: str, **kwargs):
         """Error log"""
+        if not self._enabled(logging.ERROR):
+            return
+        red, reset = self._RED, self._RESET
         timestamp = self._format_timestamp()
-        self.logger.error(f"{self.COLORS['RED']}{self.COLORS['BOLD']}[ERROR] {timestamp} | {message}{self.COLORS['RESET']}")
-        if kwargs:
-            for key, value in kwargs.items():
-                self.logger.error(f"{self.COLORS['RED']}  {key}: {value}{self.COLORS['RESET']}")
-
+        lines = [f"{self._RED_BOLD}[ERROR] {timestamp} | {message}{reset}"]
+        lines.extend(f"{red}  {key}: {value}{reset}" for key, value in kwargs.items())
+        self.logger.error("%s", _JoinedLines(lines))
 
 # Global demo logger instance
 demo_logger = DemoLogger("demo")
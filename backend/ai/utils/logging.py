@@ -4,6 +4,7 @@ Provides consistent logging across all modules
 """
 import logging
 import sys
+from datetime import datetime, timezone
 from pathlib import Path
 from logging.handlers import RotatingFileHandler
 import structlog
@@ -59,6 +60,14 @@ def setup_logging():
 logger = setup_logging()
 
 
+_UTC = timezone.utc
+
+
+def utc_timestamp() -> str:
+    """ISO-8601 UTC timestamp with millisecond precision for API responses"""
+    return datetime.now(_UTC).isoformat(timespec="milliseconds")
+
+
 def log_llm_call(model: str, prompt: str, response: str, tokens: int = 0, duration: float = 0):
     """Log LLM API calls for monitoring"""
     logger.info(
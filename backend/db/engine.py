@@ -5,7 +5,7 @@ Engine and session management helpers.
 from __future__ import annotations
 
 from contextlib import contextmanager
-from typing import Iterator
+from typing import Iterator, Optional
 
 from sqlalchemy import create_engine
 from sqlalchemy.engine import Engine
@@ -14,12 +14,18 @@ from sqlalchemy.orm import sessionmaker
 from .config import DatabaseConfig
 
 
-def create_db_engine(config: DatabaseConfig) -> Engine:
+def create_db_engine(
+    config: DatabaseConfig,
+    *,
+    pool_pre_ping: bool = False,
+    pool_recycle: Optional[int] = None,
+) -> Engine:
     """
     Build an SQLAlchemy engine based on the provided configuration.
 
     Handles backend-specific options (e.g., SQLite check_same_thread) to
-    ensure compatibility across different database vendors.
+    ensure compatibility across different database vendors. ``pool_pre_ping``
+    and ``pool_recycle`` apply only to pooled (non-SQLite) backends.
     """
 
     connect_args = {}
@@ -45,6 +51,10 @@ def create_db_engine(config: DatabaseConfig) -> Engine:
             engine_kwargs["pool_size"] = config.pool_size
         if config.max_overflow is not None:
             engine_kwargs["max_overflow"] = config.max_overflow
+        if pool_pre_ping:
+            engine_kwargs["pool_pre_ping"] = True
+        if pool_recycle is not None:
+            engine_kwargs["pool_recycle"] = pool_recycle
 
     engine = create_engine(
         config.database_url,
@@ -14,6 +14,7 @@ from .transactions import (
     execute_internal_transfer,
     get_transaction_by_reference,
     get_transaction_history,
+    get_transaction_history_projection,
 )
 from .reminders import (
     create_reminder,
@@ -30,6 +31,8 @@ from .device_bindings import (
 )
 from .beneficiaries import (
     list_beneficiaries,
+    get_first_beneficiary_contact,
+    get_last_beneficiary_contact,
     create_beneficiary,
     get_beneficiary_by_id,
     get_beneficiary_by_account_number,
@@ -47,6 +50,7 @@ __all__ = [
     "execute_internal_transfer",
     "get_transaction_by_reference",
     "get_transaction_history",
+    "get_transaction_history_projection",
     "create_reminder",
     "fetch_due_reminders",
     "list_reminders_for_user",
@@ -57,6 +61,8 @@ __all__ = [
     "get_device_binding_for_device",
     "mark_device_binding_trust",
     "list_beneficiaries",
+    "get_first_beneficiary_contact",
+    "get_last_beneficiary_contact",
     "create_beneficiary",
     "get_beneficiary_by_id",
     "get_beneficiary_by_account_number",
@@ -9,7 +9,7 @@ from typing import Optional
 from sqlalchemy import Select, select
 from sqlalchemy.orm import Session
 
-from ..models import Account, Beneficiary
+from ..models import Account, Beneficiary, User
 from ..utils.enums import BeneficiaryStatus
 
 IST = ZoneInfo("Asia/Kolkata")
@@ -29,6 +29,31 @@ def list_beneficiaries(session: Session, *, user_id, include_blocked: bool = Fal
     return session.execute(stmt).scalars().all()
 
 
+def _contact_query(user_id, include_blocked: bool) -> Select:
+    stmt = select(Beneficiary, User.upi_id, User.phone_number).where(Beneficiary.user_id == user_id)
+    if not include_blocked:
+        stmt = stmt.where(Beneficiary.status != BeneficiaryStatus.BLOCKED)
+    return (
+        stmt.outerjoin(Account, Account.account_number == Beneficiary.account_number)
+        .outerjoin(User, User.id == Account.user_id)
+        .limit(1)
+    )
+
+
+def get_first_beneficiary_contact(session: Session, *, user_id, include_blocked: bool = False):
+    """Return (beneficiary, upi_id, phone_number) for the most recently added beneficiary, or None."""
+
+    stmt = _contact_query(user_id, include_blocked).order_by(Beneficiary.added_at.desc())
+    return session.execute(stmt).first()
+
+
+def get_last_beneficiary_contact(session: Session, *, user_id, include_blocked: bool = False):
+    """Return (beneficiary, upi_id, phone_number) for the earliest added beneficiary, or None."""
+
+    stmt = _contact_query(user_id, include_blocked).order_by(Beneficiary.added_at.asc())
+    return session.execute(stmt).first()
+
+
 def get_beneficiary_by_id(session: Session, *, beneficiary_id, user_id=None) -> Optional[Beneficiary]:
     """Fetch a beneficiary by UUID with optional ownership check."""
 
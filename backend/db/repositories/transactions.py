@@ -6,9 +6,9 @@ from dataclasses import dataclass
 from datetime import datetime
 from zoneinfo import ZoneInfo
 from decimal import Decimal
-from typing import Iterable, Optional
+from typing import Iterable, Iterator, Optional
 
-from sqlalchemy import select
+from sqlalchemy import Numeric, Row, select, type_coerce
 from sqlalchemy.orm import Session
 
 from ..models import Account, Transaction
@@ -131,6 +131,44 @@ def get_transaction_history(
     return session.execute(stmt).scalars().all()
 
 
+def get_transaction_history_projection(
+    session: Session,
+    *,
+    account_id,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    limit: int = 50,
+) -> Iterator[Row]:
+    """
+    Same ordering and filters as get_transaction_history, but selects only the
+    columns needed for history/statement output as lightweight rows.
+
+    Rows are streamed from the cursor in batches of 100 and must be consumed
+    while the session is open. ``amount`` is returned as a float, skipping
+    the Decimal round trip for callers that only serialize it.
+    """
+
+    stmt = select(
+        Transaction.occurred_at,
+        Transaction.transaction_type,
+        type_coerce(Transaction.amount, Numeric(precision=18, scale=2, asdecimal=False)).label("amount"),
+        Transaction.currency_code,
+        Transaction.description,
+        Transaction.status,
+        Transaction.counterparty_name,
+        Transaction.reference_id,
+    ).where(Transaction.account_id == account_id)
+
+    if start_date is not None:
+        stmt = stmt.where(Transaction.occurred_at >= start_date)
+    if end_date is not None:
+        stmt = stmt.where(Transaction.occurred_at <= end_date)
+
+    stmt = stmt.order_by(Transaction.occurred_at.desc()).limit(limit)
+
+    return iter(session.execute(stmt).yield_per(100))
+
+
 def get_transaction_by_reference(session: Session, reference_id: str) -> Optional[Transaction]:
     """Lookup a transaction using an external reference id."""
 
@@ -10,6 +10,8 @@ from datetime import datetime
 
 
 BASE_URL = "http://localhost:8001"
+# Chat requests hit Ollama; keep in-flight LLM calls at its parallelism
+SEM = asyncio.Semaphore(3)
 COLORS = {
     "green": "\033[92m",
     "red": "\033[91m",
@@ -19,6 +21,15 @@ COLORS = {
 }
 
 
+def make_client():
+    """One pooled keep-alive client for the whole suite"""
+    return httpx.AsyncClient(
+        base_url=BASE_URL,
+        timeout=30.0,
+        limits=httpx.Limits(max_keepalive_connections=8, keepalive_expiry=30.0),
+    )
+
+
 def print_colored(text, color="reset"):
     """Print colored text"""
     print(f"{COLORS.get(color, COLORS['reset'])}{text}{COLORS['reset']}")
@@ -31,36 +42,35 @@ def print_test(name):
     print('='*60)
 
 
-async def test_health():
+async def check_health(client: httpx.AsyncClient):
     """Test health endpoint"""
     print_test("Health Check")
     
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(f"{BASE_URL}/health")
-            data = response.json()
-            
-            print(json.dumps(data, indent=2))
-            
-            if data["status"] == "healthy" and data.get("ollama_status"):
-                print_colored("✅ PASSED: Backend is healthy", "green")
-                return True
-            else:
-                print_colored("❌ FAILED: Backend is not fully healthy", "red")
-                return False
+        response = await client.get("/health")
+        data = response.json()
+        
+        print(json.dumps(data, indent=2))
+        
+        if data["status"] == "healthy" and data.get("ollama_status"):
+            print_colored("✅ PASSED: Backend is healthy", "green")
+            return True
+        else:
+            print_colored("❌ FAILED: Backend is not fully healthy", "red")
+            return False
     except Exception as e:
         print_colored(f"❌ FAILED: {e}", "red")
         return False
 
 
-async def test_english_chat():
+async def check_english_chat(client: httpx.AsyncClient):
     """Test English chat"""
     print_test("English Chat")
     
     payload = {
         "message": "What is my account balance?",
         "user_id": 1,
-        "session_id": "test-session",
+        "session_id": "test-session-en",
         "language": "en-IN",
         "user_context": {
             "account_number": "ACC001",
@@ -71,36 +81,33 @@ async def test_english_chat():
     print(f"Request: {payload['message']}")
     
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(
-                f"{BASE_URL}/api/chat",
-                json=payload
-            )
-            data = response.json()
-            
-            print(f"\nResponse: {data.get('response', 'No response')}")
-            print(f"Intent: {data.get('intent', 'unknown')}")
-            print(f"Language: {data.get('language', 'unknown')}")
-            
-            if data.get("success"):
-                print_colored("✅ PASSED: English chat works", "green")
-                return True
-            else:
-                print_colored("❌ FAILED: Chat unsuccessful", "red")
-                return False
+        async with SEM:
+            response = await client.post("/api/chat", json=payload)
+        data = response.json()
+        
+        print(f"\nResponse: {data.get('response', 'No response')}")
+        print(f"Intent: {data.get('intent', 'unknown')}")
+        print(f"Language: {data.get('language', 'unknown')}")
+        
+        if data.get("success"):
+            print_colored("✅ PASSED: English chat works", "green")
+            return True
+        else:
+            print_colored("❌ FAILED: Chat unsuccessful", "red")
+            return False
     except Exception as e:
         print_colored(f"❌ FAILED: {e}", "red")
         return False
 
 
-async def test_hindi_chat():
+async def check_hindi_chat(client: httpx.AsyncClient):
     """Test Hindi chat"""
     print_test("Hindi Chat")
     
     payload = {
         "message": "मेरा खाते का बैलेंस क्या है?",
         "user_id": 1,
-        "session_id": "test-session",
+        "session_id": "test-session-hi",
         "language": "hi-IN",
         "user_context": {
             "account_number": "ACC001"
@@ -110,70 +117,64 @@ async def test_hindi_chat():
     print(f"Request: {payload['message']}")
     
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(
-                f"{BASE_URL}/api/chat",
-                json=payload
-            )
-            data = response.json()
-            
-            print(f"\nResponse: {data.get('response', 'No response')}")
-            print(f"Intent: {data.get('intent', 'unknown')}")
-            
-            if data.get("success"):
-                print_colored("✅ PASSED: Hindi chat works", "green")
-                return True
-            else:
-                print_colored("❌ FAILED: Chat unsuccessful", "red")
-                return False
+        async with SEM:
+            response = await client.post("/api/chat", json=payload)
+        data = response.json()
+        
+        print(f"\nResponse: {data.get('response', 'No response')}")
+        print(f"Intent: {data.get('intent', 'unknown')}")
+        
+        if data.get("success"):
+            print_colored("✅ PASSED: Hindi chat works", "green")
+            return True
+        else:
+            print_colored("❌ FAILED: Chat unsuccessful", "red")
+            return False
     except Exception as e:
         print_colored(f"❌ FAILED: {e}", "red")
         return False
 
 
-async def test_rag():
+async def check_rag(client: httpx.AsyncClient):
     """Test RAG supervisor"""
     print_test("RAG Supervisor")
     
     payload = {
         "message": "What is the interest rate for savings account?",
         "user_id": 1,
-        "session_id": "test-session",
+        "session_id": "test-session-rag",
         "language": "en-IN"
     }
     
     print(f"Request: {payload['message']}")
     
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(
-                f"{BASE_URL}/api/chat",
-                json=payload
-            )
-            data = response.json()
-            
-            print(f"\nResponse: {data.get('response', 'No response')}")
-            print(f"Intent: {data.get('intent', 'unknown')}")
-            
-            if data.get("success") and data.get("intent") == "general_faq":
-                print_colored("✅ PASSED: RAG supervisor works", "green")
-                return True
-            else:
-                print_colored("❌ FAILED: RAG supervisor issue", "red")
-                return False
+        async with SEM:
+            response = await client.post("/api/chat", json=payload)
+        data = response.json()
+        
+        print(f"\nResponse: {data.get('response', 'No response')}")
+        print(f"Intent: {data.get('intent', 'unknown')}")
+        
+        if data.get("success") and data.get("intent") == "general_faq":
+            print_colored("✅ PASSED: RAG supervisor works", "green")
+            return True
+        else:
+            print_colored("❌ FAILED: RAG supervisor issue", "red")
+            return False
     except Exception as e:
         print_colored(f"❌ FAILED: {e}", "red")
         return False
 
 
-async def test_voice_mode():
+async def check_voice_mode(client: httpx.AsyncClient):
     """Test voice mode (fast model)"""
     print_test("Voice Mode (Fast Model)")
     
     payload = {
         "message": "Check balance",
         "user_id": 1,
-        "session_id": "test-session",
+        "session_id": "test-session-voice",
         "language": "en-IN",
         "user_context": {
             "account_number": "ACC001"
@@ -185,52 +186,48 @@ async def test_voice_mode():
     
     try:
         start_time = datetime.now()
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(
-                f"{BASE_URL}/api/chat",
-                json=payload
-            )
-            data = response.json()
-            duration = (datetime.now() - start_time).total_seconds()
-            
-            print(f"\nResponse: {data.get('response', 'No response')}")
-            print(f"Duration: {duration:.2f}s")
-            
-            if data.get("success") and duration < 2.0:
-                print_colored(f"✅ PASSED: Voice mode fast enough ({duration:.2f}s)", "green")
-                return True
-            else:
-                print_colored("❌ FAILED: Too slow or unsuccessful", "red")
-                return False
+        async with SEM:
+            response = await client.post("/api/chat", json=payload)
+        data = response.json()
+        duration = (datetime.now() - start_time).total_seconds()
+        
+        print(f"\nResponse: {data.get('response', 'No response')}")
+        print(f"Duration: {duration:.2f}s")
+        
+        if data.get("success") and duration < 2.0:
+            print_colored(f"✅ PASSED: Voice mode fast enough ({duration:.2f}s)", "green")
+            return True
+        else:
+            print_colored("❌ FAILED: Too slow or unsuccessful", "red")
+            return False
     except Exception as e:
         print_colored(f"❌ FAILED: {e}", "red")
         return False
 
 
-async def test_models():
+async def check_models(client: httpx.AsyncClient):
     """Test available models"""
     print_test("Available Models")
     
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(f"{BASE_URL}/api/models")
-            data = response.json()
-            
-            print("Models:")
-            for model in data.get("models", []):
-                print(f"  • {model['name']}")
-            
-            # Check for required models
-            model_names = [m["name"] for m in data.get("models", [])]
-            has_qwen = any("qwen" in name.lower() for name in model_names)
-            has_llama = any("llama" in name.lower() for name in model_names)
-            
-            if has_qwen and has_llama:
-                print_colored("✅ PASSED: Required models found", "green")
-                return True
-            else:
-                print_colored("⚠️  WARNING: Some models missing", "yellow")
-                return False
+        response = await client.get("/api/models")
+        data = response.json()
+        
+        print("Models:")
+        for model in data.get("models", []):
+            print(f"  • {model['name']}")
+        
+        # Check for required models
+        model_names = [m["name"] for m in data.get("models", [])]
+        has_qwen = any("qwen" in name.lower() for name in model_names)
+        has_llama = any("llama" in name.lower() for name in model_names)
+        
+        if has_qwen and has_llama:
+            print_colored("✅ PASSED: Required models found", "green")
+            return True
+        else:
+            print_colored("⚠️  WARNING: Some models missing", "yellow")
+            return False
     except Exception as e:
         print_colored(f"❌ FAILED: {e}", "red")
         return False
@@ -245,23 +242,39 @@ async def main():
     print_colored(f"Testing backend at: {BASE_URL}", "yellow")
     print_colored(f"Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n", "yellow")
     
-    tests = [
-        ("Health Check", test_health),
-        ("Models Check", test_models),
-        ("English Chat", test_english_chat),
-        ("Hindi Chat", test_hindi_chat),
-    ("RAG Supervisor", test_rag),
-        ("Voice Mode", test_voice_mode),
+    # Independent endpoints/sessions run concurrently; the voice mode latency
+    # check runs alone afterwards so parallel load does not skew its timing
+    concurrent_tests = [
+        ("Health Check", check_health),
+        ("Models Check", check_models),
+        ("English Chat", check_english_chat),
+        ("Hindi Chat", check_hindi_chat),
+        ("RAG Supervisor", check_rag),
+    ]
+    sequential_tests = [
+        ("Voice Mode", check_voice_mode),
     ]
     
     results = []
-    for name, test_func in tests:
-        try:
-            result = await test_func()
-            results.append((name, result))
-        except Exception as e:
-            print_colored(f"❌ ERROR in {name}: {e}", "red")
-            results.append((name, False))
+    async with make_client() as client:
+        outcomes = await asyncio.gather(
+            *(check_func(client) for _, check_func in concurrent_tests),
+            return_exceptions=True,
+        )
+        for (name, _), outcome in zip(concurrent_tests, outcomes):
+            if isinstance(outcome, BaseException):
+                print_colored(f"❌ ERROR in {name}: {outcome}", "red")
+                results.append((name, False))
+            else:
+                results.append((name, outcome))
+        
+        for name, check_func in sequential_tests:
+            try:
+                result = await check_func(client)
+                results.append((name, result))
+            except Exception as e:
+                print_colored(f"❌ ERROR in {name}: {e}", "red")
+                results.append((name, False))
     
     # Summary
     print("\n" + "="*60)
@@ -296,4 +309,9 @@ async def main():
 
 
 if __name__ == "__main__":
+    try:
+        import uvloop  # Installed with uvicorn[standard]; optional elsewhere
+        uvloop.install()
+    except ImportError:
+        pass
     asyncio.run(main())
@@ -0,0 +1,70 @@
+"""Unit tests for the per-turn banking tool read cache."""
+from __future__ import annotations
+
+import contextvars
+from typing import Any, Dict
+
+from tools.banking_tools import _turn_cached, _turn_read_cache, invalidate
+
+
+def build_balance_tool(ledger: Dict[str, float]):
+    """Return a cached balance tool body reading from ledger, plus its call log."""
+
+    calls = []
+
+    @_turn_cached("balance", "account_number")
+    def get_balance(account_number: str) -> Dict[str, Any]:
+        calls.append(account_number)
+        return {"success": True, "balance": ledger[account_number]}
+
+    return get_balance, calls
+
+
+def run_turn(func, *args):
+    """Run func in a fresh context holding its own turn cache, like banking_tools_session()."""
+
+    def turn():
+        _turn_read_cache.set({})
+        return func(*args)
+
+    return contextvars.copy_context().run(turn)
+
+
+def test_write_is_visible_to_next_turn() -> None:
+    ledger = {"ACC001": 1000.0}
+    get_balance, calls = build_balance_tool(ledger)
+
+    assert run_turn(get_balance, "ACC001")["balance"] == 1000.0
+    ledger["ACC001"] = 400.0  # transfer committed by the main API
+    assert run_turn(get_balance, "ACC001")["balance"] == 400.0
+    assert calls == ["ACC001", "ACC001"]
+
+
+def test_reads_outside_a_turn_are_not_cached() -> None:
+    ledger = {"ACC001": 1000.0}
+    get_balance, calls = build_balance_tool(ledger)
+
+    get_balance("ACC001")
+    ledger["ACC001"] = 400.0
+
+    assert get_balance("ACC001")["balance"] == 400.0
+    assert len(calls) == 2
+
+
+def test_turn_cache_hits_until_invalidated() -> None:
+    ledger = {"ACC001": 1000.0}
+    get_balance, calls = build_balance_tool(ledger)
+
+    def turn():
+        _turn_read_cache.set({})
+        first = get_balance("ACC001")
+        repeat = get_balance("ACC001")
+        ledger["ACC001"] = 400.0
+        invalidate("ACC001")
+        return first, repeat, get_balance("ACC001")
+
+    first, repeat, after_write = contextvars.copy_context().run(turn)
+
+    assert first == repeat == {"success": True, "balance": 1000.0}
+    assert after_write["balance"] == 400.0
+    assert len(calls) == 2
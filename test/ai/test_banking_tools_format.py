@@ -0,0 +1,20 @@
+"""Unit tests for banking tool row formatting helpers."""
+from __future__ import annotations
+
+from datetime import datetime
+
+import pytest
+
+from tools.banking_tools import _format_txn_date
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        datetime(2024, 1, 5, 9, 7),
+        datetime(2025, 12, 31, 23, 59, 59),
+        datetime(2023, 3, 1, 0, 0),
+    ],
+)
+def test_format_txn_date_matches_strftime(value: datetime) -> None:
+    assert _format_txn_date(value) == value.strftime("%Y-%m-%d %H:%M")
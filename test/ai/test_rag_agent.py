@@ -28,11 +28,10 @@ async def test_rag_supervisor():
     print("TESTING HYBRID RAG SUPERVISOR AGENT")
     print("=" * 80 + "\n")
     
-    for i, query in enumerate(test_queries, 1):
-        print(f"\n{'─' * 80}")
-        print(f"TEST {i}: {query}")
-        print('─' * 80)
-        
+    # Queries are independent, so run them concurrently and print in order afterwards
+    semaphore = asyncio.Semaphore(3)
+    
+    async def run_query(query):
         # Create state
         state = {
             "messages": [HumanMessage(content=query)],
@@ -40,10 +39,18 @@ async def test_rag_supervisor():
             "user_id": "test_user",
             "session_id": "test_session"
         }
-
+        
         # Call RAG supervisor agent
-        result = await rag_agent(state)
-
+        async with semaphore:
+            return await rag_agent(state)
+    
+    results = await asyncio.gather(*(run_query(query) for query in test_queries))
+    
+    for i, (query, result) in enumerate(zip(test_queries, results), 1):
+        print(f"\n{'─' * 80}")
+        print(f"TEST {i}: {query}")
+        print('─' * 80)
+        
         # Get AI response
         ai_response = result["messages"][-1].content
 
@@ -1,7 +1,8 @@
 """Unit tests for RAGService context caching helpers."""
 from __future__ import annotations
 
-from collections import OrderedDict
+import hashlib
+from collections import OrderedDict, deque
 from typing import Any, Dict, List
 
 import pytest
@@ -17,14 +18,43 @@ class DummyDocument:
         self.metadata = metadata
 
 
-def build_service(documents: List[DummyDocument]) -> RAGService:
-    """Create a RAGService instance with a stubbed retrieve method."""
+class StubEmbeddings:
+    """Embeddings stub: fixed vectors for known queries, hash-derived ones otherwise."""
+
+    def __init__(self, vectors: Dict[str, List[float]] | None = None) -> None:
+        self.vectors = vectors or {}
+
+    def embed_query(self, text: str) -> List[float]:
+        if text in self.vectors:
+            return self.vectors[text]
+        return [byte - 127.5 for byte in hashlib.sha256(text.encode()).digest()]
+
+
+def build_bare_service(vectorstore: Any, embeddings: Any) -> RAGService:
+    """Create a RAGService without __init__, with every cache RAGService keeps."""
 
     service = RAGService.__new__(RAGService)
-    service.vectorstore = True
+    service.vectorstore = vectorstore
+    service.embeddings = embeddings
+    service.collection_name = "loan_products"
     service._context_cache = OrderedDict()
     service._cache_max_size = 8
     service._cache_ttl_seconds = 60
+    service._retrieval_cache = OrderedDict()
+    service._retrieval_cache_max_size = 8
+    service._embedding_cache = OrderedDict()
+    service._embedding_cache_max_size = 8
+    service._semantic_cache = deque(maxlen=8)
+    service._semantic_cache_threshold = 0.92
+    return service
+
+
+def build_service(
+    documents: List[DummyDocument], vectors: Dict[str, List[float]] | None = None
+) -> RAGService:
+    """Create a RAGService instance with a stubbed retrieve method."""
+
+    service = build_bare_service(True, StubEmbeddings(vectors))
 
     call_log: List[Dict[str, Any]] = []
 
@@ -60,3 +90,101 @@ def test_cache_key_includes_filter(monkeypatch: pytest.MonkeyPatch) -> None:
     service.get_context_for_query("Best schemes", k=2, filter={"scheme_type": "nps"})
 
     assert len(service._retrieve_calls) == 2  # type: ignore[attr-defined]
+
+
+def test_cache_key_ignores_filter_key_order() -> None:
+    documents = [
+        DummyDocument("Loan info chunk", {"source": "loan.pdf", "loan_type": "home_loan"}),
+    ]
+    service = build_service(documents)
+
+    service.get_context_for_query("Home loan", k=2, filter={"a": 1, "b": 2})
+    service.get_context_for_query("Home loan", k=2, filter={"b": 2, "a": 1})
+
+    assert len(service._retrieve_calls) == 1  # type: ignore[attr-defined]
+
+
+def test_semantic_cache_serves_paraphrases() -> None:
+    documents = [
+        DummyDocument("Loan info chunk", {"source": "loan.pdf", "loan_type": "home_loan"}),
+    ]
+    vectors = {
+        "home loan rate": [1.0, 0.0] + [0.0] * 30,
+        "interest on home loan": [0.99, 0.1] + [0.0] * 30,
+        "gold loan documents": [0.0, 1.0] + [0.0] * 30,
+    }
+    service = build_service(documents, vectors)
+
+    first = service.get_context_for_query("home loan rate", k=2)
+    paraphrase = service.get_context_for_query("interest on home loan", k=2)
+    service.get_context_for_query("gold loan documents", k=2)
+
+    assert paraphrase == first
+    assert len(service._retrieve_calls) == 2  # type: ignore[attr-defined]
+
+
+class CountingVectorStore:
+    """Vector store stub that records similarity searches by vector."""
+
+    def __init__(self, documents: List[DummyDocument]) -> None:
+        self.documents = documents
+        self.calls = 0
+
+    def similarity_search_by_vector(self, embedding: List[float], k: int = 4, filter: Dict[str, Any] | None = None):
+        self.calls += 1
+        return self.documents[:k]
+
+    def similarity_search_by_vector_with_relevance_scores(
+        self, embedding: List[float], k: int = 4, filter: Dict[str, Any] | None = None
+    ):
+        self.calls += 1
+        return [(doc, 0.1) for doc in self.documents[:k]]
+
+
+class CountingEmbeddings:
+    """Embeddings stub that records embed_query calls."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def embed_query(self, text: str) -> List[float]:
+        self.calls += 1
+        return [float(len(text))]
+
+
+def build_retrieval_service(documents: List[DummyDocument]) -> RAGService:
+    """Create a RAGService instance backed by a counting vector store."""
+
+    return build_bare_service(CountingVectorStore(documents), CountingEmbeddings())
+
+
+def test_retrieval_cache_hits_and_clears() -> None:
+    documents = [
+        DummyDocument("Home loan rates", {"source": "home.pdf", "loan_type": "home_loan"}),
+    ]
+    service = build_retrieval_service(documents)
+
+    first = service.retrieve("Home loan  interest", k=1)
+    second = service.retrieve("home loan interest", k=1)
+
+    assert [doc.page_content for doc in first] == [doc.page_content for doc in second]
+    assert service.vectorstore.calls == 1
+
+    service.clear_caches()
+    service.retrieve("home loan interest", k=1)
+
+    assert service.vectorstore.calls == 2
+
+
+def test_query_embedding_shared_across_search_variants() -> None:
+    documents = [
+        DummyDocument("Home loan rates", {"source": "home.pdf", "loan_type": "home_loan"}),
+    ]
+    service = build_retrieval_service(documents)
+
+    service.retrieve("home loan interest", k=1)
+    scored = service.retrieve_with_scores("Home loan interest", k=1)
+
+    assert scored[0][1] == 0.1
+    assert service.vectorstore.calls == 2
+    assert service.embeddings.calls == 1
@@ -13,6 +13,13 @@ sys.path.insert(0, str(repo_root / "backend"))
 
 from agents.agent_graph import process_message
 from agents.intent_classifier import classify_intent
+from agents.upi_agent import (
+    _ACCOUNT_SELECTION_RE,
+    _PAYMENT_RE,
+    _UPI_KEYWORD_RE,
+    _WAKE_UP_RE,
+    _prefilter_payment_details,
+)
 from langchain_core.messages import HumanMessage
 
 
@@ -146,6 +153,52 @@ async def test_process_message_without_upi_mode():
     return result.get('intent') == 'banking_operation'
 
 
+def test_inflected_payment_verbs_count_as_payment():
+    """Inflected verbs and brand names keep the message in the payment flow"""
+    for message in (
+        "hello vaani sending 500 to ramesh",
+        "hey upi paying 200 to priya",
+        "hello vaani transferring 1000",
+        "paytm 500 to ravi",
+    ):
+        assert _PAYMENT_RE.search(message), message
+
+
+def test_wake_up_phrase_with_payment_verb_is_not_wake_up_only():
+    """A wake-up phrase followed by an inflected verb is a payment command"""
+    message = "hello vaani sending 500 to ramesh"
+    is_wake_up_only = bool(_WAKE_UP_RE.search(message)) and not _PAYMENT_RE.search(message)
+    assert not is_wake_up_only
+
+
+def test_paying_from_account_is_not_account_selection():
+    """"paying from account 1234" goes to the payment flow, not account selection"""
+    message = "paying from account 1234"
+    assert _ACCOUNT_SELECTION_RE.search(message)
+    assert _PAYMENT_RE.search(message)
+
+
+def test_upi_keyword_variants():
+    """Hyphenated and handle forms of "upi" still activate UPI mode"""
+    for message in ("send to my upi-id", "pay ravi@upi", "यूपीआई से भेजें", "you pee payment"):
+        assert _UPI_KEYWORD_RE.search(message), message
+    assert not _PAYMENT_RE.search("repayment schedule for my loan")
+
+
+def test_prefilter_keeps_decimal_amounts():
+    """Bare decimal amounts keep their paise instead of being truncated"""
+    assert _prefilter_payment_details("₹250.50") == {"amount": 250.5}
+    assert _prefilter_payment_details("0.5") == {"amount": 0.5}
+
+
+def test_prefilter_confirmations():
+    """Only real confirmations skip the LLM; "please" and "है" alone do not"""
+    assert _prefilter_payment_details("yes, go ahead") == {}
+    assert _prefilter_payment_details("ठीक है") == {}
+    assert _prefilter_payment_details("please") is None
+    assert _prefilter_payment_details("है") is None
+
+
 async def run_all_tests():
     """Run all test cases"""
     print("=" * 60)